@@ -255,6 +255,9 @@ Use apply() method instead.\
             A tuple of output :class:`~chainer.Variable` objects.
 
         """
+        if configuration.config.autocast is not None:
+            inputs = chainer.mixed_precision._autocast_inputs(self, inputs)
+
         chainerx_in_data = None
         chainerx_device = None
         is_chainerx, in_data = _extract_apply_in_data(inputs)
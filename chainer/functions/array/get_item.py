@@ -65,7 +65,7 @@ class GetItemGrad(function_node.FunctionNode):
         gx = xp.zeros(self._in_shape, gy.dtype)
         if xp is numpy:
             try:
-                numpy.add.at(gx, slices, gy)
+                utils.array.add_at(gx, slices, gy)
             except IndexError:
                 done = False
                 # In numpy<1.13, 0-dim boolean index is not supported in
@@ -1,5 +1,4 @@
 import numpy
-import six
 
 import chainer
 from chainer import backend
@@ -38,7 +37,7 @@ class SelectItem(function_node.FunctionNode):
         if xp is numpy:
             # This code is equivalent to `t.choose(x.T)`, but `numpy.choose`
             # does not work when `x.shape[1] > 32`.
-            return x[six.moves.range(t.size), t],
+            return x[numpy.arange(t.size), t],
         else:
             y = cuda.elementwise(
                 'S t, raw T x',
@@ -70,7 +69,7 @@ class Assign(function_node.FunctionNode):
         t = backend.from_chx(self.t)  # Workaround for ChainerX.
 
         gx = numpy.zeros(self.shape, self.dtype)
-        gx[six.moves.range(self.t.size), t] = inputs[0]
+        gx[numpy.arange(t.size), t] = inputs[0]
         return gx,
 
     def forward_gpu(self, inputs):
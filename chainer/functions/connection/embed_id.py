@@ -1,5 +1,4 @@
 import numpy
-import six
 
 import chainer
 from chainer import backend
@@ -67,13 +66,13 @@ class EmbedIDGrad(function_node.FunctionNode):
         gW = xp.zeros(self.w_shape, dtype=gy.dtype)
 
         if xp is numpy:
-            # It is equivalent to `numpy.add.at(gW, x, gy)` but ufunc.at is
-            # too slow.
-            for ix, igy in six.moves.zip(x.ravel(),
-                                         gy.reshape(x.size, -1)):
-                if ix == self.ignore_label:
-                    continue
-                gW[ix] += igy
+            x = x.ravel()
+            gy = gy.reshape(x.size, -1)
+            if self.ignore_label is not None:
+                mask = x != self.ignore_label
+                x = x[mask]
+                gy = gy[mask]
+            utils.array.add_at(gW, x, gy)
         else:
             utils.nondeterministic('atomicAdd')
             if self.ignore_label is None:
@@ -216,11 +216,13 @@ class MultiprocessIterator(iterator.Iterator):
                                       self.current_position)
         epoch = serializer('epoch', self.epoch)
         is_new_epoch = serializer('is_new_epoch', self.is_new_epoch)
-        order = self._state.order.copy()
-        try:
-            serializer('order', order)
-        except KeyError:
-            serializer('_order', order)
+        order = self._state.order
+        if order is not None:
+            order = order.copy()
+            try:
+                serializer('order', order)
+            except KeyError:
+                serializer('_order', order)
         self._reset_state(current_position, epoch, is_new_epoch, order)
         try:
             self._previous_epoch_detail = serializer(
@@ -1,3 +1,4 @@
+import chainer
 from chainer.functions.connection import embed_id
 from chainer.initializers import normal
 from chainer import link
@@ -20,6 +21,13 @@ class EmbedID(link.Link):
             its ``ndim`` should be 2.
         ignore_label (int or None): If ``ignore_label`` is an int value,
             ``i``-th column of return value is filled with ``0``.
+        sparse_update (bool): If ``True``, the IDs given in the forward
+            computation are registered to the update rule of ``W`` (see
+            :meth:`~chainer.UpdateRule.add_sparse_rows`), so that the
+            optimizer only updates the rows of the IDs used in the
+            mini-batch. It must not be used if ``W`` is also used by other
+            computations, since the gradient from them to other rows is
+            ignored.
 
     .. seealso:: :func:`~chainer.functions.embed_id`
 
@@ -47,10 +55,13 @@ class EmbedID(link.Link):
     """
 
     ignore_label = None
+    sparse_update = False
 
-    def __init__(self, in_size, out_size, initialW=None, ignore_label=None):
+    def __init__(self, in_size, out_size, initialW=None, ignore_label=None,
+                 sparse_update=False):
         super(EmbedID, self).__init__()
         self.ignore_label = ignore_label
+        self.sparse_update = sparse_update
 
         with self.init_scope():
             if initialW is None:
@@ -67,4 +78,12 @@ class EmbedID(link.Link):
             ~chainer.Variable: Batch of corresponding embeddings.
 
         """
-        return embed_id.embed_id(x, self.W, ignore_label=self.ignore_label)
+        y = embed_id.embed_id(x, self.W, ignore_label=self.ignore_label)
+        update_rule = self.W.update_rule
+        if (self.sparse_update and update_rule is not None
+                and chainer.config.enable_backprop):
+            rows = variable.as_array(x)
+            if self.ignore_label is not None:
+                rows = rows[rows != self.ignore_label]
+            update_rule.add_sparse_rows(rows)
+        return y
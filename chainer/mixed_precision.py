@@ -0,0 +1,196 @@
+import numpy
+
+import chainer
+from chainer import backend
+from chainer import configuration
+from chainer import function_node
+from chainer.functions.activation import log_softmax
+from chainer.functions.activation import softmax
+from chainer.functions.array import cast
+from chainer.functions.connection import bilinear
+from chainer.functions.connection import convolution_2d
+from chainer.functions.connection import convolution_nd
+from chainer.functions.connection import deconvolution_2d
+from chainer.functions.connection import deconvolution_nd
+from chainer.functions.connection import linear
+from chainer.functions.loss import mean_squared_error
+from chainer.functions.loss import sigmoid_cross_entropy
+from chainer.functions.loss import softmax_cross_entropy
+from chainer.functions.loss import squared_error
+from chainer.functions.math import cumsum
+from chainer.functions.math import exponential
+from chainer.functions.math import logsumexp
+from chainer.functions.math import matmul
+from chainer.functions.math import prod
+from chainer.functions.math import sum as sum_module
+from chainer.functions.normalization import batch_normalization
+from chainer.functions.normalization import group_normalization
+from chainer.functions.normalization import l2_normalization
+from chainer.functions.normalization import layer_normalization
+
+
+allow_list = {
+    bilinear.BilinearFunction,
+    convolution_2d.Convolution2DFunction,
+    convolution_nd.ConvolutionND,
+    deconvolution_2d.Deconvolution2DFunction,
+    deconvolution_nd.DeconvolutionND,
+    linear.LinearFunction,
+    matmul.BatchMatMul,
+    matmul.MatMul,
+}
+"""Set of :class:`~chainer.FunctionNode` classes computed in low precision.
+
+Floating point inputs of these functions are cast to the low precision dtype
+in :func:`autocast` mode.
+
+"""
+
+deny_list = {
+    batch_normalization.BatchNormalization,
+    batch_normalization.FixedBatchNormalization,
+    cumsum.Cumsum,
+    exponential.Exp,
+    exponential.Log,
+    group_normalization.GroupNormalization,
+    l2_normalization.NormalizeL2,
+    layer_normalization.LayerNormalization,
+    log_softmax.LogSoftmax,
+    logsumexp.LogSumExp,
+    mean_squared_error.MeanSquaredError,
+    prod.Prod,
+    sigmoid_cross_entropy.SigmoidCrossEntropy,
+    softmax.Softmax,
+    softmax_cross_entropy.SoftmaxCrossEntropy,
+    squared_error.SquaredError,
+    sum_module.Sum,
+}
+"""Set of :class:`~chainer.FunctionNode` classes computed in float32.
+
+Low precision floating point inputs of these functions are cast to float32 in
+:func:`autocast` mode, since they are numerically sensitive.
+
+"""
+
+
+class _RoundToBFloat16(function_node.FunctionNode):
+
+    # Emulates bfloat16 by rounding float32 values to the nearest values
+    # representable in bfloat16. The gradient is passed through.
+
+    def forward(self, inputs):
+        x, = inputs
+        self._in_dtype = x.dtype
+        xp = backend.get_array_module(x)
+        bits = x.astype(numpy.float32).view(xp.uint32)
+        # Round half to even on the lower 16 bits of the mantissa.
+        bits = bits + (((bits >> 16) & 1) + 0x7FFF)
+        bits &= 0xFFFF0000
+        return bits.view(numpy.float32),
+
+    def backward(self, indexes, grad_outputs):
+        gy, = grad_outputs
+        return chainer.functions.cast(gy, self._in_dtype),
+
+
+def _is_bfloat16(dtype):
+    return isinstance(dtype, str) and dtype == 'bfloat16'
+
+
+def _get_autocast_dtype(dtype):
+    if dtype is None or _is_bfloat16(dtype):
+        return dtype
+    dtype = numpy.dtype(dtype)
+    if dtype.kind != 'f' or dtype.itemsize >= 4:
+        raise ValueError(
+            'autocast dtype must be float16 or \'bfloat16\': {}'.format(dtype))
+    return dtype
+
+
+def _is_float(x):
+    return x is not None and x.dtype.kind == 'f'
+
+
+def _to_low_precision(x, dtype):
+    if _is_bfloat16(dtype):
+        if x.dtype.itemsize < 4:
+            return x
+        return _RoundToBFloat16().apply((x,))[0]
+    return cast.cast(x, dtype)
+
+
+def _autocast_inputs(func, inputs):
+    # Casts the inputs of the function node according to the autocast policy.
+    dtype = configuration.config.autocast
+    func_type = type(func)
+    if func_type in allow_list:
+        return tuple([
+            _to_low_precision(x, dtype) if _is_float(x) else x
+            for x in inputs])
+
+    if func_type in deny_list:
+        return tuple([
+            cast.cast(x, numpy.float32)
+            if _is_float(x) and x.dtype.itemsize < 4 else x
+            for x in inputs])
+
+    # Other functions are computed in the widest dtype of the inputs.
+    dtypes = set([x.dtype for x in inputs if _is_float(x)])
+    if len(dtypes) < 2:
+        return inputs
+    to_dtype = max(dtypes, key=lambda d: d.itemsize)
+    return tuple([
+        cast.cast(x, to_dtype) if _is_float(x) and x.dtype != to_dtype else x
+        for x in inputs])
+
+
+def _optimizer_autocast(optimizer):
+    # Returns the context of the autocast mode of the optimizer, in which the
+    # loss functions are called by the optimizer and the updaters. The mode
+    # is not changed if the mixed precision of the optimizer is disabled.
+    dtype = getattr(optimizer, '_autocast', None)
+    if dtype is None:
+        dtype = configuration.config.autocast
+    return chainer.using_config('autocast', dtype)
+
+
+def autocast(dtype=numpy.float16):
+    """Enables automatic mixed precision in the forward computation.
+
+    In this context, floating point inputs of the functions in
+    :data:`allow_list` (e.g., matrix multiplications and convolutions) are
+    cast to ``dtype``, and inputs of the functions in :data:`deny_list` (e.g.,
+    softmax, normalizations and reductions) are cast to float32. The inputs of
+    other functions are cast to the widest floating point dtype among them if
+    they are mixed. Parameters are kept in float32, i.e., they act as the
+    master weights, and the casts are differentiable so that their gradients
+    are computed in float32.
+
+    The outputs of the functions in :data:`allow_list` and of the functions
+    following them are kept in low precision, which roughly halves the memory
+    used by the activations.
+
+    ``'bfloat16'`` can be given to emulate bfloat16 computation. In this case,
+    the inputs are rounded to bfloat16 precision while kept in float32, so the
+    memory usage is not reduced.
+
+    .. admonition:: Example
+
+        >>> model = L.Linear(3, 2)
+        >>> x = np.ones((1, 3), np.float32)
+        >>> with chainer.mixed_precision.autocast():
+        ...     y = model(x)
+        >>> y.dtype
+        dtype('float16')
+
+    Args:
+        dtype: Low precision floating point dtype. It must be ``float16`` or
+            ``'bfloat16'``.
+
+    Returns:
+        A context manager that enables the automatic mixed precision.
+
+    .. seealso:: :meth:`chainer.GradientMethod.use_mixed_precision`
+
+    """
+    return chainer.using_config('autocast', _get_autocast_dtype(dtype))
@@ -9,8 +9,10 @@ import six
 
 import chainer
 from chainer import backend
+from chainer.backends import cuda
 from chainer import link as link_module
 from chainer import optimizer_hooks
+from chainer.optimizer_hooks import gradient_clipping
 from chainer import serializer as serializer_module
 from chainer import variable
 import chainerx
@@ -110,9 +112,17 @@ class UpdateRule(object):
             :meth:`update` method does not update the parameter.
         hyperparam (Hyperparameter): Hyperparameter of the update rule.
         ~UpdateRule.t (int): Number of updates made by this update rule.
+        is_elementwise (bool): Flag to indicate that :meth:`update_core`
+            computes each element of the parameter and the state only from
+            the corresponding elements of the gradient, the parameter and the
+            state. Update rules with this flag can be applied to a
+            concatenation of several parameters at once (see
+            :meth:`GradientMethod.use_fused_update`).
 
     """
 
+    is_elementwise = False
+
     def __init__(self, parent_hyperparam=None):
         self._pre_update_hooks = collections.OrderedDict()
         self._post_update_hooks = collections.OrderedDict()
@@ -122,6 +132,7 @@ class UpdateRule(object):
         self.t = 0
         self._use_fp32_update = False
         self._fp32_param = None
+        self._sparse_rows = None
 
     @property
     def state(self):
@@ -188,12 +199,17 @@ class UpdateRule(object):
             param (~chainer.Variable): Variable to be updated.
 
         """
+        rows = self._sparse_rows
+        self._sparse_rows = None
         if not self.enabled:
             return
 
         self.t += 1
 
-        if self._use_fp32_update and param.dtype == numpy.float16:
+        if (rows is not None and not self._use_fp32_update
+                and self._can_update_rows(param)):
+            self._update_rows(param, rows)
+        elif self._use_fp32_update and param.dtype == numpy.float16:
             if self._fp32_param is None:
                 self._fp32_param = variable.Variable(
                     param.array.astype(numpy.float32),
@@ -224,6 +240,76 @@ class UpdateRule(object):
             for hook in six.itervalues(self._post_update_hooks):
                 hook(self, param)
 
+    def add_sparse_rows(self, rows):
+        """Registers the rows of the gradient that can be non-zero.
+
+        When rows are registered before :meth:`update`, an elementwise update
+        rule (see :attr:`is_elementwise`) only updates these rows of the
+        parameter and the state, which makes the update of a large embedding
+        matrix proportional to the number of rows used in the mini-batch.
+        The other rows are left as is even if the update rule would change
+        them with a zero gradient (e.g., by momentum), i.e., the update is
+        *lazy*. The registered rows are cleared by :meth:`update`.
+        Duplicated rows are merged on registration, so the registered rows
+        never outnumber the rows of the parameter even if the forward
+        computation runs many times without :meth:`update` (e.g., in an
+        evaluation loop with backprop enabled).
+
+        The update falls back to the dense one if the update rule has hooks,
+        uses fp32 update or the arrays are not NumPy/CuPy arrays.
+
+        Args:
+            rows (:ref:`ndarray`): Integer array of row indices of the
+                parameter. It may contain duplicated indices.
+
+        """
+        device = backend.get_device_from_array(rows)
+        xp = device.xp
+        if xp is chainerx:
+            # The sparse update is not supported for ChainerX arrays.
+            return
+        with chainer.using_device(device):
+            rows = rows.ravel()
+            if self._sparse_rows is not None:
+                rows = xp.concatenate((device.send(self._sparse_rows), rows))
+            self._sparse_rows = xp.unique(rows)
+
+    def _can_update_rows(self, param):
+        if (not self.is_elementwise or self._pre_update_hooks
+                or self._post_update_hooks):
+            return False
+        array = param.array
+        xp = param.device.xp
+        if (array is None or array.ndim == 0 or xp is chainerx
+                or not isinstance(array, xp.ndarray)
+                or not isinstance(param.grad, xp.ndarray)):
+            return False
+        self._prepare(param)
+        return all(isinstance(value, xp.ndarray) and value.shape == array.shape
+                   for value in six.itervalues(self.state))
+
+    def _update_rows(self, param, rows):
+        device = param.device
+        with chainer.using_device(device):
+            rows = device.send(rows)
+            row_param = variable.Variable(param.array[rows], name=param.name)
+            row_grad = param.grad[rows]
+            if param._loss_scale is not None:
+                row_grad /= param._loss_scale
+            row_param._set_grad_without_check(row_grad)
+
+            state = self._state
+            self._state = {
+                name: value[rows] for name, value in six.iteritems(state)}
+            try:
+                self.update_core(row_param)
+                row_state = self._state
+            finally:
+                self._state = state
+            param.array[rows] = row_param.array
+            for name, value in six.iteritems(row_state):
+                state[name][rows] = value
+
     def update_core(self, param):
         """Updates the parameter.
 
@@ -744,6 +830,8 @@ class GradientMethod(Optimizer):
         super(GradientMethod, self).__init__()
         self.hyperparam = Hyperparameter()
         self._use_fp32_update = False
+        self._fused_update = None
+        self._autocast = None
 
     def setup(self, link):
         super(GradientMethod, self).setup(link)
@@ -797,7 +885,8 @@ class GradientMethod(Optimizer):
         """
         if lossfun is not None:
             use_cleargrads = getattr(self, '_use_cleargrads', True)
-            loss = lossfun(*args, **kwds)
+            with chainer.mixed_precision._optimizer_autocast(self):
+                loss = lossfun(*args, **kwds)
             if use_cleargrads:
                 self.target.cleargrads()
             else:
@@ -807,12 +896,19 @@ class GradientMethod(Optimizer):
 
         self.reallocate_cleared_grads()
         self.check_nan_in_grads()
-        self.call_hooks('pre')
+        fused_update = self._fused_update
+        hooks = self._pre_update_hooks
+        fold_hooks = fused_update is not None and fused_update.can_fold(hooks)
+        if not fold_hooks:
+            self.call_hooks('pre')
 
         self.t += 1
         if self.is_safe_to_update():
-            for param in self.target.params():
-                param.update()
+            if fused_update is not None:
+                fused_update.update(self.target, hooks if fold_hooks else None)
+            else:
+                for param in self.target.params():
+                    param.update()
 
         self.reallocate_cleared_grads()
 
@@ -863,6 +959,346 @@ class GradientMethod(Optimizer):
             for param in link.params():
                 param.update_rule.use_fp32_update()
 
+    def use_mixed_precision(self, dtype=numpy.float16, interval=1000,
+                            scale=None):
+        """Enables automatic mixed precision training.
+
+        When it is enabled, the loss function given to :meth:`update` is
+        called in the :func:`chainer.mixed_precision.autocast` mode, as well
+        as the loss functions called by the updaters of
+        :mod:`chainer.training.updaters` for this optimizer, e.g., with
+        gradient accumulation. The loss scaling is configured by
+        :meth:`loss_scaling` so that small gradients of low precision
+        activations do not underflow. The parameters are kept in float32 and
+        updated by the float32 gradients.
+
+        Args:
+            dtype: Low precision floating point dtype (``float16`` or
+                ``'bfloat16'``). If ``None``, the automatic mixed precision is
+                disabled.
+            interval (int): Number of iterations until the scaling factor of
+                the dynamic loss scaling gets doubled.
+            scale (float): Loss scaling factor. If ``None``, the dynamic loss
+                scaling is used.
+
+        """
+        self._autocast = chainer.mixed_precision._get_autocast_dtype(dtype)
+        if self._autocast is not None:
+            self.loss_scaling(interval, scale)
+
+    def use_fused_update(self, flag=True):
+        """Enables or disables the fused update of parameters.
+
+        When it is enabled, parameters of the same data type on the same
+        device are packed into one contiguous array, and each parameter array
+        is replaced by a view of it. The states of the update rules are packed
+        in the same way. The update rule is then applied once to the whole
+        packed array instead of once for each parameter, which reduces the
+        number of array operations (or kernel launches) of each update.
+
+        Only parameters whose update rules are elementwise (see
+        :attr:`UpdateRule.is_elementwise`), enabled, have no hooks, do not use
+        fp32 update and do not override any hyperparameter are packed. The
+        other parameters are updated one by one as usual. The packed arrays
+        are rebuilt automatically when a parameter array or a state array is
+        replaced (e.g., by :meth:`~chainer.Link.to_device`).
+
+        If all the ``'pre'`` hooks of the optimizer are
+        :class:`~chainer.optimizer_hooks.GradientClipping`,
+        :class:`~chainer.optimizer_hooks.WeightDecay` or
+        :class:`~chainer.optimizer_hooks.Lasso` (with gradient clipping placed
+        before the others), the hooks are not called. Instead, the global norm
+        is computed from the packed gradients, and the hooks and the loss
+        scaling are applied to the packed gradients in a single pass. In this
+        case, :attr:`~chainer.Variable.grad` of each parameter is left
+        unmodified.
+
+        Args:
+            flag (bool): If ``True``, the fused update is enabled.
+
+        """
+        self._fused_update = _FusedUpdate() if flag else None
+
+
+def _is_fusable(param):
+    rule = param.update_rule
+    if (rule is None or not rule.is_elementwise or not rule.enabled
+            or rule._pre_update_hooks or rule._post_update_hooks
+            or rule._use_fp32_update or rule._sparse_rows is not None):
+        return False
+    # Only rules that use the hyperparameters of the parent as is can share
+    # a single set of hyperparameters.
+    if len(rule.hyperparam.__dict__) != 1:
+        return False
+    array = param.array
+    if array is None:
+        return False
+    xp = param.device.xp
+    return xp is not chainerx and isinstance(array, xp.ndarray)
+
+
+class _FusedUpdateGroup(object):
+
+    # Parameters packed into contiguous arrays and updated at once.
+
+    def __init__(self, params):
+        param = params[0]
+        device = param.device
+        xp = device.xp
+        self.params = params
+        self.rules = [param.update_rule for param in params]
+        self.device = device
+
+        offsets = numpy.cumsum([0] + [param.size for param in params])
+        slices = [slice(int(begin), int(end))
+                  for begin, end in zip(offsets[:-1], offsets[1:])]
+        with chainer.using_device(device):
+            flat = xp.empty((int(offsets[-1]),), dtype=param.dtype)
+            views = []
+            for param, s in zip(params, slices):
+                view = flat[s].reshape(param.shape)
+                view[...] = param.array
+                param.array = view
+                views.append(view)
+
+            # The update rule of the first parameter is copied so that it
+            # shares the hyperparameter (and thus follows its changes).
+            rule = copy.copy(self.rules[0])
+            rule._state = None
+            rule._fp32_param = None
+            self.flat_param = variable.Variable(flat)
+            rule._prepare(self.flat_param)
+            self.rule = rule
+
+            keys = sorted(rule.state)
+            self.valid = all(
+                isinstance(rule.state[key], xp.ndarray)
+                and rule.state[key].shape == flat.shape for key in keys)
+            self.entries = []
+            for param, param_rule, view, s in zip(
+                    params, self.rules, views, slices):
+                old_state = param_rule.state or {}
+                state = {}
+                for key in keys:
+                    state_view = rule.state[key][s].reshape(param.shape)
+                    if self.valid and key in old_state:
+                        state_view[...] = device.send(old_state[key])
+                    state[key] = state_view
+                if self.valid:
+                    param_rule._state = state
+                self.entries.append((
+                    param, param_rule, view, state,
+                    tuple(state[key] for key in keys)))
+            self.keys = keys
+
+    def is_valid(self):
+        t = self.rules[0].t
+        keys = self.keys
+        for param, rule, view, state, state_views in self.entries:
+            if (param.array is not view or param.update_rule is not rule
+                    or rule.t != t or rule.state is not state
+                    or not _is_fusable(param)):
+                return False
+            for key, state_view in zip(keys, state_views):
+                if state.get(key) is not state_view:
+                    return False
+        return True
+
+    def gather_grads(self):
+        # Packs the gradients into a new array, which can be modified in
+        # place. Returns ``None`` if some gradients are missing.
+        grads = [param.grad for param in self.params]
+        if any(grad is None for grad in grads):
+            self.flat_grad = None
+        else:
+            with chainer.using_device(self.device):
+                self.flat_grad = self.device.xp.concatenate(
+                    [grad.ravel() for grad in grads])
+        return self.flat_grad
+
+    def update(self, scale=1, decay=0, lasso=0):
+        params = self.params
+        flat_grad = self.flat_grad
+        self.flat_grad = None
+        if flat_grad is None:
+            # The states are shared, so the parameters can also be updated
+            # one by one.
+            for param in params:
+                if param.grad is not None:
+                    _transform_grad(
+                        param.grad, param.array, scale, decay, lasso)
+                param.update()
+            return
+
+        with chainer.using_device(self.device):
+            flat_param = self.flat_param
+            _transform_grad(flat_grad, flat_param.array, scale, decay, lasso,
+                            params[0]._loss_scale)
+            flat_param._set_grad_without_check(flat_grad)
+            rule = self.rule
+            rule.t = self.rules[0].t + 1
+            rule.update_core(flat_param)
+            flat_param._set_grad_without_check(None)
+        for param_rule in self.rules:
+            param_rule.t += 1
+
+
+def _fold_hooks(hooks):
+    # Converts optimizer hooks into a sequence of gradient transforms that can
+    # be applied in a single pass. Returns ``None`` if any of the hooks cannot
+    # be folded.
+    steps = []
+    for hook in six.itervalues(hooks):
+        if type(hook) is optimizer_hooks.GradientClipping:
+            # The norm must be computed from the raw gradients.
+            if steps and steps[-1][0] != 'clip':
+                return None
+            steps.append(('clip', hook))
+        elif type(hook) is optimizer_hooks.WeightDecay:
+            steps.append(('decay', hook))
+        elif type(hook) is optimizer_hooks.Lasso:
+            steps.append(('lasso', hook))
+        else:
+            return None
+    return steps
+
+
+def _transform_grad(grad, param, scale, decay, lasso, loss_scale=None):
+    # Computes ``(scale * grad + decay * param + lasso * sign(param)) /
+    # loss_scale`` in place.
+    if loss_scale is not None:
+        scale = scale / loss_scale
+        decay = decay / loss_scale
+        lasso = lasso / loss_scale
+    if isinstance(grad, numpy.ndarray):
+        if not (isinstance(scale, (int, float)) and scale == 1):
+            grad *= scale
+        if decay != 0:
+            grad += decay * param
+        if lasso != 0:
+            grad += lasso * numpy.sign(param)
+        return
+    if isinstance(scale, (int, float)) and scale == 1 and decay == 0 and (
+            lasso == 0):
+        return
+    _transform_grad_kernel()(param, scale, decay, lasso, grad)
+
+
+def _transform_grad_kernel():
+    return cuda.elementwise(
+        'T p, S scale, T decay, T lasso', 'T g',
+        '''g = static_cast<T>(scale) * g + decay * p
+              + lasso * static_cast<T>((p > 0) - (p < 0));''',
+        'transform_grad')
+
+
+class _FusedUpdate(object):
+
+    # Packs the parameters of a link into groups and updates each group with a
+    # single application of the update rule.
+
+    def __init__(self):
+        self._param_ids = None
+        self._groups = []
+        self._others = []
+        self._others_fusable = []
+
+    def can_fold(self, hooks):
+        return _fold_hooks(hooks) is not None
+
+    def update(self, link, hooks=None):
+        params = list(link.params())
+        if not self._is_valid(params):
+            self._build(params)
+        steps = _fold_hooks(hooks) if hooks else None
+        if not steps:
+            for group in self._groups:
+                group.gather_grads()
+                group.update()
+            for param in self._others:
+                param.update()
+            return
+
+        for group in self._groups:
+            group.gather_grads()
+        scale = 1
+        decay = 0
+        lasso = 0
+        sqnorm = None
+        for kind, hook in steps:
+            if kind == 'clip':
+                if sqnorm is None:
+                    sqnorm = self._sum_sqnorm()
+                rate = gradient_clipping._get_rate(
+                    sqnorm * scale * scale, hook.threshold)
+                if rate is not None:
+                    scale = scale * rate
+            elif kind == 'decay':
+                decay += hook.rate
+            else:
+                lasso += hook.rate
+
+        for group in self._groups:
+            group.update(scale, decay, lasso)
+        for param in self._others:
+            if param.grad is not None and param.array is not None:
+                with chainer.using_device(param.device):
+                    _transform_grad(
+                        param.grad, param.array, scale, decay, lasso)
+            param.update()
+
+    def _sum_sqnorm(self):
+        # The packed gradients are reduced at once.
+        grads = []
+        for group in self._groups:
+            if group.flat_grad is not None:
+                grads.append(group.flat_grad)
+            else:
+                grads.extend(param.grad for param in group.params
+                             if param.grad is not None)
+        grads.extend(param.grad for param in self._others
+                     if param.grad is not None and param.array is not None)
+        return gradient_clipping._sum_sqnorm(grads)
+
+    def _is_valid(self, params):
+        if self._param_ids != [id(param) for param in params]:
+            return False
+        for param, fusable in zip(self._others, self._others_fusable):
+            if _is_fusable(param) != fusable:
+                return False
+        return all(group.is_valid() for group in self._groups)
+
+    def _build(self, params):
+        candidates = []
+        others = []
+        for param in params:
+            if _is_fusable(param):
+                rule = param.update_rule
+                key = (type(rule), id(rule.hyperparam.parent), rule.t,
+                       param.dtype)
+                for group_key, device, group_params in candidates:
+                    if group_key == key and device == param.device:
+                        group_params.append(param)
+                        break
+                else:
+                    candidates.append((key, param.device, [param]))
+            else:
+                others.append(param)
+
+        groups = []
+        for _, _, group_params in candidates:
+            if len(group_params) > 1:
+                group = _FusedUpdateGroup(group_params)
+                if group.valid:
+                    groups.append(group)
+                    continue
+            others.extend(group_params)
+
+        self._param_ids = [id(param) for param in params]
+        self._groups = groups
+        self._others = others
+        self._others_fusable = [_is_fusable(param) for param in others]
+
 
 class HyperparameterProxy(object):
 
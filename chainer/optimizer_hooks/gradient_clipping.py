@@ -21,6 +21,20 @@ def _sum_sqnorm(arr):
         return sum([float(i) for i in six.itervalues(sq_sum)])
 
 
+def _get_rate(sqnorm, threshold):
+    # Returns the scale of gradients, or ``None`` if no clipping is needed.
+    with cuda.get_device_from_array(sqnorm) as dev:
+        norm = backend.get_array_module(sqnorm).sqrt(sqnorm)
+        rate = threshold / norm
+        # When no clipping is needed, skip the clipping on CPU and
+        # multiply 1.0 on the device otherwise.
+        if int(dev) == -1:
+            if rate >= 1:
+                return None
+            return rate
+        return rate.clip(None, 1)
+
+
 class GradientClipping(object):
     """Optimizer hook function for gradient clipping.
 
@@ -51,16 +65,9 @@ class GradientClipping(object):
 
     def __call__(self, opt):
         sqnorm = _sum_sqnorm([p.grad for p in opt.target.params(False)])
-        with cuda.get_device_from_array(sqnorm) as dev:
-            norm = backend.get_array_module(sqnorm).sqrt(sqnorm)
-            rate = self.threshold / norm
-            # When no clipping is needed, skip the clipping on CPU and
-            # multiply 1.0 on the device otherwise.
-            if int(dev) == -1:
-                if rate >= 1:
-                    return
-            else:
-                rate = rate.clip(None, 1)
+        rate = _get_rate(sqnorm, self.threshold)
+        if rate is None:
+            return
         for param in opt.target.params(False):
             grad = param.grad
             with cuda.get_device_from_array(grad):
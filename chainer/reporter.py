@@ -251,6 +251,10 @@ def report_scope(observation):
     current.observation = old
 
 
+# Number of pending values after which a deferred Summary reduces them.
+_DEFERRED_FLUSH_SIZE = 1024
+
+
 def _get_device(x):
     if numpy.isscalar(x):
         return cuda.DummyDevice
@@ -264,12 +268,23 @@ class Summary(object):
 
     Summary computes the statistics of given scalars online.
 
+    If ``deferred`` is ``True``, arrays added with the default weight are not
+    accumulated immediately. They are kept on their own devices and reduced
+    together when the statistics are requested (or when enough of them are
+    pending), which avoids launching small operations and synchronizing the
+    device on every call of :meth:`add`.
+
+    Args:
+        deferred (bool): If ``True``, the accumulation of arrays is deferred.
+
     """
 
-    def __init__(self):
+    def __init__(self, deferred=False):
         self._x = 0.0
         self._x2 = 0.0
         self._n = 0
+        self._deferred = deferred
+        self._pending = {}
 
     def add(self, value, weight=1):
         """Adds a scalar value.
@@ -287,13 +302,35 @@ class Summary(object):
             # connected to the backprop graph.
             value = value.as_grad_stopped()
 
+        if (self._deferred and type(weight) is int and weight == 1
+                and not numpy.isscalar(value)):
+            key = type(value), getattr(value, 'device', None)
+            pending = self._pending.setdefault(key, [])
+            pending.append(value)
+            if len(pending) >= _DEFERRED_FLUSH_SIZE:
+                self._flush()
+            return
+
         with _get_device(value):
             self._x += weight * value
             self._x2 += weight * value * value
             self._n += weight
 
+    def _flush(self):
+        # Reduces the pending arrays of each device at once.
+        for values in six.itervalues(self._pending):
+            xp = backend.get_array_module(values[0])
+            with _get_device(values[0]):
+                x = xp.stack(values)
+                self._x += x.sum()
+                self._x2 += (x * x).sum()
+                self._n += len(values)
+        self._pending = {}
+
     def compute_mean(self):
         """Computes the mean."""
+        if self._pending:
+            self._flush()
         x, n = self._x, self._n
         with _get_device(x):
             return x / n
@@ -305,6 +342,8 @@ class Summary(object):
             tuple: Mean and standard deviation values.
 
         """
+        if self._pending:
+            self._flush()
         x, n = self._x, self._n
         xp = backend.get_array_module(x)
         with _get_device(x):
@@ -314,6 +353,8 @@ class Summary(object):
             return mean, std
 
     def serialize(self, serializer):
+        if self._pending:
+            self._flush()
         try:
             self._x = serializer('_x', self._x)
             self._x2 = serializer('_x2', self._x2)
@@ -330,10 +371,18 @@ class DictSummary(object):
     It only computes the statistics for scalar values and variables of scalar
     values in the dictionaries.
 
+    Args:
+        deferred (bool): If ``True``, the accumulation of arrays is deferred
+            until the statistics are requested. See :class:`Summary`.
+
     """
 
-    def __init__(self):
-        self._summaries = collections.defaultdict(Summary)
+    def __init__(self, deferred=False):
+        self._deferred = deferred
+        self._summaries = collections.defaultdict(self._make_summary)
+
+    def _make_summary(self):
+        return Summary(deferred=self._deferred)
 
     def add(self, d):
         """Adds a dictionary of scalars.
@@ -411,3 +460,32 @@ class DictSummary(object):
             for index, name in enumerate(names):
                 self._summaries[name].serialize(
                     serializer['_summaries'][str(index)])
+
+
+def _to_cpu_scalars(values):
+    """Converts a dictionary of scalars to a dictionary of Python floats.
+
+    Device arrays are gathered per device and transferred to the host at once,
+    so that only one synchronization happens for each device.
+
+    """
+    result = {}
+    groups = collections.OrderedDict()
+    for name, value in six.iteritems(values):
+        if isinstance(value, variable.Variable):
+            value = value.array
+        if numpy.isscalar(value) or isinstance(value, numpy.ndarray):
+            result[name] = float(value)
+        else:
+            key = type(value), getattr(value, 'device', None)
+            groups.setdefault(key, []).append((name, value))
+
+    for group in six.itervalues(groups):
+        names = [name for name, _ in group]
+        arrays = [value for _, value in group]
+        xp = backend.get_array_module(arrays[0])
+        with _get_device(arrays[0]):
+            stacked = xp.stack([a.astype(numpy.float64) for a in arrays])
+        stacked = backend.CpuDevice().send(stacked)
+        result.update(zip(names, stacked.tolist()))
+    return result
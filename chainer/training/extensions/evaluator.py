@@ -1,8 +1,11 @@
+import collections
 import copy
+import multiprocessing
 import warnings
 
 import six
 
+import chainer
 from chainer import backend
 from chainer import configuration
 from chainer.dataset import convert
@@ -12,6 +15,7 @@ from chainer import iterators
 from chainer import link
 from chainer import reporter as reporter_module
 from chainer.training import extension
+from chainer import variable
 
 
 class Evaluator(extension.Extension):
@@ -48,6 +52,21 @@ class Evaluator(extension.Extension):
 
     This extension is called at the end of each epoch by default.
 
+    The evaluation can be sharded in two ways. If ``devices`` is given, the
+    main target is copied to each of the devices, and each batch is split
+    equally between the copies; the parameters of the copies are synchronized
+    with the main target at the beginning of each evaluation. The forward
+    computations of all the shards of a batch are launched before their
+    reported values are copied to the host, so that the devices evaluate the
+    shards in parallel. The values reported for the shards of a batch are
+    weighted by the sizes of the shards, so that the means are the same as
+    those of the whole batch. If ``n_processes`` is given, the batches are
+    evaluated on the CPU by forked worker processes in parallel, and the
+    reported values are streamed back to be accumulated as soon as each
+    batch is done. The worker processes are forked at every evaluation so
+    that they hold the current state of the target, which costs the time of
+    forking ``n_processes`` processes per evaluation.
+
     Args:
         iterator: Dataset iterator for the validation dataset. It can also be
             a dictionary of iterators. If this is just an iterator, the
@@ -63,6 +82,13 @@ class Evaluator(extension.Extension):
             object is passed at each call.
         eval_func: Evaluation function called at each iteration. The target
             link to evaluate as a callable is used by default.
+        devices: List of devices to which the main target is copied and the
+            validation data is sent. It cannot be used together with
+            ``device``, ``eval_func`` or ``n_processes``.
+        n_processes (int): Number of worker processes to evaluate batches on
+            the CPU. The worker processes are created by ``fork``, so this
+            option is only available on platforms that support it. It cannot
+            be used together with ``device`` or ``devices``.
 
     Attributes:
         converter: Converter function.
@@ -78,7 +104,23 @@ class Evaluator(extension.Extension):
     name = None
 
     def __init__(self, iterator, target, converter=convert.concat_examples,
-                 device=None, eval_hook=None, eval_func=None):
+                 device=None, eval_hook=None, eval_func=None, devices=None,
+                 n_processes=None):
+        if devices is not None:
+            if device is not None:
+                raise ValueError('device and devices cannot be both given')
+            if eval_func is not None:
+                raise ValueError('eval_func and devices cannot be both given')
+            if n_processes is not None:
+                raise ValueError(
+                    'devices and n_processes cannot be both given')
+        if n_processes is not None:
+            if device is not None:
+                raise ValueError(
+                    'device and n_processes cannot be both given')
+            if n_processes < 1:
+                raise ValueError('n_processes must be a positive integer')
+
         if device is not None:
             device = backend.get_device(device)
 
@@ -94,6 +136,16 @@ class Evaluator(extension.Extension):
         self.device = device
         self.eval_hook = eval_hook
         self.eval_func = eval_func
+        self._n_processes = n_processes
+
+        self._target_copies = []
+        if devices is not None:
+            main = self._targets['main']
+            for d in devices:
+                d = backend.get_device(d)
+                target_copy = copy.deepcopy(main)
+                target_copy.to_device(d)
+                self._target_copies.append((target_copy, d))
 
         for key, iter in six.iteritems(iterator):
             if (isinstance(iter, (iterators.SerialIterator,
@@ -155,6 +207,11 @@ class Evaluator(extension.Extension):
             reporter.add_observer(prefix + name, target)
             reporter.add_observers(prefix + name,
                                    target.namedlinks(skipself=True))
+        for target, _ in self._target_copies:
+            # Copies of the main target report as the main target.
+            reporter.add_observer(prefix + 'main', target)
+            reporter.add_observers(prefix + 'main',
+                                   target.namedlinks(skipself=True))
 
         with reporter:
             with configuration.using_config('train', False):
@@ -209,23 +266,83 @@ class Evaluator(extension.Extension):
 
         summary = reporter_module.DictSummary()
 
-        for batch in it:
-            observation = {}
-            with reporter_module.report_scope(observation):
-                in_arrays = convert._call_converter(
-                    self.converter, batch, self.device)
-                with function.no_backprop_mode():
-                    if isinstance(in_arrays, tuple):
-                        eval_func(*in_arrays)
-                    elif isinstance(in_arrays, dict):
-                        eval_func(**in_arrays)
-                    else:
-                        eval_func(in_arrays)
-
-            summary.add(observation)
+        # The number of the evaluated batches is kept for the evaluators
+        # which reduce the results of multiple evaluations, e.g., that of
+        # ChainerMN.
+        n_batches = 0
+        if self._n_processes is not None:
+            n_batches = self._evaluate_in_processes(it, eval_func, summary)
+        elif self._target_copies:
+            main = self._targets['main']
+            n = len(self._target_copies)
+            for target, _ in self._target_copies:
+                target.copyparams(main)
+            for batch in it:
+                n_batches += 1
+                observations = []
+                for i, (target, device) in enumerate(self._target_copies):
+                    shard = batch[i::n]
+                    if len(shard) == 0:
+                        continue
+                    observation = self._evaluate_batch(shard, target, device)
+                    observations.append(
+                        (observation, float(len(shard)) / len(batch)))
+                # The reported values are copied to the host only after the
+                # computations on all the devices are launched.
+                for observation, weight in observations:
+                    summary.add(_weight_observation(
+                        _observation_to_cpu(observation), weight))
+        else:
+            for batch in it:
+                n_batches += 1
+                summary.add(
+                    self._evaluate_batch(batch, eval_func, self.device))
+        self._n_batches = n_batches
 
         return summary.compute_mean()
 
+    def _evaluate_batch(self, batch, eval_func, device):
+        # Input arrays are released on return, so that their memory can be
+        # reused for the next batch.
+        observation = {}
+        with reporter_module.report_scope(observation):
+            in_arrays = convert._call_converter(self.converter, batch, device)
+            with function.no_backprop_mode():
+                if isinstance(in_arrays, tuple):
+                    eval_func(*in_arrays)
+                elif isinstance(in_arrays, dict):
+                    eval_func(**in_arrays)
+                else:
+                    eval_func(in_arrays)
+        return observation
+
+    def _evaluate_in_processes(self, it, eval_func, summary):
+        n_processes = self._n_processes
+        if hasattr(multiprocessing, 'get_context'):
+            context = multiprocessing.get_context('fork')
+        else:
+            context = multiprocessing
+        # The workers inherit the current reporter and the targets by fork.
+        pool = context.Pool(
+            processes=n_processes,
+            initializer=_evaluate_setup,
+            initargs=(reporter_module.get_current_reporter(), eval_func,
+                      self.converter))
+        n_batches = 0
+        try:
+            pending = collections.deque()
+            for batch in it:
+                n_batches += 1
+                pending.append(pool.apply_async(_evaluate_run, (batch,)))
+                if len(pending) >= 2 * n_processes:
+                    summary.add(pending.popleft().get())
+            while pending:
+                summary.add(pending.popleft().get())
+        finally:
+            pool.terminate()
+            pool.join()
+        return n_batches
+
     def finalize(self):
         """Finalizes the evaluator object.
 
@@ -236,3 +353,69 @@ class Evaluator(extension.Extension):
         """
         for iterator in six.itervalues(self._iterators):
             iterator.finalize()
+
+
+_evaluate_reporter = None
+_evaluate_func = None
+_evaluate_converter = None
+
+
+def _evaluate_setup(reporter, eval_func, converter):
+    global _evaluate_reporter, _evaluate_func, _evaluate_converter
+    _evaluate_reporter = reporter
+    _evaluate_func = eval_func
+    _evaluate_converter = converter
+
+
+def _evaluate_run(batch):
+    observation = {}
+    with _evaluate_reporter.scope(observation):
+        with configuration.using_config('train', False):
+            in_arrays = convert._call_converter(
+                _evaluate_converter, batch, None)
+            with function.no_backprop_mode():
+                if isinstance(in_arrays, tuple):
+                    _evaluate_func(*in_arrays)
+                elif isinstance(in_arrays, dict):
+                    _evaluate_func(**in_arrays)
+                else:
+                    _evaluate_func(in_arrays)
+    return {key: _unwrap_variable(value)
+            for key, value in six.iteritems(observation)}
+
+
+def _weight_observation(observation, weight):
+    # Multiplies the weights of the values, which are given as the second
+    # elements of tuples, as DictSummary accepts.
+    weighted = {}
+    for key, value in six.iteritems(observation):
+        if isinstance(value, tuple):
+            value, w = value
+            if isinstance(w, variable.Variable):
+                w = w.array
+            weighted[key] = value, w * weight
+        else:
+            weighted[key] = value, weight
+    return weighted
+
+
+def _observation_to_cpu(observation):
+    return {key: _value_to_cpu(value)
+            for key, value in six.iteritems(observation)}
+
+
+def _value_to_cpu(value):
+    if isinstance(value, tuple):
+        return tuple(_value_to_cpu(v) for v in value)
+    value = _unwrap_variable(value)
+    if isinstance(value, chainer.get_array_types()):
+        return backend.CpuDevice().send(value)
+    return value
+
+
+def _unwrap_variable(value):
+    if isinstance(value, tuple):
+        return tuple(_unwrap_variable(v) for v in value)
+    if isinstance(value, variable.Variable):
+        return value.array
+    return value
@@ -3,8 +3,6 @@ import os
 import shutil
 import warnings
 
-import six
-
 from chainer import reporter
 from chainer import serializer as serializer_module
 from chainer.training import extension
@@ -16,7 +14,8 @@ from chainer.utils import argument
 class LogReport(extension.Extension):
 
     """__init__(\
-        keys=None, trigger=(1, 'epoch'), postprocess=None, filename='log')
+        keys=None, trigger=(1, 'epoch'), postprocess=None, filename='log',\
+        deferred=False)
 
     Trainer extension to output the accumulated results to a log file.
 
@@ -58,12 +57,17 @@ class LogReport(extension.Extension):
             does not output the log to any file.
             For historical reasons ``log_name`` is also accepted as an alias
             of this argument.
+        deferred (bool): If ``True``, reported arrays are kept on their
+            devices and summarized only when the result is output, instead of
+            being accumulated at every iteration. See
+            :class:`~chainer.Summary`.
 
     """
 
     def __init__(self, keys=None, trigger=(1, 'epoch'), postprocess=None,
-                 filename=None, **kwargs):
+                 filename=None, deferred=False, **kwargs):
         self._keys = keys
+        self._deferred = deferred
         self._trigger = trigger_module.get_trigger(trigger)
         self._postprocess = postprocess
         self._log = []
@@ -92,9 +96,7 @@ class LogReport(extension.Extension):
         if self._trigger(trainer):
             # output the result
             stats = self._summary.compute_mean()
-            stats_cpu = {}
-            for name, value in six.iteritems(stats):
-                stats_cpu[name] = float(value)  # copy to CPU
+            stats_cpu = reporter._to_cpu_scalars(stats)  # copy to CPU
 
             updater = trainer.updater
             stats_cpu['epoch'] = updater.epoch
@@ -144,4 +146,4 @@ class LogReport(extension.Extension):
             self._log = json.loads(log)
 
     def _init_summary(self):
-        self._summary = reporter.DictSummary()
+        self._summary = reporter.DictSummary(deferred=self._deferred)
@@ -3,7 +3,6 @@ from os import path
 import warnings
 
 import numpy
-import six
 
 from chainer import reporter
 from chainer import serializer as serializer_module
@@ -152,9 +151,7 @@ class PlotReport(extension.Extension):
 
         if self._trigger(trainer):
             stats = self._summary.compute_mean()
-            stats_cpu = {}
-            for name, value in six.iteritems(stats):
-                stats_cpu[name] = float(value)  # copy to CPU
+            stats_cpu = reporter._to_cpu_scalars(stats)  # copy to CPU
 
             updater = trainer.updater
             stats_cpu['epoch'] = updater.epoch
@@ -31,6 +31,33 @@ class _ExtensionEntry(object):
         self.priority = priority
 
 
+class _ScheduledTrigger(object):
+
+    """Trigger wrapper that skips evaluations known not to fire.
+
+    If the wrapped trigger implements ``get_next_firing_iteration``, the
+    trigger is not called until the updater reaches the iteration it returns.
+
+    """
+
+    def __init__(self, trigger):
+        self.trigger = trigger
+        self._get_next = getattr(trigger, 'get_next_firing_iteration', None)
+        self._checked_at = None
+        self._next = None
+
+    def __call__(self, trainer, iteration):
+        next_iteration = self._next
+        if (next_iteration is not None
+                and self._checked_at < iteration < next_iteration):
+            return False
+        fire = self.trigger(trainer)
+        if self._get_next is not None and iteration is not None:
+            self._checked_at = iteration
+            self._next = self._get_next(trainer)
+        return fire
+
+
 class Trainer(object):
 
     """The standard training loop in Chainer.
@@ -107,7 +134,16 @@ class Trainer(object):
     During the training, it also creates a :class:`~chainer.Reporter` object to
     store observed values on each update. For each iteration, it creates a
     fresh observation dictionary and stores it in the :attr:`observation`
-    attribute.
+    attribute. If ``reuse_observation`` is ``True``, a single dictionary is
+    cleared and reused over the whole loop instead; in this case, extensions
+    must not keep references to :attr:`observation` across iterations.
+
+    Triggers that implement ``get_next_firing_iteration`` (e.g.,
+    :class:`~chainer.training.triggers.IntervalTrigger` and
+    :class:`~chainer.training.triggers.ManualScheduleTrigger` with the
+    ``'iteration'`` unit) are not evaluated until the iteration they report,
+    so that extensions that are rarely invoked do not add per-iteration
+    overhead.
 
     Links of the target model of each optimizer are registered to the reporter
     object as observers, where the name of each observer is constructed as the
@@ -125,6 +161,11 @@ class Trainer(object):
             If it is not callable, it is passed to :class:`IntervalTrigger`.
         out: Output directory.
         extensions: Extensions registered to the trainer.
+        reuse_observation (bool): If ``True``, the observation dictionary is
+            reused over iterations instead of being created at each iteration.
+        profile_overhead (bool): If ``True``, the time spent in each part of
+            the training loop is recorded. See
+            :meth:`get_overhead_profile`.
 
     Attributes:
         updater: The updater object for this trainer.
@@ -139,7 +180,8 @@ class Trainer(object):
     """
 
     def __init__(self, updater, stop_trigger=None, out='result',
-                 extensions=None):
+                 extensions=None, reuse_observation=False,
+                 profile_overhead=False):
         self.updater = updater
         self.stop_trigger = trigger_module.get_trigger(stop_trigger)
         self.observation = {}
@@ -161,6 +203,12 @@ class Trainer(object):
         self._snapshot_elapsed_time = 0.0
         self._final_elapsed_time = None
 
+        self._reuse_observation = reuse_observation
+        if profile_overhead:
+            self._overhead_profile = collections.defaultdict(float)
+        else:
+            self._overhead_profile = None
+
         updater.connect_trainer(self)
         for ext in extensions:
             self.extend(ext)
@@ -180,6 +228,45 @@ class Trainer(object):
             raise RuntimeError('training has not been started yet')
         return _get_time() - self._start_at + self._snapshot_elapsed_time
 
+    def get_overhead_profile(self):
+        """Returns the per-iteration time spent in each part of the loop.
+
+        This method is available only if the trainer is created with
+        ``profile_overhead=True``.
+
+        Returns:
+            dict: Dictionary with the following entries. All times are averages
+            per iteration in seconds.
+
+            - ``'iterations'``: Number of iterations profiled.
+            - ``'total'``: Time of the whole iteration.
+            - ``'update'``: Time spent in the updater.
+            - ``'triggers'``: Time spent in evaluating triggers including the
+              stop trigger.
+            - ``'extensions'``: Time spent in extensions.
+            - ``'loop'``: Remaining time, i.e., the overhead of the training
+              loop itself.
+            - ``'extension/<name>'``: Time spent in each extension.
+
+        """
+        profile = self._overhead_profile
+        if profile is None:
+            raise RuntimeError(
+                'overhead profile is not enabled; '
+                'create the trainer with profile_overhead=True')
+        iterations = int(profile['iterations'])
+        result = {'iterations': iterations}
+        if iterations == 0:
+            return result
+        for key, value in six.iteritems(profile):
+            if key != 'iterations':
+                result[key] = value / iterations
+        for key in ('total', 'update', 'triggers', 'extensions'):
+            result.setdefault(key, 0.0)
+        result['loop'] = (result['total'] - result['update']
+                          - result['triggers'] - result['extensions'])
+        return result
+
     def extend(self, extension, name=None, trigger=None, priority=None,
                **kwargs):
         """Registers an extension to the trainer.
@@ -304,19 +391,12 @@ class Trainer(object):
             if initializer and not finished:
                 initializer(self)
 
-        update = self.updater.update
-        reporter = self.reporter
-        stop_trigger = self.stop_trigger
-
         # main training loop
         try:
-            while not stop_trigger(self):
-                self.observation = {}
-                with reporter.scope(self.observation):
-                    update()
-                    for name, entry in extensions:
-                        if entry.trigger(self):
-                            entry.extension(self)
+            if self._overhead_profile is None:
+                self._run_loop(extensions)
+            else:
+                self._run_profiled_loop(extensions)
         except Exception as e:
             if show_loop_exception_msg:
                 # Show the exception here, as it will appear as if chainer
@@ -357,6 +437,81 @@ class Trainer(object):
         self._final_elapsed_time = self.elapsed_time
         self._done = True
 
+    def _run_loop(self, extensions):
+        updater = self.updater
+        update = updater.update
+        reporter = self.reporter
+        stop_trigger = _ScheduledTrigger(self.stop_trigger)
+        scheduled = [(entry.extension, _ScheduledTrigger(entry.trigger))
+                     for _, entry in extensions]
+
+        def run_iteration():
+            update()
+            iteration = getattr(updater, 'iteration', None)
+            for extension, trigger in scheduled:
+                if trigger(self, iteration):
+                    extension(self)
+
+        if self._reuse_observation:
+            observation = {}
+            self.observation = observation
+            with reporter.scope(observation):
+                while not stop_trigger(
+                        self, getattr(updater, 'iteration', None)):
+                    observation.clear()
+                    run_iteration()
+        else:
+            while not stop_trigger(self, getattr(updater, 'iteration', None)):
+                self.observation = {}
+                with reporter.scope(self.observation):
+                    run_iteration()
+
+    def _run_profiled_loop(self, extensions):
+        updater = self.updater
+        update = updater.update
+        reporter = self.reporter
+        profile = self._overhead_profile
+        stop_trigger = _ScheduledTrigger(self.stop_trigger)
+        scheduled = [('extension/' + name, entry.extension,
+                      _ScheduledTrigger(entry.trigger))
+                     for name, entry in extensions]
+        reuse_observation = self._reuse_observation
+        observation = {}
+
+        while True:
+            t_begin = _get_time()
+            iteration = getattr(updater, 'iteration', None)
+            stop = stop_trigger(self, iteration)
+            trigger_time = _get_time() - t_begin
+            if stop:
+                profile['triggers'] += trigger_time
+                break
+
+            if reuse_observation:
+                observation.clear()
+            else:
+                observation = {}
+            self.observation = observation
+            with reporter.scope(observation):
+                t = _get_time()
+                update()
+                profile['update'] += _get_time() - t
+                iteration = getattr(updater, 'iteration', None)
+                for key, extension, trigger in scheduled:
+                    t = _get_time()
+                    fire = trigger(self, iteration)
+                    t_fired = _get_time()
+                    trigger_time += t_fired - t
+                    if fire:
+                        extension(self)
+                        ext_time = _get_time() - t_fired
+                        profile[key] += ext_time
+                        profile['extensions'] += ext_time
+
+            profile['triggers'] += trigger_time
+            profile['total'] += _get_time() - t_begin
+            profile['iterations'] += 1
+
     def serialize(self, serializer):
         self.updater.serialize(serializer['updater'])
         if hasattr(self.stop_trigger, 'serialize'):
@@ -106,5 +106,26 @@ class IntervalTrigger(object):
             # set a negative value for invalid
             self._previous_epoch_detail = -1.
 
+    def get_next_firing_iteration(self, trainer):
+        """Returns the earliest iteration at which this trigger can fire.
+
+        The value is only valid right after this trigger is called at the
+        current iteration of the updater. :class:`~chainer.training.Trainer`
+        uses it to skip evaluating the trigger until the returned iteration.
+
+        Args:
+            trainer (Trainer): Trainer object that this trigger is associated
+                with.
+
+        Returns:
+            int or None: The next iteration at which the trigger can fire, or
+            ``None`` if it cannot be determined in advance (i.e., if the unit
+            is ``'epoch'``).
+
+        """
+        if self.unit != 'iteration':
+            return None
+        return (trainer.updater.iteration // self.period + 1) * self.period
+
     def get_training_length(self):
         return (self.period, self.unit)
@@ -94,6 +94,31 @@ class ManualScheduleTrigger(object):
 
         return fire
 
+    def get_next_firing_iteration(self, trainer):
+        """Returns the earliest iteration at which this trigger can fire.
+
+        The value is only valid right after this trigger is called at the
+        current iteration of the updater. :class:`~chainer.training.Trainer`
+        uses it to skip evaluating the trigger until the returned iteration.
+
+        Args:
+            trainer (Trainer): Trainer object that this trigger is associated
+                with.
+
+        Returns:
+            int or None: The next iteration at which the trigger can fire, or
+            ``None`` if it cannot be determined in advance (i.e., if the unit
+            is ``'epoch'`` or all the points have already passed).
+
+        """
+        if self.unit != 'iteration':
+            return None
+        iteration = trainer.updater.iteration
+        upcoming = [p for p in self.points if p > iteration]
+        if not upcoming:
+            return None
+        return min(upcoming)
+
     def serialize(self, serializer):
         try:
             self._previous_iteration = serializer(
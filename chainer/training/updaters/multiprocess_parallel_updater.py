@@ -5,6 +5,7 @@ import six
 
 from chainer.backends import cuda
 from chainer.dataset import convert
+from chainer import mixed_precision
 from chainer import reporter
 from chainer.training.updaters import standard_updater
 
@@ -26,9 +27,12 @@ class _Worker(multiprocessing.Process):
         self.pipe = pipe
         self.converter = master.converter
         self.model = master._master
+        # The autocast mode of the optimizer is inherited by fork.
+        self.optimizer = master.get_optimizer('main')
         self.device = master._devices[proc_id]
         self.iterator = master._mpu_iterators[proc_id]
         self.n_devices = len(master._devices)
+        self.accumulation_steps = master.accumulation_steps
 
     def setup(self):
         _, comm_id = self.pipe.recv()
@@ -51,16 +55,33 @@ class _Worker(multiprocessing.Process):
                 dev.synchronize()
                 break
             if job == 'update':
+                # The current loss scale of the optimizer is sent, since it
+                # may be changed by the dynamic loss scaling.
+                loss_scale = data
+
                 # For reducing memory
                 self.model.cleargrads()
 
-                batch = self.converter(self.iterator.next(), self.device)
-                with self.reporter.scope({}):  # pass dummy observation
-                    loss = _calc_loss(self.model, batch)
-
-                self.model.cleargrads()
-                loss.backward()
-                del loss
+                batch = self.iterator.next()
+                if self.accumulation_steps > 1:
+                    micro_batches = [
+                        (self.converter(micro, self.device), len(micro))
+                        for micro in standard_updater._split_batch(
+                            batch, self.accumulation_steps)]
+                    with self.reporter.scope({}):  # pass dummy observation
+                        standard_updater._accumulate_grads(
+                            self.model, self.model, micro_batches,
+                            loss_scale=loss_scale, optimizer=self.optimizer)
+                else:
+                    batch = self.converter(batch, self.device)
+                    with self.reporter.scope({}):  # pass dummy observation
+                        with mixed_precision._optimizer_autocast(
+                                self.optimizer):
+                            loss = _calc_loss(self.model, batch)
+
+                    self.model.cleargrads()
+                    loss.backward(loss_scale=loss_scale)
+                    del loss
 
                 gg = gather_grads(self.model)
                 nccl_data_type = _get_nccl_data_type(gg.dtype)
@@ -114,11 +135,15 @@ class MultiprocessParallelUpdater(standard_updater.StandardUpdater):
             :meth:`~chainer.Optimizer.new_epoch` of the main optimizer is
             automatically called when the ``is_new_epoch`` attribute of the
             main iterator is ``True``.
+        accumulation_steps (int): Number of micro-batches into which the
+            batch of each device is split. Gradients of the micro-batches are
+            accumulated before they are reduced among the devices. See
+            :class:`~chainer.training.updaters.StandardUpdater`.
 
     """
 
     def __init__(self, iterators, optimizer, converter=convert.concat_examples,
-                 devices=None, auto_new_epoch=True):
+                 devices=None, auto_new_epoch=True, accumulation_steps=1):
         if not MultiprocessParallelUpdater.available():
             raise Exception(
                 'NCCL is not enabled. MultiprocessParallelUpdater '
@@ -165,6 +190,7 @@ class MultiprocessParallelUpdater(standard_updater.StandardUpdater):
             optimizer=optimizer,
             converter=converter,
             auto_new_epoch=auto_new_epoch,
+            accumulation_steps=accumulation_steps,
         )
 
         if isinstance(devices, dict):
@@ -222,20 +248,31 @@ class MultiprocessParallelUpdater(standard_updater.StandardUpdater):
     def update_core(self):
         self.setup_workers()
 
-        self._send_message(('update', None))
+        optimizer = self.get_optimizer('main')
+        loss_scale = getattr(optimizer, '_loss_scale', None)
+        self._send_message(('update', loss_scale))
         with cuda.Device(self._devices[0]):
             # For reducing memory
             self._master.cleargrads()
 
-            optimizer = self.get_optimizer('main')
             iterator = self.get_iterator('main')
             batch = iterator.next()
-            batch = self.converter(batch, self._devices[0])
-
-            loss = _calc_loss(self._master, batch)
-
-            self._master.cleargrads()
-            loss.backward()
+            if self.accumulation_steps > 1:
+                micro_batches = [
+                    (self.converter(micro, self._devices[0]), len(micro))
+                    for micro in standard_updater._split_batch(
+                        batch, self.accumulation_steps)]
+                standard_updater._accumulate_grads(
+                    self._master, self._master, micro_batches,
+                    loss_scale=loss_scale, optimizer=optimizer)
+            else:
+                batch = self.converter(batch, self._devices[0])
+
+                with mixed_precision._optimizer_autocast(optimizer):
+                    loss = _calc_loss(self._master, batch)
+
+                self._master.cleargrads()
+                loss.backward(loss_scale=loss_scale)
 
             # NCCL: reduce grads
             null_stream = cuda.Stream.null
@@ -5,6 +5,7 @@ import six
 from chainer.backends import cuda
 from chainer.dataset import convert
 from chainer import function
+from chainer import mixed_precision
 from chainer.training.updaters import standard_updater
 
 
@@ -54,12 +55,16 @@ class ParallelUpdater(standard_updater.StandardUpdater):
             :meth:`~chainer.Optimizer.new_epoch` of the main optimizer is
             automatically called when the ``is_new_epoch`` attribute of the
             main iterator is ``True``.
+        accumulation_steps (int): Number of micro-batches into which the
+            sub-batch of each device is split. Gradients of the micro-batches
+            are accumulated before the single update of each iteration. See
+            :class:`~chainer.training.updaters.StandardUpdater`.
 
     """
 
     def __init__(self, iterator, optimizer, converter=convert.concat_examples,
                  models=None, devices=None, loss_func=None, loss_scale=None,
-                 auto_new_epoch=True):
+                 auto_new_epoch=True, accumulation_steps=1):
         super(ParallelUpdater, self).__init__(
             iterator=iterator,
             optimizer=optimizer,
@@ -67,6 +72,7 @@ class ParallelUpdater(standard_updater.StandardUpdater):
             loss_func=loss_func,
             loss_scale=loss_scale,
             auto_new_epoch=auto_new_epoch,
+            accumulation_steps=accumulation_steps,
         )
 
         if models is None:
@@ -113,21 +119,62 @@ class ParallelUpdater(standard_updater.StandardUpdater):
         # Split the batch to sub-batches.
         #
         n = len(self._models)
-        in_arrays_list = {}
+        sub_batches = {}
         for i, key in enumerate(six.iterkeys(self._models)):
-            in_arrays_list[key] = self.converter(
-                batch[i::n], self._devices[key])
+            sub_batches[key] = batch[i::n]
 
         # For reducing memory
         for model in six.itervalues(self._models):
             model.cleargrads()
 
+        if self.accumulation_steps > 1:
+            self._accumulate_grads(sub_batches)
+        else:
+            self._compute_grads(sub_batches)
+
+        for model in six.itervalues(models_others):
+            model_main.addgrads(model)
+
+        optimizer.update()
+
+        for model in six.itervalues(models_others):
+            model.copyparams(model_main)
+
+        if self.auto_new_epoch and iterator.is_new_epoch:
+            optimizer.new_epoch(auto=True)
+
+    def _accumulate_grads(self, sub_batches):
+        optimizer = self.get_optimizer('main')
+        for model_key, model in six.iteritems(self._models):
+            device = self._devices[model_key]
+            micro_batches = [
+                (self.converter(micro, device), len(micro))
+                for micro in standard_updater._split_batch(
+                    sub_batches[model_key], self.accumulation_steps)]
+            loss_func = self.loss_func or model
+
+            with function.force_backprop_mode():
+                dev_id = device if 0 <= device else None
+                with cuda.get_device_from_id(dev_id):
+                    standard_updater._accumulate_grads(
+                        model, loss_func, micro_batches,
+                        loss_scale=getattr(optimizer, '_loss_scale', None),
+                        optimizer=optimizer)
+
+    def _compute_grads(self, sub_batches):
+        optimizer = self.get_optimizer('main')
+        in_arrays_list = {}
+        for key, sub_batch in six.iteritems(sub_batches):
+            in_arrays_list[key] = self.converter(
+                sub_batch, self._devices[key])
+
         losses = []
         for model_key, model in six.iteritems(self._models):
             in_arrays = in_arrays_list[model_key]
             loss_func = self.loss_func or model
 
-            with function.force_backprop_mode():
+            with function.force_backprop_mode(), \
+                    mixed_precision._optimizer_autocast(optimizer):
                 dev_id = self._devices[model_key]
                 dev_id = dev_id if 0 <= dev_id else None
                 with cuda.get_device_from_id(dev_id):
@@ -145,15 +192,5 @@ class ParallelUpdater(standard_updater.StandardUpdater):
             model.cleargrads()
 
         for loss in losses:
-            loss.backward(loss_scale=self.loss_scale)
-
-        for model in six.itervalues(models_others):
-            model_main.addgrads(model)
-
-        optimizer.update()
-
-        for model in six.itervalues(models_others):
-            model.copyparams(model_main)
-
-        if self.auto_new_epoch and iterator.is_new_epoch:
-            optimizer.new_epoch(auto=True)
+            loss.backward(
+                loss_scale=getattr(optimizer, '_loss_scale', None))
@@ -1,12 +1,204 @@
+import sys
+import threading
+
 import six
+from six.moves import queue
 
 from chainer import backend
 from chainer.backends import cuda
 from chainer.dataset import convert
 from chainer.dataset import iterator as iterator_module
+from chainer.iterators import _statemachine
+from chainer import mixed_precision
+from chainer import reporter as reporter_module
+from chainer import serializer as serializer_module
 from chainer.training import _updater
 
 
+_response_time = 0.1
+_iterator_state_names = (
+    'epoch', 'epoch_detail', 'previous_epoch_detail', 'is_new_epoch')
+
+
+class _BatchPrefetcher(object):
+
+    """Prepares batches of an iterator ahead on a background thread.
+
+    The thread fetches each batch and passes it to ``prepare``, which converts
+    it and sends it to the device. The epoch attributes of the iterator are
+    recorded together with each batch, since the iterator itself runs ahead of
+    the batches being consumed.
+
+    """
+
+    def __init__(self, iterator, prepare, n_prefetch):
+        self.iterator = iterator
+        self.prepare = prepare
+        self.lock = threading.Lock()
+        self.state = None
+
+        self._queue = queue.Queue(maxsize=n_prefetch)
+        self._thread = None
+        self._terminating = False
+
+    def get(self):
+        if self._thread is None:
+            self._start()
+        in_arrays, state, exc_info = self._queue.get()
+        if exc_info is not None:
+            self._thread.join()
+            self._thread = None
+            six.reraise(*exc_info)
+        self.state = state
+        return in_arrays
+
+    def reset(self):
+        self._stop()
+        self.state = None
+
+    def finalize(self):
+        self._stop()
+
+    def _start(self):
+        self._terminating = False
+        thread = threading.Thread(target=self._run, name='batch_prefetch')
+        thread.daemon = True
+        thread.start()
+        self._thread = thread
+
+    def _stop(self):
+        if self._thread is None:
+            return
+        self._terminating = True
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=_response_time)
+            except queue.Empty:
+                pass
+        self._thread.join()
+        self._thread = None
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    def _run(self):
+        iterator = self.iterator
+        while not self._terminating:
+            exc_info = None
+            in_arrays = state = None
+            try:
+                with self.lock:
+                    batch = iterator.next()
+                    state = {name: getattr(iterator, name, None)
+                             for name in _iterator_state_names}
+                    state['iterator_state'] = iterator._state
+                in_arrays = self.prepare(batch)
+            except Exception:
+                exc_info = sys.exc_info()
+
+            item = in_arrays, state, exc_info
+            while True:
+                try:
+                    self._queue.put(item, timeout=_response_time)
+                    break
+                except queue.Full:
+                    if self._terminating:
+                        return
+            if exc_info is not None:
+                return
+
+
+class _IteratorStateSerializer(serializer_module.Serializer):
+
+    """Serializer that saves the recorded state instead of the iterator's.
+
+    The prefetched iterator runs ahead of the batch being consumed, so the
+    state recorded together with the batch is saved in place of the current
+    one. The iterator gets its own values back so that it is left as is.
+
+    """
+
+    def __init__(self, serializer, state):
+        iterator_state = state['iterator_state']
+        self.serializer = serializer
+        self.values = {
+            'current_position': iterator_state.current_position,
+            'epoch': iterator_state.epoch,
+            'is_new_epoch': iterator_state.is_new_epoch,
+            'order': iterator_state.order,
+            '_order': iterator_state.order,
+            'previous_epoch_detail': state['previous_epoch_detail'],
+        }
+
+    def __getitem__(self, key):
+        return self.serializer[key]
+
+    def __call__(self, key, value):
+        self.serializer(key, self.values.get(key, value))
+        return value
+
+
+def _split_batch(batch, n):
+    # Splits a batch into at most n contiguous non-empty micro-batches.
+    size = len(batch)
+    bounds = [i * size // n for i in six.moves.range(n + 1)]
+    return [batch[begin:end] for begin, end in zip(bounds[:-1], bounds[1:])
+            if begin < end]
+
+
+def _call_loss_func(loss_func, in_arrays):
+    if isinstance(in_arrays, tuple):
+        return loss_func(*in_arrays)
+    elif isinstance(in_arrays, dict):
+        return loss_func(**in_arrays)
+    else:
+        return loss_func(in_arrays)
+
+
+def _accumulate_grads(target, loss_func, micro_batches, loss_scale=None,
+                      use_cleargrads=True, optimizer=None):
+    """Accumulates the gradients of the loss over micro-batches.
+
+    ``micro_batches`` is a list of pairs of converted input arrays and the
+    number of examples. The loss of each micro-batch is weighted by its share
+    of the examples, so that the accumulated gradients are the ones of the
+    whole batch. The scalar values reported in the micro-batches are averaged
+    with the same weights and reported to the current reporter. The loss
+    function is called in the autocast mode of ``optimizer`` if its mixed
+    precision is enabled.
+
+    """
+    total = sum(size for _, size in micro_batches)
+    summary = reporter_module.DictSummary()
+    observation = {}
+    for i, (in_arrays, size) in enumerate(micro_batches):
+        observation = {}
+        with mixed_precision._optimizer_autocast(optimizer):
+            if reporter_module._reporters:
+                with reporter_module.report_scope(observation):
+                    loss = _call_loss_func(loss_func, in_arrays)
+            else:
+                loss = _call_loss_func(loss_func, in_arrays)
+
+        if i == 0:
+            # Gradients are cleared after the forward computation of the
+            # first micro-batch for uninitialized parameters.
+            if use_cleargrads:
+                target.cleargrads()
+            else:
+                target.zerograds()
+        loss *= float(size) / total
+        loss.backward(loss_scale=loss_scale)
+        del loss
+
+        summary.add({key: (value, size)
+                     for key, value in six.iteritems(observation)})
+
+    # Non-scalar values are taken from the last micro-batch.
+    result = dict(observation)
+    result.update(summary.compute_mean())
+    reporter_module.report(result)
+
+
 class StandardUpdater(_updater.Updater):
 
     """Standard implementation of Updater.
@@ -48,6 +240,28 @@ class StandardUpdater(_updater.Updater):
             :meth:`~chainer.Optimizer.new_epoch` of the main optimizer is
             automatically called when the ``is_new_epoch`` attribute of the
             main iterator is ``True``.
+        n_prefetch (int): Number of batches of the main iterator prepared
+            ahead on a background thread. If it is positive, fetching,
+            conversion and transfer of the next batches overlap the
+            computation of the current one. The epoch attributes of the
+            updater follow the batch being consumed, while the main iterator
+            itself runs ahead by up to ``n_prefetch + 1`` batches. A snapshot
+            records the state of the main iterator after the batch being
+            consumed, so training resumes from the same batch as without
+            prefetch. The main iterator must be one of the iterators in
+            :mod:`chainer.iterators` that keep their state in the same way
+            (:class:`~chainer.iterators.SerialIterator`,
+            :class:`~chainer.iterators.MultiprocessIterator` or
+            :class:`~chainer.iterators.MultithreadIterator`). If it is ``0``
+            (default), batches are prepared synchronously.
+        accumulation_steps (int): Number of micro-batches into which each
+            batch of the main iterator is split. The micro-batches are
+            converted and sent to the device separately, their gradients are
+            accumulated, and the parameters are updated once per batch. The
+            loss of each micro-batch is weighted by its share of the batch,
+            and the reported scalar values are averaged with the same weights.
+            Each update still consumes exactly one batch of the iterator, so
+            the epoch semantics do not change.
 
     Attributes:
         converter: Converter function.
@@ -55,6 +269,7 @@ class StandardUpdater(_updater.Updater):
                    main optimizer is used instead.
         device: Device to which the training data is sent.
         iteration: Current number of completed updates.
+        accumulation_steps: Number of micro-batches of each batch.
         auto_new_epoch: If ``True``, :meth:`~chainer.Optimizer.new_epoch` is
             automatically called by :meth:`update_core`. In this case, the
             :attr:`~chainer.Optimizer.use_auto_new_epoch` attribute of each
@@ -66,7 +281,9 @@ class StandardUpdater(_updater.Updater):
 
     def __init__(self, iterator, optimizer, converter=convert.concat_examples,
                  device=None, loss_func=None, loss_scale=None,
-                 auto_new_epoch=True):
+                 auto_new_epoch=True, n_prefetch=0, accumulation_steps=1):
+        if accumulation_steps < 1:
+            raise ValueError('accumulation_steps must be a positive integer')
         if device is not None:
             device = backend.get_device(device)
 
@@ -91,6 +308,7 @@ class StandardUpdater(_updater.Updater):
         self.loss_func = loss_func
         self.device = device
         self.iteration = 0
+        self.accumulation_steps = accumulation_steps
 
         self.loss_scale = loss_scale
         if loss_scale is not None:
@@ -102,21 +320,38 @@ class StandardUpdater(_updater.Updater):
             for o in six.itervalues(self._optimizers):
                 o.use_auto_new_epoch = True
 
+        if n_prefetch > 0:
+            if not isinstance(getattr(self._iterators['main'], '_state', None),
+                              _statemachine.IteratorState):
+                raise ValueError(
+                    'n_prefetch requires SerialIterator, MultiprocessIterator '
+                    'or MultithreadIterator as the main iterator')
+            self._prefetcher = _BatchPrefetcher(
+                self._iterators['main'], self._prepare_batch, n_prefetch)
+        else:
+            self._prefetcher = None
+
+    def _get_iterator_state(self, name):
+        prefetcher = self._prefetcher
+        if prefetcher is not None and prefetcher.state is not None:
+            return prefetcher.state[name]
+        return getattr(self._iterators['main'], name)
+
     @property
     def epoch(self):
-        return self._iterators['main'].epoch
+        return self._get_iterator_state('epoch')
 
     @property
     def epoch_detail(self):
-        return self._iterators['main'].epoch_detail
+        return self._get_iterator_state('epoch_detail')
 
     @property
     def previous_epoch_detail(self):
-        return self._iterators['main'].previous_epoch_detail
+        return self._get_iterator_state('previous_epoch_detail')
 
     @property
     def is_new_epoch(self):
-        return self._iterators['main'].is_new_epoch
+        return self._get_iterator_state('is_new_epoch')
 
     def finalize(self):
         """Finalizes the updater object.
@@ -126,6 +361,8 @@ class StandardUpdater(_updater.Updater):
         It is called at the end of training loops.
 
         """
+        if self._prefetcher is not None:
+            self._prefetcher.finalize()
         for iterator in six.itervalues(self._iterators):
             iterator.finalize()
 
@@ -177,29 +414,66 @@ class StandardUpdater(_updater.Updater):
 
     def update_core(self):
         iterator = self._iterators['main']
-        batch = iterator.next()
-        in_arrays = convert._call_converter(self.converter, batch, self.device)
+        if self._prefetcher is None:
+            batch = iterator.next()
+            in_arrays = self._prepare_batch(batch)
+        else:
+            in_arrays = self._prefetcher.get()
 
         optimizer = self._optimizers['main']
         loss_func = self.loss_func or optimizer.target
 
-        if isinstance(in_arrays, tuple):
+        if self.accumulation_steps > 1:
+            _accumulate_grads(
+                optimizer.target, loss_func, in_arrays,
+                loss_scale=getattr(optimizer, '_loss_scale', None),
+                use_cleargrads=getattr(optimizer, '_use_cleargrads', True),
+                optimizer=optimizer)
+            optimizer.update()
+        elif isinstance(in_arrays, tuple):
             optimizer.update(loss_func, *in_arrays)
         elif isinstance(in_arrays, dict):
             optimizer.update(loss_func, **in_arrays)
         else:
             optimizer.update(loss_func, in_arrays)
 
-        if self.auto_new_epoch and iterator.is_new_epoch:
+        if self.auto_new_epoch and self.is_new_epoch:
             optimizer.new_epoch(auto=True)
 
+    def _prepare_batch(self, batch):
+        # Converts a batch, or each of its micro-batches with the sizes when
+        # gradients are accumulated.
+        if self.accumulation_steps == 1:
+            return convert._call_converter(self.converter, batch, self.device)
+        return [(convert._call_converter(self.converter, micro, self.device),
+                 len(micro))
+                for micro in _split_batch(batch, self.accumulation_steps)]
+
     def serialize(self, serializer):
         """Serializes the current state of the updater object."""
-        for name, iterator in six.iteritems(self._iterators):
-            iterator.serialize(serializer['iterator:' + name])
+        prefetcher = self._prefetcher
+        if prefetcher is None:
+            self._serialize_iterators(serializer)
+        else:
+            if not isinstance(serializer, serializer_module.Serializer):
+                # Batches prefetched from the old state are discarded.
+                prefetcher.reset()
+            with prefetcher.lock:
+                self._serialize_iterators(serializer)
 
         for name, optimizer in six.iteritems(self._optimizers):
             optimizer.serialize(serializer['optimizer:' + name])
             optimizer.target.serialize(serializer['model:' + name])
 
         self.iteration = serializer('iteration', self.iteration)
+
+    def _serialize_iterators(self, serializer):
+        prefetcher = self._prefetcher
+        for name, iterator in six.iteritems(self._iterators):
+            iterator_serializer = serializer['iterator:' + name]
+            if (name == 'main' and prefetcher is not None
+                    and prefetcher.state is not None):
+                # The main iterator is ahead of the batch being consumed.
+                iterator_serializer = _IteratorStateSerializer(
+                    iterator_serializer, prefetcher.state)
+            iterator.serialize(iterator_serializer)
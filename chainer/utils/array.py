@@ -63,3 +63,64 @@ def sum_to(x, shape):
     if lead > 0:
         y = y.squeeze(lead_axis)
     return y
+
+
+def _has_integer_array_index(slices):
+    for s in slices:
+        if isinstance(s, (list, numpy.ndarray)):
+            if numpy.asarray(s).dtype.kind != 'b':
+                return True
+    return False
+
+
+def _add_rows_at(a, indices, b):
+    # Equivalent to ``numpy.add.at(a, indices, b)`` for an integer array
+    # ``indices`` indexing the first axis. Values of duplicated indices are
+    # summed by sorting the indices and reducing each segment at once.
+    indices = indices.ravel()
+    if indices.size == 0:
+        return
+    b = b.reshape((indices.size,) + a.shape[1:])
+    if (indices < 0).any():
+        indices = numpy.where(indices < 0, indices + len(a), indices)
+    order = numpy.argsort(indices, kind='mergesort')
+    indices = indices[order]
+    starts = numpy.flatnonzero(indices[1:] != indices[:-1]) + 1
+    starts = numpy.concatenate(([0], starts))
+    a[indices[starts]] += numpy.add.reduceat(b[order], starts, axis=0)
+
+
+def add_at(a, slices, b):
+    """Adds values to the elements of a NumPy array specified by indices.
+
+    This is equivalent to ``numpy.add.at(a, slices, b)``, i.e., values for
+    duplicated indices are accumulated, but is much faster because it does
+    not loop over each element.
+
+    Args:
+        a (numpy.ndarray): Array to be modified in place.
+        slices: Index of the elements in the same form as
+            :meth:`numpy.ndarray.__getitem__`.
+        b (numpy.ndarray): Values to add. It must be broadcastable to the
+            shape of ``a[slices]``.
+
+    """
+    if not isinstance(slices, tuple):
+        slices = slices,
+    if not _has_integer_array_index(slices):
+        # Basic and boolean indexing never select the same element twice.
+        a[slices] += b
+        return
+    if len(slices) == 1:
+        indices = numpy.asarray(slices[0])
+        b = numpy.broadcast_to(b, indices.shape + a.shape[1:])
+        _add_rows_at(a, indices, b)
+        return
+    if not a.flags.c_contiguous:
+        # The flattened array would be a copy, and the update would be lost.
+        numpy.add.at(a, slices, b)
+        return
+    # Converts the index to the indices of the flattened array.
+    indices = numpy.arange(a.size).reshape(a.shape)[slices]
+    b = numpy.broadcast_to(b, indices.shape)
+    _add_rows_at(a.reshape(-1), indices, b)
@@ -1,11 +1,13 @@
 import warnings
 
+from chainermn.communicators.communication_profiler import CommunicationProfiler  # NOQA
 from chainermn.communicators.communicator_base import CommunicatorBase  # NOQA
 
 
 def create_communicator(
         communicator_name='pure_nccl', mpi_comm=None,
-        allreduce_grad_dtype=None, batched_copy=False):
+        allreduce_grad_dtype=None, batched_copy=False,
+        gradient_compression=None, allreduce_algorithm=None):
     """Create a ChainerMN communicator.
 
     Different communicators provide different approaches of communication, so
@@ -31,6 +33,8 @@ def create_communicator(
     +---------------+---+---+--------+--------------------------------------+
     |naive          |OK |OK |        |Testing on CPU mode                   |
     +---------------+---+---+--------+--------------------------------------+
+    |shared_memory  |OK |   |        |Multiple processes per node on CPU    |
+    +---------------+---+---+--------+--------------------------------------+
 
     pure_nccl communicator supports multiple data types, FP32 and FP16,
     in gradient exchange. The communication data type is determined based on
@@ -60,13 +64,53 @@ def create_communicator(
     float32 communication, no matter what the model is. This is due to
     MPI's limited support of float16.
 
+    Gradients can be compressed to reduce the number of bytes communicated
+    by ``gradient_compression``, which is supported by ``naive``, ``flat``,
+    ``hierarchical``, ``two_dimensional`` and ``non_cuda_aware``
+    communicators. The compressed gradients are communicated through MPI on
+    host memory. The following compressions are available.
+
+    - ``'fp16'``: The gradients are cast to float16, and the rounding errors
+      are fed back to the next iteration.
+    - ``'topk'``: Only 1% of the elements with the largest magnitude are
+      sent, and the others are accumulated to the next iteration.
+    - ``'powersgd'``: The gradients are approximated by rank-4 matrices.
+
+    See :mod:`chainermn.communicators.gradient_compressors` for the details.
+
+    ``naive`` communicator can allreduce the gradients on CPU by the
+    algorithms implemented with point-to-point communication of MPI instead
+    of ``MPI_Allreduce``, which is specified by ``allreduce_algorithm``.
+    The gradients are packed into a single buffer in this case.
+
+    - ``'ring'``: Ring allreduce, which is bandwidth optimal and suitable
+      for large gradients.
+    - ``'recursive_halving_doubling'``: Rabenseifner's algorithm, whose
+      number of steps is logarithmic in the number of processes.
+    - ``'hierarchical'``: The gradients are reduced within each node first,
+      allreduced among the nodes, and broadcast within each node.
+    - ``'auto'``: ``'hierarchical'`` is used when there are multiple nodes
+      with multiple processes, and otherwise ``'recursive_halving_doubling'``
+      for gradients smaller than 1 MiB and ``'ring'`` for larger ones.
+
+    ``shared_memory`` communicator allreduces the arrays on CPU through a
+    memory segment shared by the processes in each node, where each process
+    reduces a slice of the arrays of all the processes in the node in
+    parallel. Only the reduction among the nodes is done by MPI. All nodes
+    must have the same number of processes.
+
     Args:
         communicator_name: The name of communicator (``naive``, ``flat``,
-          ``hierarchical``, ``two_dimensional``, ``pure_nccl``, or
-          ``single_node``)
+          ``hierarchical``, ``two_dimensional``, ``pure_nccl``,
+          ``single_node`` or ``shared_memory``)
         mpi_comm: MPI4py communicator
         allreduce_grad_dtype: Data type of gradient used in All-Reduce.
           If ``None``, the dtype of a model is used.
+        gradient_compression: The name of gradient compression (``fp16``,
+          ``topk`` or ``powersgd``) or a gradient compressor object to
+          customize it. If ``None``, the gradients are not compressed.
+        allreduce_algorithm: The name of allreduce algorithm used by
+          ``naive`` communicator. If ``None``, ``MPI_Allreduce`` is used.
 
     Returns:
         ChainerMN communicator that implements methods defined in
@@ -94,29 +138,50 @@ def create_communicator(
             'batched_copy is only available'
             'at \'pure_nccl\' communicator.')
 
+    if communicator_name != 'naive' and allreduce_algorithm is not None:
+        raise ValueError(
+            'allreduce_algorithm is only available '
+            'at \'naive\' communicator.')
+
+    gradient_compressor = None
+    if gradient_compression is not None:
+        if communicator_name not in ('naive', 'flat', 'hierarchical',
+                                     'two_dimensional', 'non_cuda_aware'):
+            raise ValueError(
+                'gradient_compression is not available '
+                'at \'{}\' communicator.'.format(communicator_name))
+        from chainermn.communicators import gradient_compressors
+        gradient_compressor = gradient_compressors.create_gradient_compressor(
+            gradient_compression)
+
     if communicator_name == 'naive':
         from chainermn.communicators.naive_communicator \
             import NaiveCommunicator
-        return NaiveCommunicator(mpi_comm=mpi_comm)
+        return NaiveCommunicator(mpi_comm=mpi_comm,
+                                 gradient_compressor=gradient_compressor,
+                                 allreduce_algorithm=allreduce_algorithm)
 
     elif communicator_name == 'flat':
         from chainermn.communicators.flat_communicator \
             import FlatCommunicator
-        return FlatCommunicator(mpi_comm=mpi_comm)
+        return FlatCommunicator(mpi_comm=mpi_comm,
+                                gradient_compressor=gradient_compressor)
 
     elif communicator_name == 'hierarchical':
         from chainermn.communicators.hierarchical_communicator \
             import HierarchicalCommunicator
         warnings.warn('hierarchical communicator is deprecated.',
                       DeprecationWarning)
-        return HierarchicalCommunicator(mpi_comm=mpi_comm)
+        return HierarchicalCommunicator(
+            mpi_comm=mpi_comm, gradient_compressor=gradient_compressor)
 
     elif communicator_name == 'two_dimensional':
         from chainermn.communicators.two_dimensional_communicator \
             import TwoDimensionalCommunicator
         warnings.warn('two_dimensional communicator is deprecated.',
                       DeprecationWarning)
-        return TwoDimensionalCommunicator(mpi_comm=mpi_comm)
+        return TwoDimensionalCommunicator(
+            mpi_comm=mpi_comm, gradient_compressor=gradient_compressor)
 
     elif communicator_name == 'single_node':
         warnings.warn('single_node communicator is deprecated.',
@@ -128,7 +193,8 @@ def create_communicator(
     elif communicator_name == 'non_cuda_aware':
         from chainermn.communicators.non_cuda_aware_communicator \
             import NonCudaAwareCommunicator
-        return NonCudaAwareCommunicator(mpi_comm=mpi_comm)
+        return NonCudaAwareCommunicator(
+            mpi_comm=mpi_comm, gradient_compressor=gradient_compressor)
 
     elif communicator_name == 'pure_nccl':
         from chainermn.communicators.pure_nccl_communicator \
@@ -137,6 +203,11 @@ def create_communicator(
                                     allreduce_grad_dtype=allreduce_grad_dtype,
                                     batched_copy=batched_copy)
 
+    elif communicator_name == 'shared_memory':
+        from chainermn.communicators.shared_memory_communicator \
+            import SharedMemoryCommunicator
+        return SharedMemoryCommunicator(mpi_comm=mpi_comm)
+
     elif communicator_name == 'dummy':
         from chainermn.communicators.dummy_communicator \
             import DummyCommunicator
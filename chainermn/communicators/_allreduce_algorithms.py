@@ -0,0 +1,173 @@
+import mpi4py.MPI
+import numpy
+
+
+# Messages smaller than this (in bytes) are allreduced by recursive halving
+# and doubling, whose number of steps is logarithmic in the number of
+# processes, and larger ones by ring allreduce, which is bandwidth optimal.
+_small_message_size = 1 << 20
+
+algorithms = ('auto', 'ring', 'recursive_halving_doubling', 'hierarchical')
+
+
+def _chunk_bounds(n, n_chunks):
+    q, r = divmod(n, n_chunks)
+    bounds = [0]
+    for i in range(n_chunks):
+        bounds.append(bounds[-1] + q + (1 if i < r else 0))
+    return bounds
+
+
+def ring_allreduce(mpi_comm, buf):
+    """Sums a contiguous 1-D array over the processes in place by ring.
+
+    The array is split into as many chunks as the processes. The chunks are
+    reduce-scattered and then all-gathered along the ring, so that each
+    process sends and receives ``2 * (size - 1) / size`` times the array.
+
+    """
+    size = mpi_comm.size
+    rank = mpi_comm.rank
+    if size == 1:
+        return
+    bounds = _chunk_bounds(buf.size, size)
+    right = (rank + 1) % size
+    left = (rank - 1) % size
+    tmp = numpy.empty(bounds[1] - bounds[0], dtype=buf.dtype)
+
+    def chunk(i):
+        return buf[bounds[i]:bounds[i + 1]]
+
+    for step in range(size - 1):
+        recv_chunk = chunk((rank - step - 1) % size)
+        recv_buf = tmp[:recv_chunk.size]
+        mpi_comm.Sendrecv(chunk((rank - step) % size), right,
+                          recvbuf=recv_buf, source=left)
+        recv_chunk += recv_buf
+
+    for step in range(size - 1):
+        mpi_comm.Sendrecv(chunk((rank - step + 1) % size), right,
+                          recvbuf=chunk((rank - step) % size), source=left)
+
+
+def recursive_halving_doubling_allreduce(mpi_comm, buf):
+    """Sums a contiguous 1-D array over the processes in place.
+
+    This is the Rabenseifner's algorithm, which reduce-scatters the array by
+    recursive halving and all-gathers it by recursive doubling. When the
+    number of processes is not a power of two, the extra processes first send
+    their arrays to their neighbors and receive the results at the end.
+
+    """
+    size = mpi_comm.size
+    rank = mpi_comm.rank
+    if size == 1:
+        return
+    pof2 = 1 << (size.bit_length() - 1)
+    rem = size - pof2
+
+    if rank < 2 * rem:
+        if rank % 2 == 0:
+            mpi_comm.Send(buf, dest=rank + 1)
+            mpi_comm.Recv(buf, source=rank + 1)
+            return
+        tmp = numpy.empty_like(buf)
+        mpi_comm.Recv(tmp, source=rank - 1)
+        buf += tmp
+        new_rank = rank // 2
+    else:
+        new_rank = rank - rem
+
+    def to_rank(r):
+        return r * 2 + 1 if r < rem else r + rem
+
+    bounds = _chunk_bounds(buf.size, pof2)
+    lo, hi = 0, pof2
+    mask = pof2 >> 1
+    while mask > 0:
+        partner = to_rank(new_rank ^ mask)
+        mid = (lo + hi) // 2
+        if new_rank & mask:
+            send_lo, send_hi, lo = lo, mid, mid
+        else:
+            send_lo, send_hi, hi = mid, hi, mid
+        keep = buf[bounds[lo]:bounds[hi]]
+        tmp = numpy.empty_like(keep)
+        mpi_comm.Sendrecv(buf[bounds[send_lo]:bounds[send_hi]], partner,
+                          recvbuf=tmp, source=partner)
+        keep += tmp
+        mask >>= 1
+
+    mask = 1
+    while mask < pof2:
+        partner = to_rank(new_rank ^ mask)
+        if new_rank & mask:
+            recv_lo, recv_hi = lo - mask, lo
+        else:
+            recv_lo, recv_hi = hi, hi + mask
+        mpi_comm.Sendrecv(buf[bounds[lo]:bounds[hi]], partner,
+                          recvbuf=buf[bounds[recv_lo]:bounds[recv_hi]],
+                          source=partner)
+        lo, hi = min(lo, recv_lo), max(hi, recv_hi)
+        mask <<= 1
+
+    if rank < 2 * rem:
+        mpi_comm.Send(buf, dest=rank - 1)
+
+
+def _flat_allreduce(mpi_comm, buf):
+    if buf.nbytes < _small_message_size:
+        recursive_halving_doubling_allreduce(mpi_comm, buf)
+    else:
+        ring_allreduce(mpi_comm, buf)
+
+
+def hierarchical_allreduce(intra_mpi_comm, inter_mpi_comm, buf):
+    """Sums a contiguous 1-D array over the processes in place.
+
+    The arrays are first reduced to the first process of each node, which is
+    done by MPI through shared memory. The first processes then allreduce the
+    sums among the nodes, and broadcast the result within the nodes.
+
+    """
+    if intra_mpi_comm.rank == 0:
+        intra_mpi_comm.Reduce(mpi4py.MPI.IN_PLACE, buf, root=0)
+        _flat_allreduce(inter_mpi_comm, buf)
+    else:
+        intra_mpi_comm.Reduce(buf, None, root=0)
+    intra_mpi_comm.Bcast(buf, root=0)
+
+
+def select_algorithm(nbytes, intra_size, inter_size):
+    """Selects an allreduce algorithm from the message size and topology."""
+    if intra_size > 1 and inter_size > 1:
+        return 'hierarchical'
+    if nbytes < _small_message_size:
+        return 'recursive_halving_doubling'
+    return 'ring'
+
+
+def allreduce(comm, buf, algorithm):
+    """Sums a contiguous 1-D NumPy array over the processes in place.
+
+    Args:
+        comm: A ChainerMN communicator, which provides the MPI communicators
+            used for the point-to-point communication.
+        buf (numpy.ndarray): Array to be reduced.
+        algorithm (str): One of :data:`algorithms`.
+
+    """
+    mpi_comm, intra_mpi_comm, inter_mpi_comm = comm._get_private_mpi_comms()
+    if algorithm == 'auto':
+        algorithm = select_algorithm(
+            buf.nbytes, comm.intra_size, comm.inter_size)
+
+    if algorithm == 'ring':
+        ring_allreduce(mpi_comm, buf)
+    elif algorithm == 'recursive_halving_doubling':
+        recursive_halving_doubling_allreduce(mpi_comm, buf)
+    elif algorithm == 'hierarchical':
+        hierarchical_allreduce(intra_mpi_comm, inter_mpi_comm, buf)
+    else:
+        raise ValueError(
+            'Unrecognized allreduce algorithm: "{}"'.format(algorithm))
@@ -105,6 +105,55 @@ def inter_allreduce_gpu(
 
 INT_MAX = 2147483647
 
+# Contiguous buffers smaller than this are pickled in-band, since sending
+# them separately costs more than copying them.
+_min_out_of_band_nbytes = 64 * 1024
+
+
+def _dumps(obj):
+    """Pickles an object, separating its large buffers out-of-band.
+
+    With pickle protocol 5, the contiguous buffers in the object, e.g., the
+    data of numpy arrays, are not copied into the pickled bytes but returned
+    as a list of byte memoryviews, which can be sent by MPI without copies.
+    On Python older than 3.8, all the data is pickled in-band.
+
+    """
+    if pickle.HIGHEST_PROTOCOL < 5:
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), []
+
+    buffers = []
+
+    def buffer_callback(buf):
+        try:
+            raw = buf.raw()
+        except BufferError:
+            # Non-contiguous buffers are pickled in-band.
+            return True
+        if raw.nbytes < _min_out_of_band_nbytes:
+            return True
+        buffers.append(raw)
+        return False
+
+    pickled_bytes = pickle.dumps(
+        obj, protocol=5, buffer_callback=buffer_callback)
+    return pickled_bytes, buffers
+
+
+def _loads(pickled_bytes, buffers):
+    if not buffers:
+        return pickle.loads(pickled_bytes)
+    return pickle.loads(pickled_bytes, buffers=buffers)
+
+
+def _chunks(buf, max_buf_len):
+    for b in range(0, len(buf), max_buf_len):
+        yield buf[b:b + max_buf_len]
+
+
+def _empty_buffers(nbytes_list):
+    return [np.empty((nbytes,), dtype=np.uint8) for nbytes in nbytes_list]
+
 
 def chunked_bcast_obj(obj, mpi_comm, max_buf_len=256 * 1024 * 1024,
                       root=0):
@@ -118,6 +167,10 @@ def chunked_bcast_obj(obj, mpi_comm, max_buf_len=256 * 1024 * 1024,
     node will receive OverflowError from mpi4py. But in that case rank
     > 0 nodes shall block busy waiting forever at mpi_comm.bcast(obj).
 
+    The large buffers in the object, such as the data of numpy arrays, are
+    broadcast as raw buffers apart from the pickled bytes when pickle
+    protocol 5 is available.
+
     Args:
         obj: A Python object that is to be broadcasted.
         comm: ChainerMN communicator or MPI4py communicator.
@@ -140,37 +193,85 @@ def chunked_bcast_obj(obj, mpi_comm, max_buf_len=256 * 1024 * 1024,
     assert not (obj is not None and mpi_comm.rank != root)
 
     if obj is not None and mpi_comm.rank == root:
-        pickled_bytes = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        pickled_bytes, buffers = _dumps(obj)
+        data = (len(pickled_bytes), [buf.nbytes for buf in buffers])
     else:
-        pickled_bytes = bytearray()
-
-    total_bytes = len(pickled_bytes)
-    total_chunk_num = total_bytes // max_buf_len
-    if (total_bytes % max_buf_len) > 0:
-        total_chunk_num += 1
+        data = None
 
-    data = mpi_comm.bcast((total_chunk_num, max_buf_len, total_bytes))
+    data = mpi_comm.bcast(data, root=root)
     assert data is not None
-    (total_chunk_num, max_buf_len, total_bytes) = data
+    total_bytes, nbytes_list = data
+    if mpi_comm.rank != root:
+        pickled_bytes = bytearray(total_bytes)
+        buffers = _empty_buffers(nbytes_list)
 
-    for i in range(total_chunk_num):
-        b = i * max_buf_len
-        e = min(b + max_buf_len, total_bytes)
+    for buf in [memoryview(pickled_bytes)] + buffers:
+        for chunk in _chunks(buf, max_buf_len):
+            mpi_comm.Bcast(chunk, root=root)
 
-        if mpi_comm.rank == root:
-            buf = pickled_bytes[b:e]
-        else:
-            buf = bytearray(e - b)
+    if mpi_comm.rank != root:
+        obj = _loads(pickled_bytes, buffers)
+
+    return obj
 
-        mpi_comm.Bcast(buf, root=root)
 
-        if mpi_comm.rank != root:
-            pickled_bytes[b:e] = buf
+def send_obj(obj, mpi_comm, dest, tag=0, max_buf_len=256 * 1024 * 1024):
+    """Sends an object with its large buffers out-of-band.
 
-    if mpi_comm.rank > root:
-        obj = pickle.loads(pickled_bytes)
+    The pickled bytes are sent by ``mpi_comm.send``, followed by the raw
+    buffers in chunks of at most ``max_buf_len`` bytes.
 
-    return obj
+    """
+    pickled_bytes, buffers = _dumps(obj)
+    mpi_comm.send((pickled_bytes, [buf.nbytes for buf in buffers]),
+                  dest=dest, tag=tag)
+    for buf in buffers:
+        for chunk in _chunks(buf, max_buf_len):
+            mpi_comm.Send(chunk, dest=dest, tag=tag)
+
+
+def recv_obj(mpi_comm, source, tag=0, max_buf_len=256 * 1024 * 1024):
+    """Receives an object sent by :func:`send_obj`."""
+    pickled_bytes, nbytes_list = mpi_comm.recv(source=source, tag=tag)
+    buffers = _empty_buffers(nbytes_list)
+    for buf in buffers:
+        for chunk in _chunks(buf, max_buf_len):
+            mpi_comm.Recv(chunk, source=source, tag=tag)
+    return _loads(pickled_bytes, buffers)
+
+
+def gather_obj(obj, mpi_comm, root=0, max_buf_len=256 * 1024 * 1024):
+    """Gathers objects with their large buffers out-of-band.
+
+    The pickled bytes are gathered by ``mpi_comm.gather``, and then the
+    buffers are sent to the root by point-to-point communication. Thus,
+    ``mpi_comm`` must not be used for point-to-point communication by others
+    at the same time.
+
+    """
+    pickled_bytes, buffers = _dumps(obj)
+    data = mpi_comm.gather(
+        (pickled_bytes, [buf.nbytes for buf in buffers]), root=root)
+
+    if mpi_comm.rank != root:
+        for buf in buffers:
+            for chunk in _chunks(buf, max_buf_len):
+                mpi_comm.Send(chunk, dest=root)
+        return None
+
+    objs = []
+    for rank, (pickled_bytes, nbytes_list) in enumerate(data):
+        if rank == root:
+            # The buffers are copied so that the gathered object does not
+            # share the memory with the original one.
+            recv_buffers = [bytearray(buf) for buf in buffers]
+        else:
+            recv_buffers = _empty_buffers(nbytes_list)
+            for buf in recv_buffers:
+                for chunk in _chunks(buf, max_buf_len):
+                    mpi_comm.Recv(chunk, source=rank)
+        objs.append(_loads(pickled_bytes, recv_buffers))
+    return objs
 
 
 def _get_nccl_type_id(dtype):
@@ -94,6 +94,29 @@ def extract_params_set_grad(model):
             if param.grad is not None]
 
 
+def split_into_buckets(params, attr_name, bucket_size, itemsize=4):
+    """Splits parameters into buckets whose sizes are bounded.
+
+    The bucket size is measured in bytes of the arrays converted to the
+    transfer dtype of ``itemsize`` bytes. A parameter larger than
+    ``bucket_size`` forms a bucket by itself.
+    """
+    buckets = []
+    bucket = []
+    n_bytes = 0
+    for param in params:
+        size = getattr(param, attr_name).size * itemsize
+        if bucket and n_bytes + size > bucket_size:
+            buckets.append(bucket)
+            bucket = []
+            n_bytes = 0
+        bucket.append(param)
+        n_bytes += size
+    if bucket:
+        buckets.append(bucket)
+    return buckets
+
+
 def pack_params(params, attr_name, buffer,
                 transfer_dtype, stream=None):
     if len(params) == 0:
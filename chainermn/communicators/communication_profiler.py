@@ -0,0 +1,257 @@
+import collections
+import json
+import time
+
+import chainer
+from chainer.backends import cuda
+from chainer.training import extension
+
+
+def _nbytes(x):
+    if isinstance(x, chainer.Variable):
+        x = x.array
+    if isinstance(x, (tuple, list)):
+        return sum(_nbytes(a) for a in x)
+    if hasattr(x, 'nbytes') and hasattr(x, 'dtype'):
+        return int(x.nbytes)
+    return 0
+
+
+def _model_nbytes(model, attr):
+    return sum(_nbytes(getattr(param, attr)) for param in model.params()
+               if getattr(param, attr) is not None)
+
+
+def _arg(args, kwargs, index, name):
+    if len(args) > index:
+        return args[index]
+    return kwargs.get(name)
+
+
+# Functions which return the number of bytes communicated by a call from its
+# arguments and result. The methods of objects are not counted since their
+# pickled sizes are unknown.
+_profiled_methods = {
+    'allreduce_grad': lambda args, kwargs, result: _model_nbytes(
+        _arg(args, kwargs, 0, 'model'), 'grad'),
+    '_allreduce_grad_bucketed': lambda args, kwargs, result: _model_nbytes(
+        _arg(args, kwargs, 0, 'model'), 'grad'),
+    'bcast_data': lambda args, kwargs, result: _model_nbytes(
+        _arg(args, kwargs, 0, 'model'), 'data'),
+    'multi_node_mean': lambda args, kwargs, result: _nbytes(
+        _arg(args, kwargs, 1, 'array_b')),
+    'send': lambda args, kwargs, result: _nbytes(
+        _arg(args, kwargs, 0, 'data')),
+    'recv': lambda args, kwargs, result: _nbytes(result),
+    'alltoall': lambda args, kwargs, result: _nbytes(
+        _arg(args, kwargs, 0, 'xs')),
+    'bcast': lambda args, kwargs, result: _nbytes(result),
+    'gather': lambda args, kwargs, result: _nbytes(
+        _arg(args, kwargs, 0, 'x')),
+    'allgather': lambda args, kwargs, result: _nbytes(
+        _arg(args, kwargs, 0, 'x')),
+    'allreduce': lambda args, kwargs, result: _nbytes(
+        _arg(args, kwargs, 0, 'x')),
+    'scatter': lambda args, kwargs, result: _nbytes(result),
+    'send_obj': None,
+    'recv_obj': None,
+    'bcast_obj': None,
+    'gather_obj': None,
+    'allreduce_obj': None,
+}
+
+
+class CommunicationProfiler(object):
+
+    """Wrapper of a communicator which profiles its communication.
+
+    The profiler behaves as the given communicator, and records the elapsed
+    time and the number of bytes of each call of the communication methods,
+    e.g., ``allreduce_grad``, ``bcast_data``, ``multi_node_mean``,
+    ``alltoall`` and ``send``/``recv`` used by
+    :func:`chainermn.functions.send` and :func:`chainermn.functions.recv`.
+    Only the calls through the profiler are recorded, so it must be passed
+    to the optimizer, links and functions instead of the communicator::
+
+        comm = chainermn.create_communicator('pure_nccl')
+        comm = chainermn.communicators.CommunicationProfiler(
+            comm, synchronize=True, trace=True)
+        optimizer = chainermn.create_multi_node_optimizer(
+            chainer.optimizers.Adam(), comm)
+        ...
+        trainer.extend(comm.report_extension())
+        trainer.extend(extensions.LogReport())
+        trainer.run()
+        comm.dump_trace('trace.{rank}.json')
+
+    The statistics are reported to :mod:`chainer.reporter` by
+    :meth:`report` as ``<name>/<method>/time``, ``<name>/<method>/bytes``
+    and ``<name>/<method>/calls`` for each method, together with the total
+    time of the communication ``<name>/time`` and the ratio of it to the
+    elapsed time ``<name>/ratio``. The rest of the elapsed time is spent in
+    the computation, which is not overlapped with the blocking
+    communication.
+
+    Since the computation and some communicators, e.g., ``pure_nccl``, run
+    asynchronously on GPU, the time measured on the host does not include
+    the time of them unless ``synchronize`` is ``True``, where the current
+    device is synchronized before and after each call. Comparing the times
+    with and without the synchronization shows how much of the
+    communication is overlapped with the computation.
+
+    With ``trace=True``, the calls are also recorded as events of the trace
+    event format, which can be written by :meth:`dump_trace` for each
+    process and viewed by ``chrome://tracing``. The timestamps are the wall
+    clock times of the hosts, so that the events of the processes can be
+    merged into one timeline to find stragglers.
+
+    Args:
+        communicator: ChainerMN communicator to be profiled.
+        synchronize (bool): If ``True``, the current CUDA device is
+            synchronized before and after each call.
+        trace (bool): If ``True``, the events of the calls are recorded.
+        name (str): Prefix of the names of the reported values.
+
+    """
+
+    def __init__(self, communicator, synchronize=False, trace=False,
+                 name='comm'):
+        self.communicator = communicator
+        self.synchronize = synchronize
+        self.trace = trace
+        self.name = name
+        self.events = []
+
+        algorithm = type(communicator).__name__
+        allreduce_algorithm = getattr(communicator, 'allreduce_algorithm',
+                                      None)
+        if allreduce_algorithm is not None:
+            algorithm += '/' + allreduce_algorithm
+        compressor = getattr(communicator, 'gradient_compressor', None)
+        if compressor is not None:
+            algorithm += '/' + type(compressor).__name__
+        self.algorithm = algorithm
+
+        self._stats = collections.defaultdict(lambda: [0, 0, 0.])
+        self._start_time = time.time()
+
+    @property
+    def __class__(self):
+        # Makes ``isinstance`` checks of the communicator classes, e.g., by
+        # ``create_multi_node_optimizer``, pass through the profiler.
+        return self.communicator.__class__
+
+    def __getattr__(self, attr_name):
+        if attr_name == 'communicator':
+            # Avoids the infinite recursion before the initialization, e.g.,
+            # in unpickling.
+            raise AttributeError(attr_name)
+        value = getattr(self.communicator, attr_name)
+        if attr_name in _profiled_methods:
+            return self._profile(attr_name, value)
+        return value
+
+    def _synchronize(self):
+        if self.synchronize and cuda.available:
+            cuda.cupy.cuda.Device().synchronize()
+
+    def _profile(self, method_name, method):
+        count_bytes = _profiled_methods[method_name]
+
+        def profiled_method(*args, **kwargs):
+            self._synchronize()
+            start = time.time()
+            result = method(*args, **kwargs)
+            self._synchronize()
+            end = time.time()
+
+            nbytes = 0
+            if count_bytes is not None:
+                nbytes = count_bytes(args, kwargs, result)
+            stats = self._stats[method_name]
+            stats[0] += 1
+            stats[1] += nbytes
+            stats[2] += end - start
+            if self.trace:
+                self.events.append({
+                    'name': method_name, 'cat': 'communication', 'ph': 'X',
+                    'ts': start * 1e6, 'dur': (end - start) * 1e6,
+                    'pid': self.communicator.rank, 'tid': 0,
+                    'args': {'bytes': nbytes, 'algorithm': self.algorithm},
+                })
+            return result
+
+        return profiled_method
+
+    def get_stats(self):
+        """Returns the statistics since the last reset.
+
+        Returns:
+            dict: Dictionary from the names of the methods to the tuples of
+            the number of calls, the number of bytes and the total time in
+            seconds.
+
+        """
+        return {name: tuple(stats) for name, stats in self._stats.items()}
+
+    def reset(self):
+        """Clears the statistics and the events."""
+        self._stats.clear()
+        self.events = []
+        self._start_time = time.time()
+
+    def report(self):
+        """Reports the statistics since the last report and resets them.
+
+        The events for the trace are kept.
+
+        """
+        elapsed = time.time() - self._start_time
+        observation = {}
+        total_time = 0.
+        for method_name, (calls, nbytes, t) in self._stats.items():
+            prefix = '{}/{}/'.format(self.name, method_name)
+            observation[prefix + 'calls'] = calls
+            observation[prefix + 'bytes'] = nbytes
+            observation[prefix + 'time'] = t
+            total_time += t
+        observation[self.name + '/time'] = total_time
+        observation[self.name + '/ratio'] = total_time / max(elapsed, 1e-12)
+        chainer.reporter.report(observation)
+
+        self._stats.clear()
+        self._start_time = time.time()
+
+    def report_extension(self, trigger=(1, 'iteration')):
+        """Returns a trainer extension which calls :meth:`report`.
+
+        The extension has the priority of writers, so that the values are
+        reported before extensions such as ``LogReport`` read them.
+
+        Args:
+            trigger: Trigger of the extension.
+
+        Returns:
+            A trainer extension.
+
+        """
+        @extension.make_extension(
+            trigger=trigger, priority=extension.PRIORITY_WRITER)
+        def communication_profile(trainer):
+            self.report()
+
+        return communication_profile
+
+    def dump_trace(self, filename):
+        """Writes the recorded events in the trace event format.
+
+        Args:
+            filename (str): Name of the file, which is formatted with the
+                rank of the process as ``filename.format(rank=rank)``.
+
+        """
+        rank = self.communicator.rank
+        metadata = {'name': 'process_name', 'ph': 'M', 'pid': rank,
+                    'args': {'name': 'rank {}'.format(rank)}}
+        with open(filename.format(rank=rank), 'w') as f:
+            json.dump({'traceEvents': [metadata] + self.events}, f)
@@ -6,13 +6,17 @@ from chainermn.communicators import mpi_communicator_base
 
 class FlatCommunicator(mpi_communicator_base.MpiCommunicatorBase):
 
-    def __init__(self, mpi_comm):
-        super(FlatCommunicator, self).__init__(mpi_comm)
+    def __init__(self, mpi_comm, gradient_compressor=None):
+        super(FlatCommunicator, self).__init__(
+            mpi_comm, gradient_compressor=gradient_compressor)
 
         self.gpu_buffer_a = _memory_utility.DeviceMemory()
         self.gpu_buffer_b = _memory_utility.DeviceMemory()
 
     def allreduce_grad(self, model):
+        if self.gradient_compressor is not None:
+            self.gradient_compressor.allreduce_grad(self, model)
+            return
         params = _memory_utility.extract_params_set_grad(model)
         itemsize = 4
         n_elems_total = sum(param.grad.size for param in params)
@@ -0,0 +1,313 @@
+import mpi4py.MPI
+import numpy
+
+import chainer
+from chainer.backends import cuda
+from chainer.utils import array as array_utils
+
+
+def _extract_named_grads(model):
+    return [(name, param) for name, param in sorted(model.namedparams())
+            if param.grad is not None]
+
+
+def _pack(arrays, xp):
+    if not arrays:
+        return xp.empty((0,), dtype=numpy.float32)
+    return xp.concatenate([
+        array.ravel().astype(numpy.float32, copy=False) for array in arrays])
+
+
+def _unpack(buf, params):
+    offset = 0
+    for param in params:
+        grad = param.grad
+        grad[...] = buf[offset:offset + grad.size].reshape(grad.shape)
+        offset += grad.size
+
+
+def _to_device(host, like):
+    if isinstance(like, numpy.ndarray):
+        return host
+    return cuda.to_gpu(host, cuda.get_device_from_array(like))
+
+
+def _allreduce_mean(mpi_comm, x):
+    # The compressed data is communicated on host memory, so that the
+    # compressors work with every MPI communicator.
+    host = numpy.ascontiguousarray(cuda.to_cpu(x))
+    mpi_comm.Allreduce(mpi4py.MPI.IN_PLACE, host)
+    host *= 1.0 / mpi_comm.size
+    return _to_device(host, x)
+
+
+def _float16_sum(inbuf, outbuf, datatype):
+    x = numpy.frombuffer(inbuf, dtype=numpy.float16)
+    y = numpy.frombuffer(outbuf, dtype=numpy.float16)
+    y[...] = x.astype(numpy.float32) + y.astype(numpy.float32)
+
+
+_float16_sum_op = None
+
+
+def _get_float16_sum_op():
+    global _float16_sum_op
+    if _float16_sum_op is None:
+        _float16_sum_op = mpi4py.MPI.Op.Create(_float16_sum, commute=True)
+    return _float16_sum_op
+
+
+class GradientCompressor(object):
+
+    """Base class of gradient compressors.
+
+    A gradient compressor computes the mean of the gradients over the
+    processes by exchanging a compressed representation of them. It is given
+    to :func:`~chainermn.create_communicator` and used in ``allreduce_grad``
+    of the communicator instead of the dense allreduce.
+
+    Implementations should override :meth:`allreduce_grad`.
+
+    """
+
+    def allreduce_grad(self, comm, model):
+        """Replaces the gradients of the model by their mean over processes.
+
+        Args:
+            comm: ChainerMN communicator.
+            model (~chainer.Link): Link whose gradients are reduced.
+
+        """
+        raise NotImplementedError
+
+
+class _ErrorFeedback(object):
+
+    # Holds the residual of the compression of the gradients, which is added
+    # to the gradients of the next iteration.
+
+    def __init__(self):
+        self.key = None
+        self.residual = None
+
+    def apply(self, named_params, flat):
+        key = [(name, param.grad.shape) for name, param in named_params]
+        if key != self.key or self.residual is None:
+            self.key = key
+            self.residual = None
+            return flat
+        return flat + self.residual
+
+
+class FP16Compressor(GradientCompressor):
+
+    """Gradient compressor casting the gradients to float16.
+
+    The gradients are divided by the number of processes and cast to float16
+    before the allreduce, which halves the number of bytes communicated.
+    With error feedback, the rounding error is added to the gradients of the
+    next iteration.
+
+    Args:
+        error_feedback (bool): If ``True``, the rounding errors are
+            accumulated and fed back to the next iteration.
+
+    """
+
+    def __init__(self, error_feedback=True):
+        self.error_feedback = error_feedback
+        self._error_feedback = _ErrorFeedback()
+
+    def allreduce_grad(self, comm, model):
+        named_params = _extract_named_grads(model)
+        if not named_params:
+            return
+        params = [param for _, param in named_params]
+        xp = chainer.backend.get_array_module(params[0].grad)
+        flat = _pack([param.grad for param in params], xp)
+        if self.error_feedback:
+            flat = self._error_feedback.apply(named_params, flat)
+
+        size = comm.mpi_comm.size
+        compressed = (flat * (1.0 / size)).astype(numpy.float16)
+        if self.error_feedback:
+            self._error_feedback.residual = (
+                flat - compressed.astype(numpy.float32) * size)
+
+        host = numpy.ascontiguousarray(cuda.to_cpu(compressed))
+        comm.mpi_comm.Allreduce(
+            mpi4py.MPI.IN_PLACE, [host.view(numpy.int16), mpi4py.MPI.SHORT],
+            op=_get_float16_sum_op())
+        _unpack(_to_device(host.astype(numpy.float32), flat), params)
+
+
+class TopKCompressor(GradientCompressor):
+
+    """Gradient compressor sending the largest elements of the gradients.
+
+    Each process sends only the ``ratio`` fraction of the elements of the
+    gradients with the largest magnitude, together with their indices. The
+    elements not sent are accumulated as residuals and added to the
+    gradients of the next iteration, so that they are eventually sent.
+
+    Args:
+        ratio (float): Fraction of the elements sent by each process.
+
+    """
+
+    def __init__(self, ratio=0.01):
+        if not 0 < ratio <= 1:
+            raise ValueError('ratio must be in (0, 1]: {}'.format(ratio))
+        self.ratio = ratio
+        self._error_feedback = _ErrorFeedback()
+
+    def allreduce_grad(self, comm, model):
+        named_params = _extract_named_grads(model)
+        if not named_params:
+            return
+        params = [param for _, param in named_params]
+        xp = chainer.backend.get_array_module(params[0].grad)
+        flat = self._error_feedback.apply(
+            named_params, _pack([param.grad for param in params], xp))
+
+        n = flat.size
+        k = max(1, int(n * self.ratio))
+        indices = xp.argpartition(xp.abs(flat), n - k)[n - k:]
+        values = flat[indices]
+        residual = flat.copy()
+        residual[indices] = 0
+        self._error_feedback.residual = residual
+
+        mpi_comm = comm.mpi_comm
+        indices = cuda.to_cpu(indices).astype(numpy.int32)
+        values = numpy.ascontiguousarray(cuda.to_cpu(values))
+        all_indices = numpy.empty((mpi_comm.size, k), dtype=numpy.int32)
+        all_values = numpy.empty((mpi_comm.size, k), dtype=numpy.float32)
+        mpi_comm.Allgather(indices, all_indices)
+        mpi_comm.Allgather(values, all_values)
+
+        dense = numpy.zeros(n, dtype=numpy.float32)
+        array_utils.add_at(dense, all_indices.ravel(), all_values.ravel())
+        dense *= 1.0 / mpi_comm.size
+        _unpack(_to_device(dense, flat), params)
+
+
+class PowerSGDCompressor(GradientCompressor):
+
+    """Gradient compressor using low-rank approximation of the gradients.
+
+    The gradient of each parameter with two or more dimensions is reshaped to
+    a matrix and approximated by the product of two low-rank matrices
+    computed by a step of power iteration, which are averaged over the
+    processes instead of the gradient. The approximation error is added to
+    the gradient of the next iteration. The other gradients, and those of
+    the matrices too small to be compressed, are averaged as they are.
+
+    See: `PowerSGD: Practical Low-Rank Gradient Compression for Distributed
+    Optimization <https://arxiv.org/abs/1905.13727>`_
+
+    Args:
+        rank (int): Rank of the approximation.
+        seed (int): Random seed to initialize the right factors, which must
+            be the same among the processes.
+
+    """
+
+    def __init__(self, rank=4, seed=0):
+        if rank < 1:
+            raise ValueError('rank must be positive: {}'.format(rank))
+        self.rank = rank
+        self.seed = seed
+        self._qs = {}
+        self._residuals = {}
+
+    def _is_compressed(self, grad):
+        if grad.ndim < 2:
+            return False
+        n = grad.shape[0]
+        m = grad.size // n
+        return self.rank * (n + m) < n * m
+
+    def _get_q(self, name, m, like):
+        q = self._qs.get(name)
+        if q is None or q.shape[0] != m:
+            random_state = numpy.random.RandomState(self.seed)
+            q = random_state.standard_normal(
+                (m, self.rank)).astype(numpy.float32)
+            q = _to_device(q, like)
+        return q
+
+    def allreduce_grad(self, comm, model):
+        named_params = _extract_named_grads(model)
+        if not named_params:
+            return
+        xp = chainer.backend.get_array_module(named_params[0][1].grad)
+
+        matrices = []
+        others = []
+        for name, param in named_params:
+            if not self._is_compressed(param.grad):
+                others.append(param)
+                continue
+            grad = param.grad
+            mat = grad.reshape(grad.shape[0], -1).astype(numpy.float32)
+            residual = self._residuals.get(name)
+            if residual is not None and residual.shape == mat.shape:
+                mat = mat + residual
+            matrices.append((name, param, mat))
+
+        # The left factors are averaged together with the uncompressed
+        # gradients.
+        ps = [mat.dot(self._get_q(name, mat.shape[1], mat))
+              for name, _, mat in matrices]
+        flat = _allreduce_mean(
+            comm.mpi_comm, _pack(ps + [param.grad for param in others], xp))
+
+        offset = 0
+        qs = []
+        for i, (name, _, mat) in enumerate(matrices):
+            p = flat[offset:offset + ps[i].size].reshape(ps[i].shape)
+            offset += ps[i].size
+            ps[i], _ = xp.linalg.qr(p)
+            qs.append(mat.T.dot(ps[i]))
+        _unpack(flat[offset:], others)
+
+        if not matrices:
+            return
+        flat = _allreduce_mean(comm.mpi_comm, _pack(qs, xp))
+        offset = 0
+        for i, (name, param, mat) in enumerate(matrices):
+            q = flat[offset:offset + qs[i].size].reshape(qs[i].shape)
+            offset += qs[i].size
+            self._qs[name] = q
+            approx = ps[i].dot(q.T)
+            self._residuals[name] = mat - approx
+            param.grad[...] = approx.reshape(param.grad.shape)
+
+
+_compressors = {
+    'fp16': FP16Compressor,
+    'topk': TopKCompressor,
+    'powersgd': PowerSGDCompressor,
+}
+
+
+def create_gradient_compressor(gradient_compression):
+    """Creates a gradient compressor from its name.
+
+    Args:
+        gradient_compression: Name of the compressor (``'fp16'``,
+            ``'topk'`` or ``'powersgd'``) or an instance of
+            :class:`GradientCompressor`, which is returned as it is.
+
+    Returns:
+        GradientCompressor: The gradient compressor.
+
+    """
+    if isinstance(gradient_compression, GradientCompressor):
+        return gradient_compression
+    if gradient_compression not in _compressors:
+        raise ValueError(
+            'Unrecognized gradient compression: "{}"'.format(
+                gradient_compression))
+    return _compressors[gradient_compression]()
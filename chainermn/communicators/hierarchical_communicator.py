@@ -11,8 +11,9 @@ from chainermn import nccl
 
 class HierarchicalCommunicator(mpi_communicator_base.MpiCommunicatorBase):
 
-    def __init__(self, mpi_comm):
-        super(HierarchicalCommunicator, self).__init__(mpi_comm)
+    def __init__(self, mpi_comm, gradient_compressor=None):
+        super(HierarchicalCommunicator, self).__init__(
+            mpi_comm, gradient_compressor=gradient_compressor)
         if not nccl._available:
             raise RuntimeError(
                 'NCCL is not available. '
@@ -45,6 +46,9 @@ class HierarchicalCommunicator(mpi_communicator_base.MpiCommunicatorBase):
             intra_mpi_comm)
 
     def allreduce_grad(self, model):
+        if self.gradient_compressor is not None:
+            self.gradient_compressor.allreduce_grad(self, model)
+            return
         self._init_comms()
         stream = chainer.cuda.Stream.null
 
@@ -5,6 +5,7 @@ import chainer
 import chainer.backends
 import chainer.utils
 from chainer.utils import collections_abc
+from chainermn.communicators import _allreduce_algorithms
 from chainermn.communicators import _communication_utility
 from chainermn.communicators._communication_utility import chunked_bcast_obj
 from chainermn.communicators import _memory_utility
@@ -107,8 +108,11 @@ class MpiCommunicatorBase(communicator_base.CommunicatorBase):
 
     '''
 
-    def __init__(self, mpi_comm):
+    def __init__(self, mpi_comm, gradient_compressor=None):
         self.mpi_comm = mpi_comm
+        self.gradient_compressor = gradient_compressor
+        self.allreduce_algorithm = None
+        self._private_mpi_comms = None
         self._init_ranks()
 
     @property
@@ -510,10 +514,10 @@ class MpiCommunicatorBase(communicator_base.CommunicatorBase):
 
     # Objects
     def send_obj(self, obj, dest):
-        self.mpi_comm.send(obj, dest=dest)
+        _communication_utility.send_obj(obj, self.mpi_comm, dest)
 
     def recv_obj(self, source):
-        return self.mpi_comm.recv(source=source)
+        return _communication_utility.recv_obj(self.mpi_comm, source)
 
     def bcast_obj(self, obj, max_buf_len=256 * 1024 * 1024, root=0):
         return chunked_bcast_obj(obj, self.mpi_comm,
@@ -521,7 +525,8 @@ class MpiCommunicatorBase(communicator_base.CommunicatorBase):
                                  root=root)
 
     def gather_obj(self, obj, root=0):
-        return self.mpi_comm.gather(obj, root=root)
+        mpi_comm, _, _ = self._get_private_mpi_comms()
+        return _communication_utility.gather_obj(obj, mpi_comm, root=root)
 
     def scatter(self, xs, root=0):
         """A primitive of inter-process scatter communication.
@@ -632,6 +637,21 @@ class MpiCommunicatorBase(communicator_base.CommunicatorBase):
                     param.data = data.astype(numpy.float16)
 
     # Private methods
+    def _get_private_mpi_comms(self):
+        # Communicators private to this object, i.e., a duplicate of
+        # ``mpi_comm`` and its intra-node and inter-node splits, so that the
+        # messages of the allreduce algorithms, the shared memory and
+        # gather_obj do not match those of users.
+        if self._private_mpi_comms is None:
+            mpi_comm = self.mpi_comm.Dup()
+            self._private_mpi_comms = (
+                mpi_comm,
+                _communication_utility.init_intra_mpi_comm(
+                    mpi_comm, self.intra_rank, self.inter_rank),
+                _communication_utility.init_inter_mpi_comm(
+                    mpi_comm, self.intra_rank, self.inter_rank))
+        return self._private_mpi_comms
+
     def _init_ranks(self):
         my_ranks = _communication_utility.init_ranks(self.mpi_comm)
         assert my_ranks[0] == self.mpi_comm.rank
@@ -681,7 +701,14 @@ class MpiCommunicatorBase(communicator_base.CommunicatorBase):
             array_b32 = array_b
         buffer_b = _memory_utility.array_to_buffer_object(array_b32)
 
-        self.mpi_comm.Allreduce(buffer_a, buffer_b)
+        if (self.allreduce_algorithm is not None and
+                _is_numpy_array(buffer_b)):
+            if array_a is not None:
+                buffer_b[...] = buffer_a
+            _allreduce_algorithms.allreduce(
+                self, buffer_b, self.allreduce_algorithm)
+        else:
+            self.mpi_comm.Allreduce(buffer_a, buffer_b)
 
         if is_float16:
             xp = chainer.backend.get_array_module(array_b)
@@ -691,3 +718,40 @@ class MpiCommunicatorBase(communicator_base.CommunicatorBase):
 
         if chainer.is_debug():
             self.ensure_all_finite(array_b)
+
+    def _allreduce_grad_bucketed(self, model, bucket_size):
+        # Gradients are packed into size-bounded buckets, and a non-blocking
+        # allreduce is started for each bucket as soon as it is packed, so
+        # that packing and unpacking are overlapped with the communication
+        # of the other buckets. The buckets are made in the reverse order of
+        # the parameter names, which roughly follows the order in which the
+        # gradients are computed in backward; the order of the names is used
+        # since it is the same among the processes.
+        params = _memory_utility.extract_params_set_grad(model)[::-1]
+        buckets = _memory_utility.split_into_buckets(
+            params, 'grad', bucket_size)
+
+        requests = []
+        for bucket in buckets:
+            xp = chainer.backend.get_array_module(bucket[0].grad)
+            buf = xp.concatenate([
+                param.grad.ravel().astype(numpy.float32, copy=False)
+                for param in bucket])
+            if xp is not numpy:
+                chainer.cuda.Stream.null.synchronize()
+            request = self.mpi_comm.Iallreduce(
+                mpi4py.MPI.IN_PLACE,
+                _memory_utility.array_to_buffer_object(buf))
+            requests.append((request, buf, bucket))
+
+        for request, buf, bucket in requests:
+            request.Wait()
+            buf *= 1.0 / self.mpi_comm.size
+            offset = 0
+            for param in bucket:
+                grad = param.grad
+                grad[...] = buf[offset:offset + grad.size].reshape(grad.shape)
+                offset += grad.size
+
+            if chainer.is_debug():
+                self.ensure_all_finite(buf)
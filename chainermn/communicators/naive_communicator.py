@@ -1,12 +1,43 @@
+import numpy
+
+import chainer
+from chainermn.communicators import _allreduce_algorithms
 from chainermn.communicators import _memory_utility
 from chainermn.communicators import mpi_communicator_base
 
 
 class NaiveCommunicator(mpi_communicator_base.MpiCommunicatorBase):
 
-    def __init__(self, mpi_comm):
-        super(NaiveCommunicator, self).__init__(mpi_comm)
+    def __init__(self, mpi_comm, gradient_compressor=None,
+                 allreduce_algorithm=None):
+        super(NaiveCommunicator, self).__init__(
+            mpi_comm, gradient_compressor=gradient_compressor)
+        if (allreduce_algorithm is not None and
+                allreduce_algorithm not in _allreduce_algorithms.algorithms):
+            raise ValueError(
+                'Unrecognized allreduce algorithm: "{}"'.format(
+                    allreduce_algorithm))
+        self.allreduce_algorithm = allreduce_algorithm
 
     def allreduce_grad(self, model):
-        for param in _memory_utility.extract_params_set_grad(model):
-            self.multi_node_mean(None, param.grad)
+        if self.gradient_compressor is not None:
+            self.gradient_compressor.allreduce_grad(self, model)
+            return
+        params = _memory_utility.extract_params_set_grad(model)
+        if self.allreduce_algorithm is None or not params:
+            for param in params:
+                self.multi_node_mean(None, param.grad)
+            return
+
+        # The gradients are packed into a single buffer so that the
+        # allreduce algorithm runs only once.
+        xp = chainer.backend.get_array_module(params[0].grad)
+        buf = xp.concatenate([
+            param.grad.ravel().astype(numpy.float32, copy=False)
+            for param in params])
+        self.multi_node_mean(None, buf)
+        offset = 0
+        for param in params:
+            grad = param.grad
+            grad[...] = buf[offset:offset + grad.size].reshape(grad.shape)
+            offset += grad.size
@@ -13,8 +13,9 @@ from chainermn import nccl
 
 class NonCudaAwareCommunicator(mpi_communicator_base.MpiCommunicatorBase):
 
-    def __init__(self, mpi_comm):
-        super(NonCudaAwareCommunicator, self).__init__(mpi_comm)
+    def __init__(self, mpi_comm, gradient_compressor=None):
+        super(NonCudaAwareCommunicator, self).__init__(
+            mpi_comm, gradient_compressor=gradient_compressor)
         if not nccl._available:
             raise RuntimeError(
                 'NCCL is not available. '
@@ -66,6 +67,9 @@ class NonCudaAwareCommunicator(mpi_communicator_base.MpiCommunicatorBase):
                 data[:] = tmp_gpu
 
     def allreduce_grad(self, model):
+        if self.gradient_compressor is not None:
+            self.gradient_compressor.allreduce_grad(self, model)
+            return
         self._init_comms()
         stream = chainer.cuda.Stream.null
 
@@ -0,0 +1,141 @@
+import mpi4py.MPI
+import numpy
+
+import chainer
+from chainermn.communicators import _memory_utility
+from chainermn.communicators import mpi_communicator_base
+
+
+class SharedMemoryCommunicator(mpi_communicator_base.MpiCommunicatorBase):
+
+    """Communicator which reduces arrays on host memory shared in each node.
+
+    The processes in a node share a memory segment allocated by
+    ``MPI_Win_allocate_shared``, which consists of a row of each process and
+    a row of the result. Each process copies its array to its row, and then
+    reduces a slice of the rows to the result, so that the reduction is done
+    by all the processes in parallel without copies by MPI. If there are
+    multiple nodes, the slices of the results are allreduced by MPI among
+    the processes with the same ``intra_rank``. Finally, each process copies
+    the result to its array.
+
+    All the nodes must have the same number of processes.
+
+    """
+
+    def __init__(self, mpi_comm):
+        super(SharedMemoryCommunicator, self).__init__(mpi_comm)
+        if self.inter_size > 1:
+            intra_sizes = self.mpi_comm.allgather(self.intra_size)
+            if len(set(intra_sizes)) != 1:
+                raise ValueError(
+                    'shared_memory communicator requires the same number of '
+                    'processes on all nodes')
+        self._win = None
+        self._win_nbytes = 0
+
+    def _get_shared_buffer(self, nbytes):
+        # The window is collectively reallocated when it is too small. Since
+        # all the processes reduce arrays of the same size, they agree on
+        # the reallocation.
+        _, intra_mpi_comm, _ = self._get_private_mpi_comms()
+        if self._win_nbytes < nbytes:
+            if self._win is not None:
+                self._win.Unlock_all()
+                self._win.Free()
+            self._win_nbytes = max(nbytes, 2 * self._win_nbytes)
+            # The whole segment is allocated by intra_rank 0 so that it is
+            # contiguous.
+            self._win = mpi4py.MPI.Win.Allocate_shared(
+                self._win_nbytes if self.intra_rank == 0 else 0, 1,
+                comm=intra_mpi_comm)
+            self._win.Lock_all(mpi4py.MPI.MODE_NOCHECK)
+        buf, _ = self._win.Shared_query(0)
+        return numpy.frombuffer(buf, dtype=numpy.uint8, count=nbytes)
+
+    def _sync(self):
+        # Makes the stores to the shared memory visible to the other
+        # processes in the node.
+        _, intra_mpi_comm, _ = self._get_private_mpi_comms()
+        self._win.Sync()
+        intra_mpi_comm.Barrier()
+        self._win.Sync()
+
+    def _shared_memory_mean(self, array):
+        # Computes the mean of a contiguous 1-D float32 or float64 array in
+        # place.
+        _, intra_mpi_comm, inter_mpi_comm = self._get_private_mpi_comms()
+        n = array.size
+        intra_size = self.intra_size
+        shared = self._get_shared_buffer(
+            (intra_size + 1) * n * array.itemsize)
+        rows = shared.view(array.dtype).reshape(intra_size + 1, n)
+
+        rows[self.intra_rank] = array
+        self._sync()
+
+        begin = n * self.intra_rank // intra_size
+        end = n * (self.intra_rank + 1) // intra_size
+        result = rows[intra_size, begin:end]
+        numpy.sum(rows[:intra_size, begin:end], axis=0, out=result)
+        if self.inter_size > 1:
+            inter_mpi_comm.Allreduce(mpi4py.MPI.IN_PLACE, result)
+        result *= 1.0 / self.size
+        self._sync()
+
+        array[...] = rows[intra_size]
+        # The result must not be overwritten until all the processes copy
+        # it. The next call may reduce an array of another size, whose rows
+        # can overlap the result, so the processes wait for each other here.
+        intra_mpi_comm.Barrier()
+
+    def multi_node_mean(self, array_a, array_b):
+        if (not mpi_communicator_base._is_numpy_array(array_b) or
+                self.intra_size == 1):
+            super(SharedMemoryCommunicator, self).multi_node_mean(
+                array_a, array_b)
+            return
+
+        if chainer.is_debug():
+            self.check_ready_to_allreduce(array_a, array_b)
+
+        dtype = numpy.promote_types(array_b.dtype, numpy.float32)
+        src = array_b if array_a is None else array_a
+        buf = numpy.array(src, dtype=dtype, order='C').ravel()
+        self._shared_memory_mean(buf)
+        array_b[...] = buf.reshape(array_b.shape)
+
+        if chainer.is_debug():
+            self.ensure_all_finite(array_b)
+
+    def allreduce_grad(self, model):
+        params = _memory_utility.extract_params_set_grad(model)
+        if not params:
+            return
+        if any(not mpi_communicator_base._is_numpy_array(param.grad)
+               for param in params):
+            raise ValueError(
+                'shared_memory communicator supports only CPU arrays')
+
+        # The gradients are packed into a single buffer so that the
+        # processes are synchronized only twice.
+        dtype = numpy.float32
+        if any(param.grad.dtype == numpy.float64 for param in params):
+            dtype = numpy.float64
+        buf = numpy.concatenate([
+            param.grad.ravel().astype(dtype, copy=False)
+            for param in params])
+        if self.intra_size == 1:
+            self.mpi_comm.Allreduce(mpi4py.MPI.IN_PLACE, buf)
+            buf *= 1.0 / self.size
+        else:
+            self._shared_memory_mean(buf)
+
+        if chainer.is_debug():
+            self.ensure_all_finite(buf)
+
+        offset = 0
+        for param in params:
+            grad = param.grad
+            grad[...] = buf[offset:offset + grad.size].reshape(grad.shape)
+            offset += grad.size
@@ -12,9 +12,10 @@ from chainermn import nccl
 
 class TwoDimensionalCommunicator(mpi_communicator_base.MpiCommunicatorBase):
 
-    def __init__(self, mpi_comm=mpi4py.MPI.COMM_WORLD):
+    def __init__(self, mpi_comm=mpi4py.MPI.COMM_WORLD,
+                 gradient_compressor=None):
         super(TwoDimensionalCommunicator, self).__init__(
-            mpi_comm)
+            mpi_comm, gradient_compressor=gradient_compressor)
         if not nccl._available:
             raise RuntimeError(
                 'NCCL is not available. '
@@ -47,6 +48,9 @@ class TwoDimensionalCommunicator(mpi_communicator_base.MpiCommunicatorBase):
             intra_mpi_comm)
 
     def allreduce_grad(self, model):
+        if self.gradient_compressor is not None:
+            self.gradient_compressor.allreduce_grad(self, model)
+            return
         self._init_comms()
         stream = chainer.cuda.Stream.null
 
@@ -8,8 +8,73 @@ class DataSizeError(RuntimeError):
     pass
 
 
+def _get_permutation(n_total_samples, seed, epoch):
+    return numpy.random.RandomState([seed, epoch]).permutation(
+        n_total_samples)
+
+
+def _get_range(n_total_samples, rank, size):
+    n_sub_samples = (n_total_samples + size - 1) // size
+    b = n_total_samples * rank // size
+    return b, b + n_sub_samples
+
+
+class _ReshuffledSubDataset(chainer.datasets.SubDataset):
+
+    """Sub dataset whose examples are reshuffled among processes per epoch.
+
+    All the processes share the seed, so that they compute the same
+    permutation of the whole dataset at each epoch without communication,
+    and each of them takes its own interval of the permutation.
+
+    """
+
+    def __init__(self, dataset, start, finish, seed):
+        super(_ReshuffledSubDataset, self).__init__(
+            dataset, start, finish,
+            _get_permutation(len(dataset), seed, 0))
+        self._seed = seed
+        self._epoch = 0
+
+    def set_epoch(self, epoch):
+        """Reshuffles the examples for the given epoch.
+
+        It must be called with the same epoch by all the processes.
+
+        Args:
+            epoch (int): The epoch number.
+
+        """
+        if epoch != self._epoch:
+            self._order = _get_permutation(
+                len(self._dataset), self._seed, epoch)
+            self._epoch = epoch
+
+
+def _scatter_index(dataset, comm, root, shuffle, seed):
+    n_total_samples = len(dataset)
+    if shuffle and seed is None and comm.rank == root:
+        seed = numpy.random.randint(2 ** 31)
+    data = None
+    if comm.rank == root:
+        data = (n_total_samples, seed)
+    root_n_total_samples, seed = comm.bcast_obj(data, root=root)
+    if n_total_samples != root_n_total_samples:
+        raise ValueError(
+            'The length of the dataset must be the same among the processes '
+            'when scatter_index is True: {} at rank {} while {} at root '
+            'rank {}'.format(n_total_samples, comm.rank,
+                             root_n_total_samples, root))
+
+    b, e = _get_range(n_total_samples, comm.rank, comm.size)
+    if shuffle:
+        return _ReshuffledSubDataset(dataset, b, e, seed)
+    return chainer.datasets.SubDataset(dataset, b, e)
+
+
 def scatter_dataset(dataset, comm, root=0, shuffle=False,
-                    seed=None, max_buf_len=256 * 1024 * 1024):
+                    seed=None, max_buf_len=256 * 1024 * 1024,
+                    scatter_index=False):
     """Scatter the given dataset to the workers in the communicator.
 
     The dataset of worker 0 (i.e., the worker whose ``comm.rank`` is 0) is
@@ -32,12 +97,26 @@ def scatter_dataset(dataset, comm, root=0, shuffle=False,
             If ``None``, the permutation is changed randomly.
         max_buf_len (int): Max buffer size to be used at broadcasting
             binaries. Must not be larger than 2147483647.
+        scatter_index (bool): If ``True``, the dataset is not broadcast, and
+            only the lengths of the datasets and the seed are communicated.
+            Every worker must give the same dataset that can be opened
+            locally (e.g., a dataset of file paths or a memory-mapped
+            array), and each worker takes its own subset of it. If
+            ``shuffle`` is also ``True``, the returned dataset has
+            ``set_epoch(epoch)`` method, which reshuffles the examples among
+            the workers without moving data when called with the same epoch
+            by all the workers, e.g., by an extension like
+            ``trainer.extend(lambda t: dataset.set_epoch(t.updater.epoch),
+            trigger=(1, 'epoch'))``.
     Returns:
         Scattered dataset.
     """
 
     assert 0 <= root and root < comm.size
 
+    if scatter_index:
+        return _scatter_index(dataset, comm, root, shuffle, seed)
+
     order = None
     if shuffle and dataset is not None:
         n_total_samples = len(dataset)
@@ -55,11 +134,9 @@ def scatter_dataset(dataset, comm, root=0, shuffle=False,
     if comm.rank == root:
         mine = None
         n_total_samples = len(dataset)
-        n_sub_samples = (n_total_samples + comm.size - 1) // comm.size
 
         for i in range(comm.size):
-            b = n_total_samples * i // comm.size
-            e = b + n_sub_samples
+            b, e = _get_range(n_total_samples, i, comm.size)
 
             if i == root:
                 mine = chainer.datasets.SubDataset(dataset, b, e, order)
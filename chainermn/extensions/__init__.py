@@ -1,3 +1,7 @@
 from chainermn.extensions.allreduce_persistent import AllreducePersistent  # NOQA
 from chainermn.extensions.checkpoint import create_multi_node_checkpointer  # NOQA
 from chainermn.extensions.multi_node_evaluator import create_multi_node_evaluator  # NOQA
+from chainermn.extensions.metrics import BinaryAUCMetric  # NOQA
+from chainermn.extensions.metrics import ConfusionMatrixMetric  # NOQA
+from chainermn.extensions.metrics import MeanMetric  # NOQA
+from chainermn.extensions.metrics import Metric  # NOQA
@@ -1,16 +1,19 @@
 import errno
+import io
 import os
 import shutil
 import tempfile
 import time
 
+import numpy
+
 import chainer
 from chainer.training import extension
 from chainer.utils import experimental
 
 
 def create_multi_node_checkpointer(name, comm, cp_interval=5,
-                                   gc_interval=5, path=None):
+                                   gc_interval=5, path=None, elastic=False):
     '''Create multi-node checkpointer object
 
     Generational snapshot extension to allow fault tolerance;
@@ -61,15 +64,42 @@ def create_multi_node_checkpointer(name, comm, cp_interval=5,
             ...
             checkpointer.save(obj_you_want_to_snap)  # Make a checkpoint
 
+    With ``elastic=True``, the job can be resumed with a different number of
+    processes, e.g., when it is restarted on the surviving nodes after some
+    nodes are lost. Since a failed process cannot be removed from a running
+    MPI job, the job is expected to be aborted (see
+    :mod:`chainermn.global_except_hook`) and relaunched by a script like::
+
+        until mpiexec -n $NPROCS python train.py; do
+            NPROCS=...  # The number of the available processes
+        done
+
+    Since the model and the optimizer are the same among the processes of
+    data parallel training, any snapshot of the latest iteration among the
+    processes is consistent. If the number of processes is changed or some
+    processes do not have their snapshots, ``maybe_load`` broadcasts a
+    snapshot of the latest iteration from a process which can read it, and
+    loads it except the positions of the iterators, whose datasets are
+    expected to be scattered again to the new processes by
+    :func:`~chainermn.scatter_dataset`. The iterators restart at the
+    beginning of the epoch of the snapshot. The learning rate can be scaled
+    by the ratio of the numbers of the processes by ``lr_attr`` of
+    ``maybe_load``.
+
     Args:
         name (str): unique id of the run
         comm: communicater in ChainerMN
         cp_interval (int): minimum number of checkpoints to preserve
         gc_interval (int): interval to collect non-preserved checkpoints
+        path (str): directory of the snapshots. ``trainer.out`` is used if
+            ``None``.
+        elastic (bool): If ``True``, the job can be resumed with a different
+            number of processes.
 
     '''
     experimental('chainermn.extensions.create_multi_node_checkpointer')
-    return _MultiNodeCheckpointer(name, comm, cp_interval, gc_interval, path)
+    return _MultiNodeCheckpointer(name, comm, cp_interval, gc_interval, path,
+                                  elastic)
 
 
 class _CheckpointStats(object):
@@ -102,11 +132,15 @@ class _CheckpointStats(object):
 
 class _MultiNodeCheckpointer(extension.Extension):
 
-    def __init__(self, name, comm, cp_interval, gc_interval, path):
+    def __init__(self, name, comm, cp_interval, gc_interval, path,
+                 elastic=False):
         self.name = name
         self.cp_interval = cp_interval
         self.gc_interval = gc_interval
         self.comm = comm
+        self.elastic = elastic
+        self._lr_optimizer = None
+        self._lr_attr = None
         self.files = []
         self.stats = _CheckpointStats()
 
@@ -151,8 +185,12 @@ class _MultiNodeCheckpointer(extension.Extension):
 
         filename = self._filename(iteration)
 
+        if self._lr_optimizer is not None:
+            lr = getattr(self._lr_optimizer, self._lr_attr)
+        else:
+            lr = None
         self.stats.start()
-        _save(self.path, filename, target)
+        _save(self.path, filename, _Snapshot(target, self.comm.size, lr))
         self.stats.end()
 
         self.files.append(filename)
@@ -231,14 +269,15 @@ class _MultiNodeCheckpointer(extension.Extension):
     def _filenames(self, iterations):
         return [self._filename(i) for i in iterations]
 
-    def _filename(self, iteration):
+    def _filename(self, iteration, rank=None):
         # TODO(kuenishi): As a node identifier, should we use node
         # name (e.g. hostname) or MPI rank?
         #
         # hostname is fine when MPI rank changes among same set of nodes.
         # MPI rank is fine when node fails and a new node has come.
-        filename = '{:s}.{:d}.{:d}'.format(
-            self.name, self.comm.rank, iteration)
+        if rank is None:
+            rank = self.comm.rank
+        filename = '{:s}.{:d}.{:d}'.format(self.name, rank, iteration)
         return filename
 
     def _parse_filenames(self, filenames):
@@ -254,9 +293,34 @@ class _MultiNodeCheckpointer(extension.Extension):
             return
         return name, int(rank), int(iter)
 
-    def maybe_load(self, trainer, optimizer=None, path=None):
+    def _list_snapshots(self):
+        # Returns the pairs of the ranks and the iterations of the snapshots
+        # of this run in the directory.
+        local_files = []
+        try:
+            local_files = os.listdir(self.path)
+        except Exception:
+            # Maybe I am the only process that does not have result
+            # directory
+            pass
+        snapshots = filter(None, self._parse_filenames(local_files))
+        return [(rank, i) for name, rank, i in snapshots
+                if name == self.name]
+
+    def maybe_load(self, trainer, optimizer=None, path=None, lr_attr=None):
         '''If there's existing model, load, sync, and resume.
 
+        Args:
+            trainer: Object to be loaded, mostly a trainer.
+            optimizer: Multi node optimizer of the training.
+            path (str): Directory of the snapshots, which is used if
+                ``path`` is not given to the checkpointer.
+            lr_attr (str): Name of the learning rate of ``optimizer``, such
+                as ``'lr'`` or ``'alpha'``, which is used only if the
+                checkpointer is elastic. The learning rate is saved in the
+                snapshots, and it is restored multiplied by the ratio of the
+                current number of processes to that of the snapshot.
+
         '''
         if self.path is None:
             if path is not None:
@@ -264,16 +328,12 @@ class _MultiNodeCheckpointer(extension.Extension):
             else:
                 self.path = trainer.out
 
-        local_files = []
-        try:
-            local_files = os.listdir(self.path)
-        except Exception:
-            # Maybe I am the only process that does not have result
-            # directory
-            pass
-        local_iters = filter(None, self._parse_filenames(local_files))
-        local_iters = [i for name, rank, i in local_iters if name ==
-                       self.name and rank == self.comm.rank]
+        if self.elastic:
+            self._maybe_load_elastic(trainer, optimizer, lr_attr)
+            return
+
+        local_iters = [i for rank, i in self._list_snapshots()
+                       if rank == self.comm.rank]
 
         self.files = self._filenames(local_iters)
         # Collect common file list
@@ -299,6 +359,126 @@ class _MultiNodeCheckpointer(extension.Extension):
                 # from rank 0.
                 optimizer.__setattr__('needs_broadcast', False)
 
+    def _maybe_load_elastic(self, trainer, optimizer, lr_attr):
+        comm = self.comm
+        if optimizer is not None and lr_attr is not None:
+            # The hyperparameter is saved in the snapshots since optimizers
+            # do not serialize their hyperparameters.
+            self._lr_optimizer = optimizer
+            self._lr_attr = lr_attr
+        snapshots = self._list_snapshots()
+
+        # Agree on the latest iteration among the snapshots readable by any
+        # process.
+        all_snapshots = comm.gather_obj(snapshots)
+        if comm.rank == 0:
+            iters = [i for s in all_snapshots for _, i in s]
+            latest = [max(iters)] if iters else []
+        else:
+            latest = None
+        latest = comm.bcast_obj(latest)
+        self.files = self._filenames(
+            [i for rank, i in snapshots if rank == comm.rank])
+        if not latest:
+            self._sync_file_list()
+            return
+        latest = latest[0]
+
+        # The snapshots are loaded as usual if all processes have their
+        # snapshots of the latest iteration taken with the same number of
+        # processes.
+        readable = sorted(rank for rank, i in snapshots if i == latest)
+        if comm.rank in readable:
+            metadata = _load_metadata(self.path, self._filename(latest))
+        else:
+            metadata = None
+        states = comm.gather_obj((metadata, readable))
+        if comm.rank == 0:
+            complete = all(m is not None and m[0] in (None, comm.size)
+                           for m, _ in states)
+            source = min(r for r, (_, rs) in enumerate(states) if rs)
+            # Older snapshots do not have the number of processes, which is
+            # guessed from the ranks of the snapshots.
+            guessed_size = max(r for s in all_snapshots for r, i in s
+                               if i == latest) + 1
+            plan = [complete, source, guessed_size]
+        else:
+            plan = None
+        complete, source, guessed_size = comm.bcast_obj(plan)
+
+        if complete:
+            _load(self.path, self._filename(latest), trainer)
+        else:
+            # A snapshot is broadcast from a process which can read it. Its
+            # own snapshot is preferred if it exists.
+            if comm.rank == source:
+                rank = comm.rank if comm.rank in readable else readable[0]
+                filename = self._filename(latest, rank)
+                metadata = _load_metadata(self.path, filename)
+                with open(os.path.join(self.path, filename), 'rb') as f:
+                    data = numpy.frombuffer(f.read(), dtype=numpy.uint8)
+                obj = (metadata, data)
+            else:
+                obj = None
+            metadata, data = comm.bcast_obj(obj, root=source)
+            chainer.serializers.load_npz(
+                io.BytesIO(data.tobytes()), trainer,
+                ignore_names=_is_iterator_position)
+
+        saved_size, saved_lr = metadata
+        if saved_size is None:
+            saved_size = comm.size if complete else guessed_size
+        if self._lr_optimizer is not None:
+            if saved_lr is None:
+                saved_lr = getattr(optimizer, lr_attr)
+            setattr(optimizer, lr_attr,
+                    saved_lr * float(comm.size) / saved_size)
+
+        self._sync_file_list()
+        if optimizer is not None:
+            # All processes loaded the same model.
+            optimizer.__setattr__('needs_broadcast', False)
+
+
+class _Snapshot(object):
+
+    """Adds the metadata of the training to the snapshot of a target."""
+
+    def __init__(self, target, comm_size, lr=None):
+        self.target = target
+        self.comm_size = comm_size
+        self.lr = lr
+
+    def serialize(self, serializer):
+        self.target.serialize(serializer)
+        serializer(_comm_size_key, self.comm_size)
+        if self.lr is not None:
+            serializer(_lr_key, self.lr)
+
+
+_comm_size_key = '_chainermn_comm_size'
+_lr_key = '_chainermn_lr'
+
+
+def _load_metadata(path, filename):
+    # Returns the number of processes and the learning rate saved in a
+    # snapshot, which are None if they are not saved.
+    with numpy.load(os.path.join(path, filename)) as f:
+        comm_size = lr = None
+        if _comm_size_key in f.files:
+            comm_size = int(f[_comm_size_key])
+        if _lr_key in f.files:
+            lr = float(f[_lr_key])
+        return comm_size, lr
+
+
+def _is_iterator_position(key):
+    # The positions of the iterators are not restored when the dataset is
+    # scattered to a different number of processes, while their epochs are.
+    names = key.split('/')
+    return (any(name.startswith('iterator:') for name in names[:-1]) and
+            names[-1] not in ('epoch', 'is_new_epoch'))
+
 
 def _load(path, filename, target):
     chainer.serializers.load_npz(os.path.join(path, filename), target)
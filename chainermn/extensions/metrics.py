@@ -0,0 +1,159 @@
+import chainer
+import numpy
+
+
+def _to_cpu(x):
+    if isinstance(x, chainer.Variable):
+        x = x.array
+    return numpy.asarray(chainer.cuda.to_cpu(x))
+
+
+class Metric(object):
+
+    """Base class of mergeable accumulators of evaluation metrics.
+
+    A metric accumulates the statistics of the examples in a fixed-size
+    float64 array :attr:`state`, which is summed over the processes by
+    :func:`~chainermn.create_multi_node_evaluator`. Then :meth:`compute`
+    computes the metric from the merged state. Metrics which are not means,
+    e.g., AUC, can be implemented as long as their statistics are additive.
+
+    Args:
+        size (int): Size of the state.
+
+    """
+
+    def __init__(self, size):
+        self.state = numpy.zeros((size,), dtype=numpy.float64)
+
+    def reset(self):
+        """Clears the statistics."""
+        self.state[...] = 0
+
+    def update(self, *args, **kwargs):
+        """Accumulates the statistics of a batch."""
+        raise NotImplementedError
+
+    def compute(self):
+        """Computes the metric from the statistics.
+
+        Returns:
+            A float or a dictionary of floats.
+
+        """
+        raise NotImplementedError
+
+
+class MeanMetric(Metric):
+
+    """Weighted mean of values."""
+
+    def __init__(self):
+        super(MeanMetric, self).__init__(2)
+
+    def update(self, value, weight=1):
+        """Adds a value (or the sum of values) with its weight."""
+        self.state[0] += float(_to_cpu(value).sum()) * weight
+        self.state[1] += weight
+
+    def compute(self):
+        return self.state[0] / self.state[1]
+
+
+class ConfusionMatrixMetric(Metric):
+
+    """Confusion matrix of a classification.
+
+    :meth:`compute` returns the accuracy and the mean of the per-class
+    recalls, and the matrix is available as :attr:`matrix`.
+
+    Args:
+        n_classes (int): Number of the classes.
+        ignore_label (int): Label to be ignored.
+
+    """
+
+    def __init__(self, n_classes, ignore_label=-1):
+        super(ConfusionMatrixMetric, self).__init__(n_classes * n_classes)
+        self.n_classes = n_classes
+        self.ignore_label = ignore_label
+
+    @property
+    def matrix(self):
+        """Matrix whose ``(i, j)`` element counts class ``i`` predicted as
+        class ``j``."""
+        return self.state.reshape(self.n_classes, self.n_classes)
+
+    def update(self, y, t):
+        """Adds predictions.
+
+        Args:
+            y: Scores of the classes of shape ``(N, n_classes)`` or the
+                predicted labels of shape ``(N,)``.
+            t: True labels of shape ``(N,)``.
+
+        """
+        y = _to_cpu(y)
+        t = _to_cpu(t).ravel().astype(numpy.int64)
+        if y.ndim == 2:
+            y = y.argmax(axis=1)
+        y = y.ravel().astype(numpy.int64)
+        mask = t != self.ignore_label
+        indices = t[mask] * self.n_classes + y[mask]
+        self.state += numpy.bincount(indices, minlength=self.state.size)
+
+    def compute(self):
+        matrix = self.matrix
+        n_examples = matrix.sum(axis=1)
+        valid = n_examples > 0
+        recalls = matrix.diagonal()[valid] / n_examples[valid]
+        return {
+            'accuracy': matrix.trace() / matrix.sum(),
+            'mean_recall': recalls.mean(),
+        }
+
+
+class BinaryAUCMetric(Metric):
+
+    """Area under the ROC curve of a binary classification.
+
+    The scores are accumulated to the histograms of the positive and negative
+    examples, so the AUC is approximated with the resolution of the bins.
+
+    Args:
+        n_bins (int): Number of the bins of the histograms.
+        score_range (tuple of floats): Range of the scores.
+
+    """
+
+    def __init__(self, n_bins=1000, score_range=(0., 1.)):
+        super(BinaryAUCMetric, self).__init__(2 * n_bins)
+        self.n_bins = n_bins
+        self.score_range = score_range
+
+    def update(self, y, t):
+        """Adds predictions.
+
+        Args:
+            y: Scores of shape ``(N,)``, higher for the positive class.
+            t: Labels of shape ``(N,)``, where nonzero values are positive.
+
+        """
+        y = _to_cpu(y).ravel()
+        t = _to_cpu(t).ravel() != 0
+        low, high = self.score_range
+        bins = ((y - low) / (high - low) * self.n_bins).astype(numpy.int64)
+        bins = numpy.clip(bins, 0, self.n_bins - 1)
+        self.state[:self.n_bins] += numpy.bincount(
+            bins[~t], minlength=self.n_bins)
+        self.state[self.n_bins:] += numpy.bincount(
+            bins[t], minlength=self.n_bins)
+
+    def compute(self):
+        negatives = self.state[:self.n_bins]
+        positives = self.state[self.n_bins:]
+        # Counts the pairs whose positive score is higher, and the half of
+        # those in the same bin.
+        lower_negatives = numpy.cumsum(negatives) - negatives
+        n_pairs = (positives * (lower_negatives + 0.5 * negatives)).sum()
+        return n_pairs / (positives.sum() * negatives.sum())
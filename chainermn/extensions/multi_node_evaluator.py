@@ -1,17 +1,101 @@
+import chainer
+import numpy
 import six
 
 
-def create_multi_node_evaluator(actual_evaluator, communicator):
+def _reduce_results(communicator, local_mean_dict, n_batches, metrics):
+    # The names and sizes of the values are agreed among the processes, since
+    # a process may not report some values, e.g., if its shard is empty.
+    local_layout = [(name, int(numpy.size(value)))
+                    for name, value in local_mean_dict.items()]
+    layout = sorted(set(communicator.allreduce_obj(local_layout)))
+    if len(set(name for name, _ in layout)) != len(layout):
+        raise ValueError('Sizes of the reported values must be the same '
+                         'among the processes')
+
+    # The means are weighted by the numbers of the batches, and reduced
+    # together with the weights and the states of the metrics.
+    bufs = []
+    for name, size in layout:
+        if name in local_mean_dict:
+            value = numpy.asarray(chainer.cuda.to_cpu(local_mean_dict[name]),
+                                  dtype=numpy.float64)
+            bufs.append(value.ravel() * n_batches)
+            bufs.append(numpy.full((1,), n_batches, dtype=numpy.float64))
+        else:
+            bufs.append(numpy.zeros((size + 1,), dtype=numpy.float64))
+    for _, metric in sorted(metrics.items()):
+        bufs.append(metric.state)
+    buf = numpy.concatenate(bufs) if bufs else numpy.zeros((0,))
+    communicator.multi_node_mean(None, buf)
+    buf *= communicator.size
+
+    result = {}
+    offset = 0
+    for name, size in layout:
+        weight = buf[offset + size]
+        if weight > 0:
+            value = buf[offset:offset + size] / weight
+            local_value = local_mean_dict.get(name)
+            if local_value is not None and numpy.ndim(local_value) > 0:
+                result[name] = value.reshape(numpy.shape(local_value))
+            elif size == 1:
+                result[name] = value[0]
+            else:
+                result[name] = value
+        offset += size + 1
+    for name, metric in sorted(metrics.items()):
+        metric.state[...] = buf[offset:offset + metric.state.size]
+        offset += metric.state.size
+        value = metric.compute()
+        if isinstance(value, dict):
+            for key, v in value.items():
+                result['{}/{}'.format(name, key)] = v
+        else:
+            result[name] = value
+    return result
+
+
+def create_multi_node_evaluator(actual_evaluator, communicator, metrics=None):
     """Create a multi node evaluator from a normal evaluator.
 
     Actually this method patches the evaluator to work in multi node
     environment. This method adds several hidden attributes starting
     with `_mn_` prefix.
 
+    The results of the processes are reduced by an allreduce of an array
+    without pickling them. Each mean in the results is weighted by the
+    number of the batches evaluated by the process, so the processes can
+    evaluate uneven shards of the dataset, e.g., those of
+    :func:`~chainermn.scatter_dataset` without ``force_equal_length``.
+
+    Metrics which are not means can be evaluated by passing
+    :class:`~chainermn.extensions.Metric` objects, which are updated by the
+    model (or ``eval_func``) in the evaluation loop::
+
+        auc = chainermn.extensions.BinaryAUCMetric()
+
+        def eval_func(x, t):
+            y = model.predictor(x)
+            auc.update(F.sigmoid(y), t)
+
+        evaluator = chainermn.create_multi_node_evaluator(
+            extensions.Evaluator(test_iter, model, eval_func=eval_func),
+            comm, metrics={'validation/main/auc': auc})
+
+    The metrics are reset before the evaluation, and their states are
+    reduced together with the means. If :meth:`Metric.compute` returns a
+    dictionary, its items are added to the results with the keys prefixed
+    by the name of the metric. Metrics cannot be used with an evaluator
+    with ``n_processes``, since they would be updated in the worker
+    processes.
+
     Args:
         actual_evaluator: evaluator to be patched
             (e.g., ``chainer.training.extensions.Evaluator``)
         communicator: ChainerMN communicator
+        metrics (dict): Metric objects to be reduced, keyed by their names in
+            the results.
 
     Returns:
         The multi-node patched ``actual_evaluator``.
@@ -21,18 +105,45 @@ def create_multi_node_evaluator(actual_evaluator, communicator):
 
     """
 
+    if metrics and getattr(actual_evaluator, '_n_processes', None) is not None:
+        raise ValueError('metrics cannot be updated in the worker processes '
+                         'of an evaluator with n_processes')
+
     actual_evaluator._mn_original_evaluate = actual_evaluator.evaluate
     actual_evaluator._mn_communicator = communicator
+    actual_evaluator._mn_metrics = {} if metrics is None else metrics
 
     def new_evaluate(self):
-        local_mean_dict = self._mn_original_evaluate()
-        global_mean_dict = {
-            name:
-            self._mn_communicator.allreduce_obj(
-                value) / self._mn_communicator.size
-            for name, value in sorted(local_mean_dict.items())
-        }
-        return global_mean_dict
+        for metric in self._mn_metrics.values():
+            metric.reset()
+
+        # Evaluator records the number of the evaluated batches, which is
+        # used unless evaluate is overridden.
+        self._n_batches = None
+        if hasattr(self, 'eval_func'):
+            # Counts the batches with a wrapper of eval_func otherwise.
+            original_eval_func = self.eval_func
+            eval_func = original_eval_func or self.get_target('main')
+            n_batches = [0]
+
+            def counting_eval_func(*args, **kwargs):
+                n_batches[0] += 1
+                return eval_func(*args, **kwargs)
+
+            self.eval_func = counting_eval_func
+            try:
+                local_mean_dict = self._mn_original_evaluate()
+            finally:
+                self.eval_func = original_eval_func
+            n_batches = n_batches[0]
+        else:
+            local_mean_dict = self._mn_original_evaluate()
+            n_batches = 1
+        if self._n_batches is not None:
+            n_batches = self._n_batches
+
+        return _reduce_results(self._mn_communicator, local_mean_dict,
+                               n_batches, self._mn_metrics)
 
     actual_evaluator.evaluate = six.create_bound_method(
         new_evaluate, actual_evaluator)
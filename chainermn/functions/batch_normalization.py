@@ -19,6 +19,30 @@ def _xhat(x, mean, std, expander):
     return x_mu
 
 
+def _get_stats_dtype(gamma):
+    # The sums are not computed in float16 to avoid overflow.
+    return numpy.promote_types(gamma.dtype, numpy.float32)
+
+
+def _pack_stats(axis, gamma, x, xp, buf):
+    # The sum, the squared sum and the number of the elements are packed, so
+    # that the statistics are reduced by one collective even if the batch
+    # sizes differ among the workers.
+    x.sum(axis=axis, out=buf[:gamma.size], dtype=buf.dtype)
+    xp.square(x, dtype=buf.dtype).sum(axis=axis, out=buf[gamma.size:-1])
+    buf[-1] = x.size // gamma.size
+
+
+def _unpack_stats(gamma, xp, buf):
+    # The elements are averaged over the workers, which cancels in the
+    # division by the averaged count.
+    count = buf[-1]
+    mean = buf[:gamma.size] / count
+    sqmean = buf[gamma.size:-1] / count
+    var = sqmean - xp.square(mean)
+    return mean.astype(gamma.dtype), var.astype(gamma.dtype), count
+
+
 class _MultiNodeBatchNormalizationBackend(six.with_metaclass(ABCMeta)):
 
     @abstractmethod
@@ -36,16 +60,12 @@ class _MpiBackend(_MultiNodeBatchNormalizationBackend):
         self.comm = comm
 
     def forward(self, axis, gamma, x, xp):
-        tmp = xp.empty(gamma.size * 2, dtype=gamma.dtype)
-        x.mean(axis=axis, out=tmp[:gamma.size], dtype=gamma.dtype)
-        xp.square(x).mean(axis=axis, out=tmp[gamma.size:], dtype=gamma.dtype)
+        tmp = xp.empty(gamma.size * 2 + 1, dtype=_get_stats_dtype(gamma))
+        _pack_stats(axis, gamma, x, xp, tmp)
         if xp is cuda.cupy:
             chainer.cuda.Stream.null.synchronize()
         self.comm.multi_node_mean(None, tmp)
-        mean = tmp[:gamma.size]
-        sqmean = tmp[gamma.size:]
-        var = sqmean - xp.square(mean)
-        return mean, var
+        return _unpack_stats(gamma, xp, tmp)
 
     def backward(self, axis, gamma, gy, x_hat, x, xp):
         tmp = xp.empty(gamma.size * 2, dtype=gamma.dtype)
@@ -69,30 +89,24 @@ class _NcclBackend(_MultiNodeBatchNormalizationBackend):
         self.memory_utility_module = memory_utility_module
 
     def forward(self, axis, gamma, x, xp):
-        gpu_buffer_n_elems = gamma.size * 2
-        gpu_buffer_size = gamma.dtype.itemsize * gpu_buffer_n_elems
+        stats_dtype = _get_stats_dtype(gamma)
+        gpu_buffer_n_elems = gamma.size * 2 + 1
+        gpu_buffer_size = stats_dtype.itemsize * gpu_buffer_n_elems
         gpu_buffer_a = self.memory_utility_module.DeviceMemory()
         gpu_buffer_b = self.memory_utility_module.DeviceMemory()
         gpu_buffer_a.assign(gpu_buffer_size)
         gpu_buffer_b.assign(gpu_buffer_size)
         gpu_buffer_a_array = gpu_buffer_a.array(
-            gpu_buffer_n_elems, dtype=gamma.dtype)
-        x.mean(axis=axis, out=gpu_buffer_a_array[:gamma.size],
-               dtype=gamma.dtype)
-        xp.square(x).mean(axis=axis, out=gpu_buffer_a_array[gamma.size:],
-                          dtype=gamma.dtype)
+            gpu_buffer_n_elems, dtype=stats_dtype)
+        _pack_stats(axis, gamma, x, xp, gpu_buffer_a_array)
         self.comm.multi_node_mean_nccl(gpu_buffer_a,
                                        gpu_buffer_b,
                                        gpu_buffer_n_elems,
-                                       gamma.dtype)
+                                       stats_dtype)
         gpu_buffer_a_array = gpu_buffer_a.array(
             gpu_buffer_n_elems,
-            dtype=gamma.dtype)
-
-        mean = gpu_buffer_a_array[:gamma.size]
-        sqmean = gpu_buffer_a_array[gamma.size:]
-        var = sqmean - xp.square(mean)
-        return mean, var
+            dtype=stats_dtype)
+        return _unpack_stats(gamma, xp, gpu_buffer_a_array)
 
     def backward(self, axis, gamma, gy, x_hat, x, xp):
         gpu_buffer_n_elems = gamma.size * 2
@@ -232,7 +246,9 @@ class MultiNodeBatchNormalizationFunction(function.Function):
 
         if chainer.configuration.config.train:
             axis = (0,) + tuple(range(head_ndim, x.ndim))
-            mean, var = self._backend.forward(axis, gamma, x, xp)
+            mean, var, count = self._backend.forward(axis, gamma, x, xp)
+            # Number of the elements per channel averaged over the workers.
+            self.count = float(count)
             var += self.eps
         else:
             mean = self.fixed_mean
@@ -259,7 +275,7 @@ class MultiNodeBatchNormalizationFunction(function.Function):
             # will do this for us, so
             # only run following code if cuDNN was not used.
             # Update running statistics:
-            m = x.size // gamma.size
+            m = self.count * self.comm.size
             adjust = m / max(m - 1., 1.)  # unbiased estimation
             if xp is numpy:
                 self.running_mean *= self.decay
@@ -311,6 +327,9 @@ class MultiNodeBatchNormalizationFunction(function.Function):
 
         # Note: If length of inputs is not 5, we must be in train mode.
         assert chainer.configuration.config.train
+        # The gradients of beta and gamma are averaged over the workers, and
+        # so is the number of the elements.
+        m = gamma.dtype.type(self.count)
         gbeta, ggamma = self._backend.backward(axis, gamma, gy,
                                                self.x_hat, x, xp)
 
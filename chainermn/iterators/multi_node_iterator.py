@@ -1,5 +1,20 @@
 import chainer
 import numpy
+from six.moves import range
+
+
+# A message consists of a header of ``_header_length`` int64 values and a
+# payload in which the arrays of a batch are concatenated. The header starts
+# with the control fields (the flags, the state of the iterator, the size of
+# the payload and the number of arrays), followed by ``_max_arrays`` array
+# fields each holding the dtype character code, ``ndim`` and the shape.
+_max_arrays = 2
+_max_ndim = 8
+_array_field_offset = 10
+_array_field_length = 2 + _max_ndim
+_header_length = _array_field_offset + _max_arrays * _array_field_length
+_header_nbytes = _header_length * 8
+_alignment = 8
 
 
 def _is_valid_type(element):
@@ -12,22 +27,164 @@ def _is_valid_type(element):
     return False
 
 
-def _build_ctrl_msg(stop, is_valid_data_type, is_paired_dataset, is_new_epoch,
-                    current_position):
-    ctrl_msg = numpy.ones((5,)) * [int(stop), int(is_valid_data_type),
-                                   int(is_paired_dataset), int(is_new_epoch),
-                                   int(current_position)]
-    return ctrl_msg.astype(numpy.float32)
+def _aligned(nbytes):
+    return (nbytes + _alignment - 1) // _alignment * _alignment
+
+
+def _build_header(stop, is_valid_data_type, is_paired_dataset, is_new_epoch,
+                  current_position, epoch, previous_epoch_detail, arrays):
+    header = numpy.zeros((_header_length,), dtype=numpy.int64)
+    header[:6] = [int(stop), int(is_valid_data_type), int(is_paired_dataset),
+                  int(is_new_epoch), int(current_position), int(epoch)]
+    if previous_epoch_detail is None:
+        previous_epoch_detail = numpy.nan
+    header[6:7].view(numpy.float64)[0] = previous_epoch_detail
+    payload_nbytes = 0
+    for i, array in enumerate(arrays):
+        offset = _array_field_offset + i * _array_field_length
+        header[offset] = ord(array.dtype.char)
+        header[offset + 1] = array.ndim
+        header[offset + 2:offset + 2 + array.ndim] = array.shape
+        payload_nbytes += _aligned(array.nbytes)
+    header[7] = payload_nbytes
+    header[8] = len(arrays)
+    return header
+
+
+def _parse_header(header):
+    stop = bool(header[0])
+    is_valid_data_type = bool(header[1])
+    is_paired_dataset = bool(header[2])
+    is_new_epoch = bool(header[3])
+    current_position = int(header[4])
+    epoch = int(header[5])
+    previous_epoch_detail = float(header[6:7].view(numpy.float64)[0])
+    if numpy.isnan(previous_epoch_detail):
+        previous_epoch_detail = None
+    specs = []
+    for i in range(int(header[8])):
+        offset = _array_field_offset + i * _array_field_length
+        ndim = int(header[offset + 1])
+        shape = tuple(int(s) for s in header[offset + 2:offset + 2 + ndim])
+        specs.append((numpy.dtype(chr(int(header[offset]))), shape))
+    return stop, is_valid_data_type, is_paired_dataset, is_new_epoch, \
+        current_position, epoch, previous_epoch_detail, specs
+
+
+def _batch_to_arrays(batch):
+    first_elem = batch[0]
+    is_valid_data_type = _is_valid_type(first_elem)
+    is_paired_dataset = isinstance(batch, list) \
+        and isinstance(first_elem, tuple) and len(first_elem) == 2
+    if not is_valid_data_type:
+        return False, is_paired_dataset, []
+
+    if is_paired_dataset:
+        _xs, _ys = zip(*batch)
+        arrays = [numpy.asarray(_xs), numpy.asarray(_ys)]
+    else:
+        arrays = [numpy.asarray(batch)]
+    if any(array.dtype.hasobject or array.ndim > _max_ndim
+           for array in arrays):
+        return False, is_paired_dataset, []
+    return True, is_paired_dataset, arrays
+
+
+def _arrays_to_batch(is_paired_dataset, arrays):
+    if is_paired_dataset:
+        return list(zip(*arrays))
+    return arrays[0].tolist()
+
+
+class _MessageBuffer(object):
+
+    """Reusable buffer of the messages broadcast by a multi node iterator.
+
+    A message is broadcast together with ``capacity`` bytes of the payload.
+    The rest of a larger payload is broadcast separately, after which the
+    capacity is extended. Master and slaves update the capacity in the same
+    way so that the sizes of the broadcasts agree.
+
+    """
+
+    def __init__(self):
+        self.capacity = 0
+        self.array = numpy.empty((_header_nbytes,), dtype=numpy.uint8)
+
+    @property
+    def header(self):
+        return self.array[:_header_nbytes].view(numpy.int64)
+
+    @property
+    def message(self):
+        return self.array[:_header_nbytes + self.capacity]
+
+    def payload(self, nbytes):
+        return self.array[_header_nbytes:_header_nbytes + nbytes]
+
+    def reserve(self, payload_nbytes):
+        nbytes = _header_nbytes + max(self.capacity, payload_nbytes)
+        if self.array.size < nbytes:
+            array = numpy.empty((nbytes,), dtype=numpy.uint8)
+            array[:self.array.size] = self.array
+            self.array = array
+
+    def pack(self, header, arrays):
+        self.reserve(int(header[7]))
+        self.header[...] = header
+        offset = _header_nbytes
+        for array in arrays:
+            array = numpy.ascontiguousarray(array).ravel().view(numpy.uint8)
+            self.array[offset:offset + array.size] = array
+            offset += _aligned(array.size)
+
+    def unpack(self, specs):
+        # The arrays are copied out, since the buffer is reused for the next
+        # message.
+        arrays = []
+        offset = _header_nbytes
+        for dtype, shape in specs:
+            nbytes = dtype.itemsize * int(numpy.prod(shape))
+            array = self.array[offset:offset + nbytes].view(dtype)
+            arrays.append(array.reshape(shape).copy())
+            offset += _aligned(nbytes)
+        return arrays
+
+    def wait(self, request, communicator, root):
+        request.Wait()
+        payload_nbytes = int(self.header[7])
+        if payload_nbytes > self.capacity:
+            self.reserve(payload_nbytes)
+            communicator.mpi_comm.Bcast(
+                self.array[_header_nbytes + self.capacity:
+                           _header_nbytes + payload_nbytes], root=root)
+            self.capacity = max(payload_nbytes, 2 * self.capacity)
+        return _parse_header(self.header)
+
+
+class _StateOverridingSerializer(chainer.serializer.Serializer):
+
+    """Serializer that saves the given state instead of the iterator's.
+
+    The values of the keys in ``state`` are saved in place of those given by
+    the iterator, while the iterator gets its own values back so that its
+    state is left as is.
+
+    """
+
+    def __init__(self, serializer, state):
+        self.serializer = serializer
+        self.state = state
 
+    def __getitem__(self, key):
+        return _StateOverridingSerializer(self.serializer[key], {})
 
-def _parse_ctrl_msg(msg):
-    stop = bool(msg[0])
-    is_valid_data_type = bool(msg[1])
-    is_paired_dataset = bool(msg[2])
-    is_new_epoch = bool(msg[3])
-    current_position = int(msg[4])
-    return stop, is_valid_data_type, is_paired_dataset, is_new_epoch,\
-        current_position
+    def __call__(self, key, value):
+        if key in self.state:
+            self.serializer(key, self.state[key])
+        else:
+            self.serializer(key, value)
+        return value
 
 
 class _MultiNodeIteratorMaster(chainer.dataset.iterator.Iterator):
@@ -40,6 +197,17 @@ class _MultiNodeIteratorMaster(chainer.dataset.iterator.Iterator):
         super(_MultiNodeIteratorMaster, self).__setattr__(
             'rank_master', rank_master)
 
+        # The next batch is fetched from ``actual_iterator`` and broadcast
+        # while the current one is used, so that ``actual_iterator`` is one
+        # batch ahead of this iterator. The state of ``actual_iterator``
+        # before fetching the next batch, i.e., the state after the batch
+        # last returned, is kept to be reported and serialized.
+        super(_MultiNodeIteratorMaster, self).__setattr__(
+            '_buffer', _MessageBuffer())
+        super(_MultiNodeIteratorMaster, self).__setattr__('_request', None)
+        super(_MultiNodeIteratorMaster, self).__setattr__('_next_batch', None)
+        super(_MultiNodeIteratorMaster, self).__setattr__('_last_state', None)
+
         _dataset_size = numpy.ones((1, )).astype(numpy.float32) \
             * len(self.actual_iterator.dataset)
         # TODO(tsutsumi): potential deadlock?
@@ -54,24 +222,56 @@ class _MultiNodeIteratorMaster(chainer.dataset.iterator.Iterator):
                 -numpy.ones((1, )).astype(numpy.float32),
                 root=self.rank_master)
 
-    def __next__(self):
+    def _get_actual_state(self):
+        actual_iterator = self.actual_iterator
+        order = actual_iterator._state.order
+        return {
+            'current_position': actual_iterator.current_position,
+            'epoch': actual_iterator.epoch,
+            'is_new_epoch': actual_iterator.is_new_epoch,
+            'previous_epoch_detail': actual_iterator.previous_epoch_detail,
+            'order': order,
+            '_order': order,
+        }
+
+    def _post(self):
+        self._last_state = self._get_actual_state()
         try:
             batch = self.actual_iterator.__next__()
-            first_elem = batch[0]
-            is_valid_data_type = _is_valid_type(first_elem)
-            is_paired_dataset = isinstance(batch, list) \
-                and isinstance(first_elem, tuple) and len(first_elem) == 2
+            is_valid_data_type, is_paired_dataset, arrays = \
+                _batch_to_arrays(batch)
             stop = False
         except StopIteration:
+            batch = None
             stop = True
             is_valid_data_type = False
             is_paired_dataset = False
+            arrays = []
+
+        header = _build_header(
+            stop, is_valid_data_type, is_paired_dataset,
+            self.actual_iterator.is_new_epoch,
+            self.actual_iterator.current_position,
+            self.actual_iterator.epoch,
+            self.actual_iterator.previous_epoch_detail, arrays)
+        self._buffer.pack(header, arrays)
+        self._next_batch = batch
+
+        self._request = self.communicator.mpi_comm.Ibcast(
+            self._buffer.message, root=self.rank_master)
+
+    def _wait(self):
+        parsed = self._buffer.wait(
+            self._request, self.communicator, self.rank_master)
+        self._request = None
+        return parsed
 
-        is_new_epoch = self.actual_iterator.is_new_epoch
-        ctrl_msg = _build_ctrl_msg(stop, is_valid_data_type, is_paired_dataset,
-                                   is_new_epoch,
-                                   self.actual_iterator.current_position)
-        self.communicator.bcast(ctrl_msg, root=self.rank_master)
+    def __next__(self):
+        if self._request is None:
+            self._post()
+        batch = self._next_batch
+        stop, is_valid_data_type, is_paired_dataset, _, _, _, _, specs = \
+            self._wait()
 
         if stop:
             raise StopIteration
@@ -80,18 +280,11 @@ class _MultiNodeIteratorMaster(chainer.dataset.iterator.Iterator):
                             'or tuple of scalars as the data type '
                             'of the batch element only.')
 
-        if is_paired_dataset:
-            _xs, _ys = zip(*batch)
-            xs = numpy.asarray(_xs, dtype=numpy.float32)
-            ys = numpy.asarray(_ys, dtype=numpy.float32)
-            self.communicator.bcast(xs, root=self.rank_master)
-            self.communicator.bcast(ys, root=self.rank_master)
-            return batch
-        else:
-            if isinstance(batch, list):
-                batch = numpy.array(batch)
-            batch = self.communicator.bcast(batch, root=self.rank_master)
-            return batch.tolist()
+        if batch is None or not is_paired_dataset:
+            batch = _arrays_to_batch(
+                is_paired_dataset, self._buffer.unpack(specs))
+        self._post()
+        return batch
 
     next = __next__
 
@@ -101,21 +294,52 @@ class _MultiNodeIteratorMaster(chainer.dataset.iterator.Iterator):
     def __setattr_(self, attr_name, value):
         setattr(self.actual_iterator, attr_name, value)
 
+    def _get_state(self, attr_name):
+        # Until the first batch, the state is that of ``actual_iterator``.
+        if self._last_state is None:
+            return getattr(self.actual_iterator, attr_name)
+        return self._last_state[attr_name]
+
     @property
     def current_position(self):
-        return self.actual_iterator.current_position
+        return self._get_state('current_position')
+
+    @property
+    def epoch(self):
+        return self._get_state('epoch')
 
     @property
     def epoch_detail(self):
-        return self.actual_iterator.epoch_detail
+        if self._last_state is None:
+            return self.actual_iterator.epoch_detail
+        return self.epoch + 1. * self.current_position / len(
+            self.actual_iterator.dataset)
+
+    @property
+    def previous_epoch_detail(self):
+        return self._get_state('previous_epoch_detail')
 
     @property
     def is_new_epoch(self):
-        return self.actual_iterator.is_new_epoch
+        return self._get_state('is_new_epoch')
 
     def serialize(self, serializer):
         # Master's and Slave's serialize must be called at the same time.
-        self.actual_iterator.serialize(serializer)
+        if isinstance(serializer, chainer.serializer.Deserializer):
+            # The batch being broadcast is discarded, and the iteration
+            # restarts from the loaded state of ``actual_iterator``.
+            if self._request is not None:
+                self._wait()
+            self._next_batch = None
+            self._last_state = None
+            self.actual_iterator.serialize(serializer)
+        elif self._last_state is None:
+            self.actual_iterator.serialize(serializer)
+        else:
+            # Since ``actual_iterator`` is one batch ahead, the state after
+            # the batch last returned is saved in its place.
+            self.actual_iterator.serialize(
+                _StateOverridingSerializer(serializer, self._last_state))
         self.communicator.bcast_obj(
             serializer, root=self.rank_master)
 
@@ -131,6 +355,11 @@ class _MultiNodeIteratorSlave(chainer.dataset.iterator.Iterator):
         self.epoch = 0
         self.current_position = 0
         self.is_new_epoch = False
+        self.previous_epoch_detail = None
+
+        # The next batch is received while the current one is used.
+        self._buffer = _MessageBuffer()
+        self._request = None
 
         # TODO(tsutsumi): potential deadlock?
         _size = self.communicator.bcast(None, root=self.rank_master)
@@ -140,14 +369,31 @@ class _MultiNodeIteratorSlave(chainer.dataset.iterator.Iterator):
         if self._order[0] == -1:
             self._order = None
 
-    def __next__(self):
-        # Check if master iterator received stop signal.
-        ctrl_msg = self.communicator.bcast(None, root=self.rank_master)
-        stop, is_valid_data_type, is_paired_dataset, self.is_new_epoch, \
-            self.current_position = _parse_ctrl_msg(ctrl_msg)
+    def _post(self):
+        self._request = self.communicator.mpi_comm.Ibcast(
+            self._buffer.message, root=self.rank_master)
+
+    def _wait(self):
+        parsed = self._buffer.wait(
+            self._request, self.communicator, self.rank_master)
+        self._request = None
+        return parsed
 
-        if self.is_new_epoch:
-            self.epoch += 1
+    def _set_state(self, is_new_epoch, current_position, epoch,
+                   previous_epoch_detail):
+        self.is_new_epoch = is_new_epoch
+        self.current_position = current_position
+        self.epoch = epoch
+        self.previous_epoch_detail = previous_epoch_detail
+
+    def __next__(self):
+        if self._request is None:
+            self._post()
+        stop, is_valid_data_type, is_paired_dataset, is_new_epoch, \
+            current_position, epoch, previous_epoch_detail, specs = \
+            self._wait()
+        self._set_state(is_new_epoch, current_position, epoch,
+                        previous_epoch_detail)
 
         if stop:
             raise StopIteration
@@ -155,13 +401,10 @@ class _MultiNodeIteratorSlave(chainer.dataset.iterator.Iterator):
             raise TypeError('Multi node iterator supports ndarray '
                             'or tuple of scalars as the data type '
                             'of the batch element only.')
-        if is_paired_dataset:
-            xs = self.communicator.bcast(None, root=self.rank_master)
-            ys = self.communicator.bcast(None, root=self.rank_master)
-            return list(zip(xs, ys.astype(numpy.int32)))
-        else:
-            batch = self.communicator.bcast(None, root=self.rank_master)
-            return batch.tolist()
+
+        batch = _arrays_to_batch(is_paired_dataset, self._buffer.unpack(specs))
+        self._post()
+        return batch
 
     @property
     def epoch_detail(self):
@@ -169,6 +412,10 @@ class _MultiNodeIteratorSlave(chainer.dataset.iterator.Iterator):
 
     def serialize(self, serializer):
         # Master's and Slave's serialize must be called at the same time.
+        is_loading = isinstance(serializer, chainer.serializer.Deserializer)
+        if is_loading and self._request is not None:
+            # The batch being broadcast is discarded.
+            self._wait()
         _serializer = self.communicator.bcast_obj(
             None, root=self.rank_master)
 
@@ -225,8 +472,17 @@ def create_multi_node_iterator(
     on extremely large dataset, you can also consider to use
     ``chainermn.iterators.create_synchronized_iterator``.
 
-    Current multi node iterator supports numpy.float32 or tuple of
-    numpy.float32 as the data type of the batch element.
+    Each batch is packed into a single contiguous buffer with a header of
+    the dtypes and shapes of the arrays, and is broadcast without pickling.
+    The broadcast is non-blocking and issued one batch ahead, i.e., the next
+    batch is fetched from ``actual_iterator`` and transferred while the
+    current one is in use. ``serialize`` saves the state after the batch
+    last returned in the format of ``actual_iterator``, so that the snapshot
+    can also be loaded into ``actual_iterator`` itself.
+
+    Current multi node iterator supports ndarray or tuple of two ndarrays
+    (or scalars) of non-object dtypes as the batch element. The batch
+    elements of each process have the same dtypes as those of the master.
 
     .. note:: ``create_multi_node_iterator`` and ``serialize`` of created
               iterators must be called at the same time by master and slaves,
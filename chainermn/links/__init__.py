@@ -2,3 +2,8 @@ from chainermn.links.batch_normalization import MultiNodeBatchNormalization  # N
 from chainermn.links.create_mnbn_model import create_mnbn_model  # NOQA
 from chainermn.links.multi_node_chain_list import MultiNodeChainList  # NOQA
 from chainermn.links.n_step_rnn import create_multi_node_n_step_rnn  # NOQA
+from chainermn.links.pipeline_parallel import create_schedule  # NOQA
+from chainermn.links.pipeline_parallel import MultiNodePipelineChain  # NOQA
+from chainermn.links.tensor_parallel import MultiNodeColumnShardedLinear  # NOQA
+from chainermn.links.tensor_parallel import MultiNodeRowShardedLinear  # NOQA
+from chainermn.links.tensor_parallel import MultiNodeShardedEmbedID  # NOQA
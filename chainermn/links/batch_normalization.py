@@ -43,12 +43,18 @@ class MultiNodeBatchNormalization(link.Link):
         communication_backend (str): ``mpi``, ``nccl`` or ``auto``. It is used
             to determine communication backend. If ``auto``, use the best
             communication backend for each communicator.
+        sync_interval (int): Interval of the iterations in which the batch
+            stats are shared among the workers. In the other iterations, the
+            stats of the local batch are used without communication, and the
+            running averages are not updated so that they are kept the same
+            among the workers. ``1`` (the default) shares the stats in every
+            iteration.
     """
 
     def __init__(self, size, comm, decay=0.9, eps=2e-5, dtype=None,
                  use_gamma=True, use_beta=True,
                  initial_gamma=None, initial_beta=None,
-                 communication_backend='auto'):
+                 communication_backend='auto', sync_interval=1):
         chainer.utils.experimental(
             'chainermn.links.MultiNodeBatchNormalization')
 
@@ -64,6 +70,10 @@ class MultiNodeBatchNormalization(link.Link):
         self.register_persistent('N')
         self.decay = decay
         self.eps = eps
+        if sync_interval <= 0:
+            raise ValueError('sync_interval must be positive')
+        self.sync_interval = sync_interval
+        self._n_iterations = 0
 
         self._communication_backend = \
             get_communication_backend(comm, communication_backend)
@@ -96,7 +106,14 @@ class MultiNodeBatchNormalization(link.Link):
                 beta = variable.Variable(self.xp.zeros(
                     self.avg_mean.shape, dtype=self._highprec_dtype))
 
-        if chainer.configuration.config.train:
+        if chainer.configuration.config.train and \
+                self._n_iterations % self.sync_interval != 0:
+            # Approximates the stats by those of the local batch.
+            self._n_iterations += 1
+            ret = chainer.functions.batch_normalization(
+                x, gamma, beta, eps=self.eps)
+        elif chainer.configuration.config.train:
+            self._n_iterations += 1
             if finetune:
                 self.N += 1
                 decay = 1. - 1. / self.N
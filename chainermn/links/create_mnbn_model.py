@@ -3,7 +3,8 @@ import chainermn
 import copy
 
 
-def create_mnbn_model(link, comm, communication_backend='auto'):
+def create_mnbn_model(link, comm, communication_backend='auto',
+                      sync_interval=1):
     """Create a link object with MultiNodeBatchNormalization.
 
     Returns a copy of `link`, where BatchNormalization is replaced
@@ -16,6 +17,8 @@ def create_mnbn_model(link, comm, communication_backend='auto'):
             to determine communication backend of MultiNodeBatchNormalization.
             If ``auto``, use the best communication backend for each
             communicator.
+        sync_interval (int): Interval of the iterations in which
+            MultiNodeBatchNormalization shares the batch stats.
 
     Returns:
         Link object where BatchNormalization is replaced
@@ -33,6 +36,7 @@ def create_mnbn_model(link, comm, communication_backend='auto'):
             use_gamma=hasattr(link, 'gamma'),
             use_beta=hasattr(link, 'beta'),
             communication_backend=communication_backend,
+            sync_interval=sync_interval,
         )
         mnbn.copyparams(link)
         for name in link._persistent:
@@ -41,7 +45,8 @@ def create_mnbn_model(link, comm, communication_backend='auto'):
     elif isinstance(link, chainer.Chain):
         new_children = [
             (child_name, create_mnbn_model(link.__dict__[child_name], comm,
-                                           communication_backend))
+                                           communication_backend,
+                                           sync_interval))
             for child_name in link._children
         ]
         new_link = copy.deepcopy(link)
@@ -50,14 +55,16 @@ def create_mnbn_model(link, comm, communication_backend='auto'):
         return new_link
     elif isinstance(link, chainer.Sequential):
         new_children = [
-            create_mnbn_model(l, comm, communication_backend) for l in link]
+            create_mnbn_model(l, comm, communication_backend, sync_interval)
+            for l in link]
         new_link = copy.deepcopy(link)
         for i, new_child in enumerate(new_children):
             new_link._layers[i] = new_child
         return new_link
     elif isinstance(link, chainer.ChainList):
         new_children = [
-            create_mnbn_model(l, comm, communication_backend) for l in link]
+            create_mnbn_model(l, comm, communication_backend, sync_interval)
+            for l in link]
         new_link = copy.deepcopy(link)
         for i, new_child in enumerate(new_children):
             new_link._children[i] = new_child
@@ -0,0 +1,332 @@
+import time
+
+import chainer
+from chainer import backend
+import chainer.utils
+import numpy
+from six.moves import range
+
+
+schedules = ('gpipe', '1f1b')
+
+# The arrays transferred between stages are preceded by a header of
+# ``_header_length`` int64 values holding the number of arrays, followed by
+# the dtype character code, ``ndim`` and the shape of each array.
+_max_arrays = 8
+_max_ndim = 8
+_field_length = 2 + _max_ndim
+_header_length = 1 + _max_arrays * _field_length
+
+
+def _build_header(arrays):
+    if len(arrays) > _max_arrays:
+        raise ValueError('A stage can send at most {} arrays, but {} arrays '
+                         'are given'.format(_max_arrays, len(arrays)))
+    header = numpy.zeros((_header_length,), dtype=numpy.int64)
+    header[0] = len(arrays)
+    for i, array in enumerate(arrays):
+        if array.ndim > _max_ndim:
+            raise ValueError('Arrays sent between stages must have at most '
+                             '{} dimensions'.format(_max_ndim))
+        offset = 1 + i * _field_length
+        header[offset] = ord(array.dtype.char)
+        header[offset + 1] = array.ndim
+        header[offset + 2:offset + 2 + array.ndim] = array.shape
+    return header
+
+
+def _parse_header(header):
+    specs = []
+    for i in range(int(header[0])):
+        offset = 1 + i * _field_length
+        ndim = int(header[offset + 1])
+        shape = tuple(int(s) for s in header[offset + 2:offset + 2 + ndim])
+        specs.append((numpy.dtype(chr(int(header[offset]))), shape))
+    return specs
+
+
+def _micro_batch_bounds(batch_size, n_micro_batches):
+    q, r = divmod(batch_size, n_micro_batches)
+    bounds = [0]
+    for i in range(n_micro_batches):
+        bounds.append(bounds[-1] + q + (1 if i < r else 0))
+    return bounds
+
+
+def create_schedule(schedule, n_stages, stage_index, n_micro_batches):
+    """Creates the order of the computations of a stage of a pipeline.
+
+    Args:
+        schedule (str): ``'gpipe'`` or ``'1f1b'``. GPipe runs the forward
+            computations of all micro-batches, and then their backward
+            computations. 1F1B (one-forward-one-backward) runs as many
+            forward computations as the following stages at first, and then
+            alternates forward and backward computations, so that each stage
+            keeps the activations of at most ``n_stages`` micro-batches.
+        n_stages (int): Number of the stages.
+        stage_index (int): Index of the stage in the pipeline.
+        n_micro_batches (int): Number of the micro-batches.
+
+    Returns:
+        list of tuples: Pairs of ``'forward'`` or ``'backward'`` and the index
+        of the micro-batch, in the order of execution.
+
+    """
+    if schedule == 'gpipe':
+        n_warmup = n_micro_batches
+    elif schedule == '1f1b':
+        n_warmup = min(n_stages - stage_index - 1, n_micro_batches)
+    else:
+        raise ValueError(
+            'Unrecognized pipeline schedule: "{}"'.format(schedule))
+
+    ops = [('forward', i) for i in range(n_warmup)]
+    for i in range(n_micro_batches - n_warmup):
+        ops.append(('forward', n_warmup + i))
+        ops.append(('backward', i))
+    ops += [('backward', i)
+            for i in range(n_micro_batches - n_warmup, n_micro_batches)]
+    return ops
+
+
+class _GradientInjection(chainer.FunctionNode):
+    """Returns the given gradients of the outputs of a stage in backward."""
+
+    def __init__(self, grads):
+        self.grads = grads
+
+    def forward(self, inputs):
+        xp = backend.get_array_module(*inputs)
+        return xp.zeros((), dtype=numpy.float32),
+
+    def backward(self, target_input_indexes, grad_outputs):
+        return tuple(chainer.Variable(self.grads[i])
+                     for i in target_input_indexes)
+
+
+class MultiNodePipelineChain(chainer.Chain):
+    """Stage of a pipeline-parallel model trained with micro-batches.
+
+    A model is split into stages placed on the processes listed in
+    ``stage_ranks``, which are connected in this order. Unlike
+    :class:`~chainermn.MultiNodeChainList`, which runs one whole batch
+    through the stages so that only one process is busy at a time,
+    :meth:`forward_backward` splits a batch into ``n_micro_batches``
+    micro-batches and pipelines them through the stages. With ``N`` stages
+    and ``M`` micro-batches, the fraction of the idle time (bubble) of each
+    stage is ideally ``(N - 1) / (M + N - 1)``.
+
+    The outputs of the stages and their gradients are sent by non-blocking
+    point-to-point communication, which are waited at the end of
+    :meth:`forward_backward`.
+
+    Each process creates the chain of its stage. Since the constructor
+    duplicates the MPI communicator, it must be called by all processes of
+    ``comm`` at the same time.
+
+    .. admonition:: Example
+
+        On a pipeline of two processes, where rank 0 has the first half of
+        the model and rank 1 has the second half and the loss::
+
+            if comm.rank == 0:
+                stage = MLP0()
+            else:
+                stage = MLP1()
+            model = chainermn.links.MultiNodePipelineChain(
+                comm, stage, stage_ranks=[0, 1], n_micro_batches=4,
+                lossfun=F.softmax_cross_entropy)
+            optimizer.setup(model)
+
+            model.cleargrads()
+            if comm.rank == 0:
+                model.forward_backward(x)
+            else:
+                loss = model.forward_backward(t)
+            optimizer.update()
+
+    Args:
+        comm (chainermn.communicators.CommunicatorBase):
+            ChainerMN communicator.
+        stage (chainer.Link): The stage of this process. The first stage is
+            called with a micro-batch of the arguments of
+            :meth:`forward_backward`, and the others with the outputs of the
+            previous stage.
+        stage_ranks (list of ints): Ranks of the processes of the stages in
+            the order of the pipeline.
+        n_micro_batches (int): Number of the micro-batches each batch is
+            split into.
+        schedule (str): Pipeline schedule, ``'gpipe'`` or ``'1f1b'``.
+            See :func:`create_schedule` for detail.
+        lossfun (callable): Loss function of the last stage, which is called
+            as ``lossfun(y, *args)`` with the output ``y`` of the stage and
+            a micro-batch of the arguments of :meth:`forward_backward`. It
+            must return the mean of the loss of the micro-batch.
+
+    """
+
+    def __init__(self, comm, stage, stage_ranks, n_micro_batches,
+                 schedule='1f1b', lossfun=None):
+        chainer.utils.experimental('chainermn.links.MultiNodePipelineChain')
+        if schedule not in schedules:
+            raise ValueError(
+                'Unrecognized pipeline schedule: "{}"'.format(schedule))
+        if n_micro_batches <= 0:
+            raise ValueError('n_micro_batches must be positive')
+        if len(set(stage_ranks)) != len(stage_ranks):
+            raise ValueError('stage_ranks must not contain duplicates')
+        if comm.rank not in stage_ranks:
+            raise ValueError('The rank of the process must be in stage_ranks')
+
+        super(MultiNodePipelineChain, self).__init__()
+        with self.init_scope():
+            self.stage = stage
+
+        self._comm = comm
+        self._mpi_comm = comm.mpi_comm.Dup()
+        self.n_micro_batches = n_micro_batches
+        self.schedule = schedule
+        self.lossfun = lossfun
+
+        self.stage_index = stage_ranks.index(comm.rank)
+        self.n_stages = len(stage_ranks)
+        if self.stage_index > 0:
+            self._rank_prev = stage_ranks[self.stage_index - 1]
+        else:
+            self._rank_prev = None
+        if self.stage_index < self.n_stages - 1:
+            self._rank_next = stage_ranks[self.stage_index + 1]
+        else:
+            self._rank_next = None
+            if lossfun is None:
+                raise ValueError('lossfun is required for the last stage')
+
+        self._send_requests = []
+        self._wait_time = 0
+
+        # Time the stage waited for the other stages in the last
+        # ``forward_backward``, and its ratio to the elapsed time.
+        self.bubble_time = None
+        self.bubble_ratio = None
+
+    def _send(self, arrays, dest):
+        arrays = [numpy.ascontiguousarray(chainer.cuda.to_cpu(array))
+                  for array in arrays]
+        header = _build_header(arrays)
+        # The buffers are kept until the requests complete.
+        for buf in [header] + arrays:
+            self._send_requests.append(
+                (self._mpi_comm.Isend(buf, dest=dest), buf))
+
+    def _recv(self, source):
+        start = time.time()
+        header = numpy.empty((_header_length,), dtype=numpy.int64)
+        self._mpi_comm.Recv(header, source=source)
+        arrays = []
+        for dtype, shape in _parse_header(header):
+            array = numpy.empty(shape, dtype=dtype)
+            self._mpi_comm.Recv(array, source=source)
+            arrays.append(array)
+        self._wait_time += time.time() - start
+        return [self.stage.device.send(array) for array in arrays]
+
+    def _wait_sends(self):
+        start = time.time()
+        for request, _ in self._send_requests:
+            request.Wait()
+        self._send_requests = []
+        self._wait_time += time.time() - start
+
+    def _forward(self, args):
+        if self._rank_prev is None:
+            xs = args
+        else:
+            xs = [chainer.Variable(x) for x in self._recv(self._rank_prev)]
+        ys = self.stage(*xs)
+
+        if self._rank_next is None:
+            return xs, self.lossfun(ys, *args)
+        if not isinstance(ys, tuple):
+            ys = ys,
+        self._send([y.array for y in ys], self._rank_next)
+        return xs, ys
+
+    def _backward(self, xs, ys, weight):
+        if self._rank_next is None:
+            loss = ys * weight
+            loss.backward()
+        else:
+            grads = self._recv(self._rank_next)
+            _GradientInjection(grads).apply(ys)[0].backward()
+
+        if self._rank_prev is not None:
+            self._send([x.array * 0 if x.grad is None else x.grad
+                        for x in xs], self._rank_prev)
+
+    def forward_backward(self, *args):
+        """Computes the gradients of the parameters of the stage for a batch.
+
+        The gradients are accumulated to those of the parameters, which are
+        the gradients of the mean of the losses of the micro-batches
+        weighted by their sizes. All stages must call this method at the
+        same time.
+
+        Args:
+            args: Arrays of a batch, which are split into micro-batches along
+                the first axis. On the first stage, they are the inputs of
+                the stage. On the last stage, they are passed to ``lossfun``.
+                They are ignored on the other stages.
+
+        Returns:
+            ~chainer.Variable: The loss of the batch on the last stage, and
+            ``None`` on the other stages.
+
+        """
+        start = time.time()
+        self._wait_time = 0
+
+        n_micro_batches = self.n_micro_batches
+        if self._rank_prev is None or self._rank_next is None:
+            batch_size = len(args[0])
+            if batch_size < n_micro_batches:
+                raise ValueError(
+                    'Batch size {} is smaller than the number of '
+                    'micro-batches {}'.format(batch_size, n_micro_batches))
+            bounds = _micro_batch_bounds(batch_size, n_micro_batches)
+            micro_batches = [
+                [arg[bounds[i]:bounds[i + 1]] for arg in args]
+                for i in range(n_micro_batches)]
+            weights = [(bounds[i + 1] - bounds[i]) / float(batch_size)
+                       for i in range(n_micro_batches)]
+        else:
+            micro_batches = [[] for _ in range(n_micro_batches)]
+            weights = [None] * n_micro_batches
+
+        # Inputs and outputs of the micro-batches whose backward
+        # computations are not done yet.
+        stash = {}
+        losses = []
+        for op, i in create_schedule(self.schedule, self.n_stages,
+                                     self.stage_index, n_micro_batches):
+            if op == 'forward':
+                stash[i] = self._forward(micro_batches[i])
+                if self._rank_next is None:
+                    loss_dtype = stash[i][1].dtype
+                    losses.append(stash[i][1].array * weights[i])
+            else:
+                xs, ys = stash.pop(i)
+                self._backward(xs, ys, weights[i])
+        self._wait_sends()
+
+        self.bubble_time = self._wait_time
+        self.bubble_ratio = self._wait_time / max(time.time() - start, 1e-12)
+        observation = {'bubble_time': self.bubble_time,
+                       'bubble_ratio': self.bubble_ratio}
+        if self._rank_next is None:
+            loss = chainer.Variable(
+                self.xp.asarray(sum(losses), dtype=loss_dtype))
+            observation['loss'] = loss
+        else:
+            loss = None
+        chainer.reporter.report(observation, self)
+        return loss
@@ -0,0 +1,300 @@
+import chainer
+from chainer import backend
+import chainer.functions as F
+from chainer import initializers
+import chainer.utils
+import numpy
+
+
+def _shard_bounds(size, n_shards, index):
+    # The first ``size % n_shards`` shards have one more element.
+    q, r = divmod(size, n_shards)
+    begin = index * q + min(index, r)
+    return begin, begin + q + (1 if index < r else 0)
+
+
+def _shard_initializer(initializer, index, default):
+    # An array of the whole parameter is sliced to the shard, while
+    # initializers are applied to the shard.
+    if isinstance(initializer, chainer.get_array_types()):
+        return initializer[index].copy()
+    if initializer is None:
+        return default
+    return initializers._get_initializer(initializer)
+
+
+class _CopyToShards(chainer.FunctionNode):
+    """Passes the input through, and sums its gradients over the shards."""
+
+    def __init__(self, comm):
+        self.comm = comm
+
+    def forward(self, inputs):
+        return inputs
+
+    def backward(self, target_input_indexes, grad_outputs):
+        return _ReduceShards(self.comm).apply(grad_outputs)
+
+
+class _ReduceShards(chainer.FunctionNode):
+    """Sums the inputs over the shards, and passes the gradients through."""
+
+    def __init__(self, comm):
+        self.comm = comm
+
+    def forward(self, inputs):
+        xp = backend.get_array_module(*inputs)
+        x, = inputs
+        return self.comm.allreduce(xp.ascontiguousarray(x)),
+
+    def backward(self, target_input_indexes, grad_outputs):
+        return _CopyToShards(self.comm).apply(grad_outputs)
+
+
+class _GatherShards(chainer.FunctionNode):
+    """Concatenates the shards along an axis."""
+
+    def __init__(self, comm, axis):
+        self.comm = comm
+        self.axis = axis
+
+    def forward(self, inputs):
+        xp = backend.get_array_module(*inputs)
+        x, = inputs
+        xs = self.comm.allgather(xp.ascontiguousarray(x))
+        return xp.concatenate(xs, axis=self.axis),
+
+    def backward(self, target_input_indexes, grad_outputs):
+        return _SliceShard(self.comm, self.axis).apply(grad_outputs)
+
+
+class _SliceShard(chainer.FunctionNode):
+    """Slices the shard of the process along an axis."""
+
+    def __init__(self, comm, axis):
+        self.comm = comm
+        self.axis = axis
+
+    def forward(self, inputs):
+        x, = inputs
+        begin, end = _shard_bounds(
+            x.shape[self.axis], self.comm.size, self.comm.rank)
+        index = [slice(None)] * x.ndim
+        index[self.axis] = slice(begin, end)
+        return x[tuple(index)],
+
+    def backward(self, target_input_indexes, grad_outputs):
+        return _GatherShards(self.comm, self.axis).apply(grad_outputs)
+
+
+class MultiNodeColumnShardedLinear(chainer.Link):
+
+    """Linear layer whose output units are sharded over the processes.
+
+    Each process has the rows of the weight matrix and the elements of the
+    bias of ``out_size / comm.size`` output units, and computes them from
+    the input, which must be the same among the processes. If
+    ``gather_output`` is ``True``, the outputs of the shards are gathered
+    so that all processes get the whole output. Otherwise, the output of
+    the shard is returned, which can be passed to
+    :class:`MultiNodeRowShardedLinear` with ``input_is_sharded=True`` to
+    avoid the communication between them.
+
+    The gradient of the input is summed over the processes, while those of
+    the parameters are computed only on their shards. Thus, the optimizer
+    of the parameters must not be a multi node optimizer of ``comm``.
+    All processes must call this link at the same time.
+
+    Args:
+        comm (chainermn.communicators.CommunicatorBase):
+            ChainerMN communicator.
+        in_size (int): Dimension of input vectors.
+        out_size (int): Dimension of output vectors of the whole layer.
+        nobias (bool): If ``True``, then this function does not use the
+            bias.
+        initialW (:ref:`initializer <initializer>`): Initializer of the
+            weight matrix of the shard. If it is an array of the whole
+            weight matrix, the rows of the shard are used.
+        initial_bias (:ref:`initializer <initializer>`): Initializer of the
+            bias of the shard. If it is an array of the whole bias, the
+            elements of the shard are used.
+        gather_output (bool): If ``True``, the whole output is returned.
+
+    Attributes:
+        W (~chainer.Parameter): Weight parameter of the shard.
+        b (~chainer.Parameter): Bias parameter of the shard.
+        out_begin (int): Index of the first output unit of the shard.
+        out_end (int): Index next to the last output unit of the shard.
+
+    """
+
+    def __init__(self, comm, in_size, out_size, nobias=False, initialW=None,
+                 initial_bias=None, gather_output=True):
+        chainer.utils.experimental(
+            'chainermn.links.MultiNodeColumnShardedLinear')
+        super(MultiNodeColumnShardedLinear, self).__init__()
+        self.comm = comm
+        self.gather_output = gather_output
+        self.out_begin, self.out_end = _shard_bounds(
+            out_size, comm.size, comm.rank)
+        shard = slice(self.out_begin, self.out_end)
+        with self.init_scope():
+            self.W = chainer.Parameter(
+                _shard_initializer(initialW, shard,
+                                   initializers.LeCunNormal()),
+                (self.out_end - self.out_begin, in_size))
+            if nobias:
+                self.b = None
+            else:
+                self.b = chainer.Parameter(
+                    _shard_initializer(initial_bias, shard,
+                                       initializers.Constant(0)),
+                    self.out_end - self.out_begin)
+
+    def forward(self, x):
+        x, = _CopyToShards(self.comm).apply((x,))
+        y = F.linear(x, self.W, self.b)
+        if self.gather_output:
+            y, = _GatherShards(self.comm, 1).apply((y,))
+        return y
+
+
+class MultiNodeRowShardedLinear(chainer.Link):
+
+    """Linear layer whose input units are sharded over the processes.
+
+    Each process has the columns of the weight matrix of
+    ``in_size / comm.size`` input units, and the outputs computed from the
+    shards of the input are summed over the processes. The bias is not
+    sharded, and must be initialized to the same values among the
+    processes.
+
+    The input must be the same among the processes, unless
+    ``input_is_sharded`` is ``True``, where the input is the shard of the
+    process, e.g., the output of :class:`MultiNodeColumnShardedLinear` with
+    ``gather_output=False``.
+
+    The gradients of the sharded weights are computed only on their shards,
+    while that of the bias is the same among the processes. Thus, the
+    optimizer of the parameters must not be a multi node optimizer of
+    ``comm``. All processes must call this link at the same time.
+
+    Args:
+        comm (chainermn.communicators.CommunicatorBase):
+            ChainerMN communicator.
+        in_size (int): Dimension of input vectors of the whole layer.
+        out_size (int): Dimension of output vectors.
+        nobias (bool): If ``True``, then this function does not use the
+            bias.
+        initialW (:ref:`initializer <initializer>`): Initializer of the
+            weight matrix of the shard. If it is an array of the whole
+            weight matrix, the columns of the shard are used. If it is
+            ``None``, the weights are initialized with the scale of
+            :class:`~chainer.initializers.LeCunNormal` of the whole matrix.
+        initial_bias (:ref:`initializer <initializer>`): Initializer of the
+            bias.
+        input_is_sharded (bool): If ``True``, the input is the shard of the
+            process.
+
+    Attributes:
+        W (~chainer.Parameter): Weight parameter of the shard.
+        b (~chainer.Parameter): Bias parameter.
+        in_begin (int): Index of the first input unit of the shard.
+        in_end (int): Index next to the last input unit of the shard.
+
+    """
+
+    def __init__(self, comm, in_size, out_size, nobias=False, initialW=None,
+                 initial_bias=None, input_is_sharded=False):
+        chainer.utils.experimental(
+            'chainermn.links.MultiNodeRowShardedLinear')
+        super(MultiNodeRowShardedLinear, self).__init__()
+        self.comm = comm
+        self.input_is_sharded = input_is_sharded
+        self.in_begin, self.in_end = _shard_bounds(
+            in_size, comm.size, comm.rank)
+        with self.init_scope():
+            # The fan-in of the shard is smaller than that of the whole
+            # matrix, which determines the scale of LeCunNormal.
+            self.W = chainer.Parameter(
+                _shard_initializer(
+                    initialW, (slice(None), slice(self.in_begin, self.in_end)),
+                    initializers.Normal(numpy.sqrt(1. / in_size))),
+                (out_size, self.in_end - self.in_begin))
+            if nobias:
+                self.b = None
+            else:
+                if initial_bias is None:
+                    initial_bias = 0
+                self.b = chainer.Parameter(
+                    initializers._get_initializer(initial_bias), out_size)
+
+    def forward(self, x):
+        x = F.reshape(x, (len(x), -1))
+        if not self.input_is_sharded:
+            x, = _SliceShard(self.comm, 1).apply((x,))
+        y = F.linear(x, self.W)
+        y, = _ReduceShards(self.comm).apply((y,))
+        if self.b is not None:
+            y = F.bias(y, self.b)
+        return y
+
+
+class MultiNodeShardedEmbedID(chainer.Link):
+
+    """Word embedding layer whose vocabulary is sharded over the processes.
+
+    Each process has the embeddings of ``in_size / comm.size`` IDs. The
+    processes look up the IDs in their shards, and the embeddings are
+    summed over the processes, where the IDs out of the shard have zero
+    vectors. The IDs must be the same among the processes.
+
+    The gradients of the embeddings are computed only on their shards.
+    Thus, the optimizer of the parameters must not be a multi node
+    optimizer of ``comm``. All processes must call this link at the same
+    time.
+
+    Args:
+        comm (chainermn.communicators.CommunicatorBase):
+            ChainerMN communicator.
+        in_size (int): Number of different identifiers (a.k.a. vocabulary
+            size) of the whole layer.
+        out_size (int): Output dimension.
+        initialW (:ref:`initializer <initializer>`): Initializer of the
+            embeddings of the shard. If it is an array of the whole
+            embeddings, the rows of the shard are used.
+        ignore_label (int or None): If ``ignore_label`` is an int value,
+            ``i``-th row of return value is filled with ``0``.
+
+    Attributes:
+        W (~chainer.Parameter): Embedding parameter matrix of the shard.
+        in_begin (int): The first ID of the shard.
+        in_end (int): ID next to the last ID of the shard.
+
+    """
+
+    def __init__(self, comm, in_size, out_size, initialW=None,
+                 ignore_label=None):
+        chainer.utils.experimental('chainermn.links.MultiNodeShardedEmbedID')
+        super(MultiNodeShardedEmbedID, self).__init__()
+        self.comm = comm
+        self.ignore_label = ignore_label
+        self.in_begin, self.in_end = _shard_bounds(
+            in_size, comm.size, comm.rank)
+        with self.init_scope():
+            self.W = chainer.Parameter(
+                _shard_initializer(initialW, slice(self.in_begin, self.in_end),
+                                   initializers.Normal(1.0)),
+                (self.in_end - self.in_begin, out_size))
+
+    def forward(self, x):
+        if isinstance(x, chainer.Variable):
+            x = x.array
+        xp = backend.get_array_module(x)
+        in_shard = (x >= self.in_begin) & (x < self.in_end)
+        if self.ignore_label is not None:
+            in_shard &= x != self.ignore_label
+        x = xp.where(in_shard, x - self.in_begin, -1).astype(x.dtype)
+        y = F.embed_id(x, self.W, ignore_label=-1)
+        y, = _ReduceShards(self.comm).apply((y,))
+        return y
@@ -1,16 +1,19 @@
 import chainer
 import copy
+import numpy
 
 
 class _MultiNodeOptimizer(object):
 
-    def __init__(self, actual_optimizer, communicator):
+    def __init__(self, actual_optimizer, communicator, bucket_size=None):
         super(_MultiNodeOptimizer, self).__setattr__(
             'communicator', communicator)
         super(_MultiNodeOptimizer, self).__setattr__(
             'actual_optimizer', actual_optimizer)
         super(_MultiNodeOptimizer, self).__setattr__(
             'target_params', [])
+        super(_MultiNodeOptimizer, self).__setattr__(
+            'bucket_size', bucket_size)
 
     def update(self, lossfun=None, *args, **kwds):
         target = self.target
@@ -27,7 +30,11 @@ class _MultiNodeOptimizer(object):
         if self.is_changed(target):
             self.communicator.bcast_data(target)
         else:
-            self.communicator.allreduce_grad(target)
+            if self.bucket_size is None:
+                self.communicator.allreduce_grad(target)
+            else:
+                self.communicator._allreduce_grad_bucketed(
+                    target, self.bucket_size)
             self.actual_optimizer.update(None, *args, **kwds)
 
     def is_changed(self, target):
@@ -141,8 +148,385 @@ class _DoubleBufferingOptimizer(object):
         setattr(self.actual_optimizer, attr_name, value)
 
 
+def _get_param_signature(target):
+    return [(name, param.data is not None)
+            for name, param in sorted(target.namedparams())]
+
+
+class _ZeroRedundancyOptimizer(object):
+
+    def __init__(self, actual_optimizer, communicator):
+        super(_ZeroRedundancyOptimizer, self).__setattr__(
+            'communicator', communicator)
+        super(_ZeroRedundancyOptimizer, self).__setattr__(
+            'actual_optimizer', actual_optimizer)
+        super(_ZeroRedundancyOptimizer, self).__setattr__(
+            'target_params', [])
+        super(_ZeroRedundancyOptimizer, self).__setattr__(
+            'needs_broadcast', True)
+        super(_ZeroRedundancyOptimizer, self).__setattr__(
+            'shards', None)
+        super(_ZeroRedundancyOptimizer, self).__setattr__(
+            'disabled_params', [])
+        super(_ZeroRedundancyOptimizer, self).__setattr__(
+            'partitioned_params', None)
+
+    def update(self, lossfun=None, *args, **kwds):
+        target = self.target
+        if lossfun is not None:
+            use_cleargrads = getattr(self, '_use_cleargrads', True)
+            loss = lossfun(*args, **kwds)
+            if use_cleargrads:
+                target.cleargrads()
+            else:
+                target.zerograds()
+            loss.backward(loss_scale=self.actual_optimizer._loss_scale)
+            del loss
+
+        if self.is_changed(target):
+            self.partition(target)
+            if self.needs_broadcast:
+                self.communicator.bcast_data(target)
+                return
+            super(_ZeroRedundancyOptimizer, self).__setattr__(
+                'needs_broadcast', True)
+
+        self.check_hooks()
+        self.reduce_scatter_grad()
+        self.actual_optimizer.update(None, *args, **kwds)
+        self.allgather_data()
+
+    def is_changed(self, target):
+        previous_params = self.target_params
+        super(_ZeroRedundancyOptimizer, self).__setattr__(
+            'target_params', _get_param_signature(target))
+        return previous_params != self.target_params
+
+    def check_hooks(self):
+        # Each process only has the averaged gradients of the parameters it
+        # owns, and the parameters owned by the others are updated by them.
+        # Hooks computing a quantity over all the parameters (e.g., the norm
+        # of GradientClipping) would therefore see different values on
+        # each process.
+        hooks = list(self.actual_optimizer._pre_update_hooks.values()) + \
+            list(self.actual_optimizer._post_update_hooks.values())
+        for hook in hooks:
+            if not getattr(hook, 'call_for_each_param', False):
+                raise ValueError(
+                    'Optimizer hook {} cannot be used with zero_redundancy '
+                    'since it is not called for each parameter.'.format(
+                        getattr(hook, 'name', hook)))
+
+    def partition(self, target):
+        # Parameters are assigned to the rank with the least total size so
+        # far, from the largest one. The order is deterministic, so that all
+        # the processes compute the same partition without communication.
+        for param in self.disabled_params:
+            param.update_rule.enabled = True
+        params = [param for _, param in sorted(target.namedparams())
+                  if param.data is not None and param.update_rule is not None
+                  and param.update_rule.enabled]
+        if len(set([param.dtype for param in params])) > 1:
+            raise ValueError(
+                'All the parameters must have the same dtype to shard the '
+                'optimizer.')
+
+        size = self.communicator.size
+        loads = [0] * size
+        shards = [[] for _ in range(size)]
+        for param in sorted(params, key=lambda param: -param.size):
+            rank = loads.index(min(loads))
+            shards[rank].append(param)
+            loads[rank] += param.size
+
+        # The update rules of the parameters owned by other processes are
+        # disabled, so that their states are never allocated. The states of
+        # the parameters that were owned by this process before are dropped.
+        disabled_params = []
+        for rank, shard in enumerate(shards):
+            if rank == self.communicator.rank:
+                continue
+            for param in shard:
+                param.update_rule.enabled = False
+                param.update_rule._state = None
+                disabled_params.append(param)
+        super(_ZeroRedundancyOptimizer, self).__setattr__(
+            'shards', shards)
+        super(_ZeroRedundancyOptimizer, self).__setattr__(
+            'disabled_params', disabled_params)
+        super(_ZeroRedundancyOptimizer, self).__setattr__(
+            'partitioned_params', _get_param_signature(target))
+
+    def _get_buffer_type(self):
+        params = [param for shard in self.shards for param in shard]
+        if not params:
+            return None, None
+        xp = chainer.backend.get_array_module(params[0].data)
+        dtype = params[0].dtype
+        # float16 arrays are sent as float32 arrays since MPI has no float16
+        # type.
+        if dtype == numpy.float16:
+            dtype = numpy.dtype(numpy.float32)
+        return xp, dtype
+
+    def reduce_scatter_grad(self):
+        xp, dtype = self._get_buffer_type()
+        if xp is None:
+            return
+        grads = [_pack(shard, 'grad', xp, dtype) for shard in self.shards]
+        recvs = self.communicator.alltoall(tuple(grads))
+        grad = recvs[0].copy()
+        for recv in recvs[1:]:
+            grad += recv
+        grad *= 1.0 / self.communicator.size
+        _unpack(grad, self.shards[self.communicator.rank], 'grad')
+
+    def allgather_data(self):
+        xp, dtype = self._get_buffer_type()
+        if xp is None:
+            return
+        data = _pack(self.shards[self.communicator.rank], 'data', xp, dtype)
+        recvs = self.communicator.allgather(data)
+        for recv, shard in zip(recvs, self.shards):
+            _unpack(recv, shard, 'data')
+
+    def serialize(self, serializer):
+        # The partition is needed before loading the states, since the states
+        # of the parameters owned by other processes are not saved.
+        if self.target is not None and \
+                self.partitioned_params != _get_param_signature(self.target):
+            self.partition(self.target)
+        self.actual_optimizer.serialize(serializer)
+
+    def setup(self, link):
+        self.actual_optimizer.setup(link)
+        return self
+
+    def __getattr__(self, attr_name):
+        return getattr(self.actual_optimizer, attr_name)
+
+    def __setattr__(self, attr_name, value):
+        if attr_name in self.__dict__:
+            super(_ZeroRedundancyOptimizer, self).__setattr__(
+                attr_name, value)
+        else:
+            setattr(self.actual_optimizer, attr_name, value)
+
+
+class _LocalSGDOptimizer(object):
+
+    def __init__(self, actual_optimizer, communicator, local_steps,
+                 outer_momentum, double_buffering):
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'communicator', communicator)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'actual_optimizer', actual_optimizer)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'target_params', [])
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'local_steps', local_steps)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'outer_momentum', outer_momentum)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'double_buffering', double_buffering)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'n_local_steps', 0)
+        # Parameters averaged at the last synchronization, and the velocity
+        # of the outer momentum.
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'global_data', None)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'velocity', None)
+        # Buffers and request of the non-blocking allreduce in flight.
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'send_buf', None)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'recv_buf', None)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'request', None)
+
+    def update(self, lossfun=None, *args, **kwds):
+        target = self.target
+        if lossfun is not None:
+            use_cleargrads = getattr(self, '_use_cleargrads', True)
+            loss = lossfun(*args, **kwds)
+            if use_cleargrads:
+                target.cleargrads()
+            else:
+                target.zerograds()
+            loss.backward(loss_scale=self.actual_optimizer._loss_scale)
+            del loss
+
+        if self.is_changed(target):
+            self.communicator.bcast_data(target)
+            self.reset(target)
+            return
+
+        self.actual_optimizer.update(None, *args, **kwds)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'n_local_steps', self.n_local_steps + 1)
+        if self.n_local_steps % self.local_steps == 0:
+            if self.double_buffering:
+                self.average_data_async(target)
+            else:
+                self.average_data(target)
+
+    def is_changed(self, target):
+        previous_params = self.target_params
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'target_params', [(name, param.data is not None)
+                              for name, param in sorted(target.namedparams())])
+        return previous_params != self.target_params
+
+    def reset(self, target):
+        self.wait()
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'request', None)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'global_data', _pack_host(_extract_params(target)))
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'velocity', None)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'n_local_steps', 0)
+
+    def outer_update(self, mean):
+        # Computes the new global parameters from the mean of the local
+        # parameters. The difference from the previous global parameters is
+        # regarded as the gradient of the outer momentum SGD.
+        if self.outer_momentum == 0:
+            global_data = mean
+        else:
+            delta = self.global_data - mean
+            if self.velocity is None:
+                velocity = delta
+            else:
+                velocity = self.outer_momentum * self.velocity + delta
+            super(_LocalSGDOptimizer, self).__setattr__(
+                'velocity', velocity)
+            global_data = self.global_data - velocity
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'global_data', global_data)
+        return global_data
+
+    def average_data(self, target):
+        params = _extract_params(target)
+        data = _pack_host(params)
+        mean = numpy.empty_like(data)
+        self.communicator.mpi_comm.Allreduce(data, mean)
+        mean *= 1.0 / self.communicator.size
+        _unpack_host(self.outer_update(mean), params)
+
+    def average_data_async(self, target):
+        # The mean of the parameters is computed while the next local steps
+        # run, and applied at the next synchronization with the local
+        # progress made in the meantime.
+        params = _extract_params(target)
+        data = _pack_host(params)
+        if self.request is not None:
+            self.wait()
+            mean = self.recv_buf * (1.0 / self.communicator.size)
+            data += self.outer_update(mean) - self.send_buf
+            _unpack_host(data, params)
+
+        send_buf = data.copy()
+        recv_buf = numpy.empty_like(data)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'send_buf', send_buf)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'recv_buf', recv_buf)
+        super(_LocalSGDOptimizer, self).__setattr__(
+            'request', self.communicator.mpi_comm.Iallreduce(
+                send_buf, recv_buf))
+
+    def wait(self):
+        if self.request is not None:
+            self.request.Wait()
+
+    def setup(self, link):
+        self.actual_optimizer.setup(link)
+        return self
+
+    def __getattr__(self, attr_name):
+        return getattr(self.actual_optimizer, attr_name)
+
+    def __setattr__(self, attr_name, value):
+        setattr(self.actual_optimizer, attr_name, value)
+
+
+def _extract_params(target):
+    return [param for _, param in sorted(target.namedparams())
+            if param.data is not None]
+
+
+def _pack_host(params):
+    if not params:
+        return numpy.empty((0,), dtype=numpy.float32)
+    return numpy.concatenate([
+        chainer.backends.cuda.to_cpu(param.data).ravel().astype(
+            numpy.float32, copy=False)
+        for param in params])
+
+
+def _unpack_host(buf, params):
+    offset = 0
+    for param in params:
+        array = buf[offset:offset + param.size].reshape(param.shape)
+        offset += param.size
+        param.data[...] = chainer.backend.get_array_module(
+            param.data).asarray(array, dtype=param.dtype)
+
+
+def _pack(params, attr_name, xp, dtype):
+    arrays = []
+    for param in params:
+        array = getattr(param, attr_name)
+        if array is None:
+            arrays.append(xp.zeros(param.size, dtype=dtype))
+        else:
+            arrays.append(array.ravel().astype(dtype, copy=False))
+    if not arrays:
+        return xp.empty((0,), dtype=dtype)
+    return xp.concatenate(arrays)
+
+
+def _unpack(buf, params, attr_name):
+    offset = 0
+    for param in params:
+        array = buf[offset:offset + param.size].reshape(param.shape)
+        offset += param.size
+        if getattr(param, attr_name) is None:
+            setattr(param, attr_name, array.astype(param.dtype))
+        else:
+            getattr(param, attr_name)[...] = array
+
+
+def _check_bucketed_allreduce(communicator):
+    # The bucketed allreduce is done by MPI in float32 without going through
+    # ``allreduce_grad`` of the communicator, so the options of the
+    # communicator that change the reduction would be silently ignored.
+    if getattr(communicator, 'gradient_compressor', None) is not None:
+        raise ValueError(
+            'bucket_size cannot be used with gradient_compression.')
+    if getattr(communicator, 'allreduce_algorithm', None) is not None:
+        raise ValueError(
+            'bucket_size cannot be used with allreduce_algorithm.')
+    allreduce_grad_dtype = getattr(communicator, 'allreduce_grad_dtype', None)
+    if allreduce_grad_dtype is not None and \
+            numpy.dtype(allreduce_grad_dtype) != numpy.float32:
+        raise ValueError(
+            'bucket_size cannot be used with allreduce_grad_dtype other '
+            'than float32.')
+    from chainermn.communicators.shared_memory_communicator \
+        import SharedMemoryCommunicator
+    if isinstance(communicator, SharedMemoryCommunicator):
+        raise ValueError(
+            'bucket_size cannot be used with the shared_memory communicator.')
+
+
 def create_multi_node_optimizer(actual_optimizer, communicator,
-                                double_buffering=False):
+                                double_buffering=False,
+                                zero_redundancy=False, bucket_size=None,
+                                local_steps=None, outer_momentum=0.0):
     """Create a multi node optimizer from a Chainer optimizer.
 
     Args:
@@ -156,9 +540,81 @@ def create_multi_node_optimizer(actual_optimizer, communicator,
              the gradients of the previous iteration are used
              for update. This flag is supported by
              ``PureNcclCommunicator`` only.
+        zero_redundancy: If ``True``, the parameters are partitioned among
+             the processes, and each process keeps the optimizer states
+             (e.g., the moments of Adam) of its own partition only.
+             The gradients are reduce-scattered, each process updates its
+             own partition, and the updated parameters are all-gathered.
+             It reduces the memory consumed by the optimizer states to
+             roughly ``1 / communicator.size``. Each process saves the
+             states of its own partition in its snapshot, so the snapshots
+             must be taken and loaded per process, e.g., by
+             :func:`~chainermn.create_multi_node_checkpointer`.
+             All the parameters must have the same dtype. Only the optimizer
+             hooks called for each parameter (e.g., ``WeightDecay``) can be
+             used, since each process has the averaged gradients of its own
+             parameters only; the hooks that compute a quantity over all the
+             parameters, such as ``GradientClipping``, are rejected. This
+             flag cannot be used with ``double_buffering``.
+        bucket_size (int): If specified, the gradients are packed into
+             buckets of at most this number of bytes, and a non-blocking
+             allreduce is started for each bucket, so that packing and
+             unpacking of the gradients are overlapped with the
+             communication. The allreduce is done by MPI regardless of the
+             communicator, so CUDA-aware MPI is required for the gradients
+             on GPU, and the gradients are always reduced in float32.
+             This option cannot be used with ``double_buffering`` or
+             ``zero_redundancy``, nor with the communicators whose reduction
+             differs from it, i.e., ``shared_memory`` or the ones created
+             with ``gradient_compression``, ``allreduce_algorithm`` or
+             ``allreduce_grad_dtype`` other than float32.
+        local_steps (int): If specified, the optimizer runs in local SGD
+             mode. Each process updates its parameters with its own
+             gradients without communication, and the parameters are
+             averaged over the processes every ``local_steps`` updates.
+             If ``double_buffering`` is ``True`` in this mode, the average
+             is computed by non-blocking allreduce while the next
+             ``local_steps`` updates run, and it is applied at the next
+             averaging together with the local updates made in the meantime.
+             Unlike the double buffering of gradients, it is supported by
+             all the communicators. The optimizer states (e.g., the moments
+             of Adam) are not averaged. This option cannot be used with
+             ``zero_redundancy`` or ``bucket_size``.
+        outer_momentum (float): Momentum of the averaging in local SGD
+             mode. The difference between the previous and current averages
+             of the parameters is accumulated with this momentum, and the
+             accumulation is applied to the parameters instead of the
+             difference.
     Returns:
         The multi node optimizer based on ``actual_optimizer``.
     """
+    if local_steps is not None:
+        if zero_redundancy or bucket_size is not None:
+            raise ValueError(
+                'local_steps cannot be used with zero_redundancy or '
+                'bucket_size.')
+        if local_steps <= 0:
+            raise ValueError('local_steps must be positive.')
+        if not 0 <= outer_momentum < 1:
+            raise ValueError('outer_momentum must be in [0, 1).')
+        return _LocalSGDOptimizer(actual_optimizer, communicator,
+                                  local_steps, outer_momentum,
+                                  double_buffering)
+    if double_buffering and zero_redundancy:
+        raise ValueError(
+            'double_buffering and zero_redundancy cannot be used together.')
+    if bucket_size is not None:
+        if double_buffering or zero_redundancy:
+            raise ValueError(
+                'bucket_size cannot be used with double_buffering or '
+                'zero_redundancy.')
+        if bucket_size <= 0:
+            raise ValueError('bucket_size must be positive.')
+        _check_bucketed_allreduce(communicator)
+        return _MultiNodeOptimizer(actual_optimizer, communicator,
+                                   bucket_size)
+    if zero_redundancy:
+        return _ZeroRedundancyOptimizer(actual_optimizer, communicator)
     if double_buffering:
         from chainermn.communicators.pure_nccl_communicator \
             import PureNcclCommunicator
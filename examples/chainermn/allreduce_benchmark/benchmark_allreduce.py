@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+from __future__ import print_function
+
+import argparse
+import time
+
+import numpy as np
+
+import chainer
+import chainermn
+
+
+class Model(chainer.Chain):
+
+    def __init__(self, n_elems, n_params):
+        super(Model, self).__init__()
+        sizes = [n_elems // n_params] * n_params
+        sizes[0] += n_elems - sum(sizes)
+        with self.init_scope():
+            for i, size in enumerate(sizes):
+                setattr(self, 'p{}'.format(i),
+                        chainer.Parameter(np.ones(size, np.float32)))
+        for param in self.params():
+            param.grad = np.ones_like(param.array)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='ChainerMN example: benchmark of allreduce algorithms')
+    parser.add_argument('--algorithms', type=str, nargs='+',
+                        default=['mpi', 'ring', 'recursive_halving_doubling',
+                                 'hierarchical', 'auto', 'shared_memory'],
+                        help='Allreduce algorithms to compare; `mpi` '
+                        'stands for MPI_Allreduce, and `shared_memory` for '
+                        '`shared_memory` communicator')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1 << 10, 1 << 14, 1 << 18, 1 << 22],
+                        help='Numbers of elements of the gradients')
+    parser.add_argument('--n-params', type=int, default=10,
+                        help='Number of parameters the gradients are split '
+                        'into')
+    parser.add_argument('--iterations', '-i', type=int, default=20,
+                        help='Number of iterations measured')
+    parser.add_argument('--warmup', type=int, default=3,
+                        help='Number of iterations before measurement')
+    args = parser.parse_args()
+
+    comms = {}
+    for algorithm in args.algorithms:
+        if algorithm == 'shared_memory':
+            comms[algorithm] = chainermn.create_communicator('shared_memory')
+        else:
+            comms[algorithm] = chainermn.create_communicator(
+                'naive',
+                allreduce_algorithm=None if algorithm == 'mpi' else algorithm)
+    comm = comms[args.algorithms[0]]
+    if comm.rank == 0:
+        print('processes: {} (intra_size: {}, inter_size: {})'.format(
+            comm.size, comm.intra_size, comm.inter_size))
+        print('{:>12} {:>28} {:>12} {:>12}'.format(
+            'elements', 'algorithm', 'time [ms]', 'GB/s'))
+
+    for n_elems in args.sizes:
+        model = Model(n_elems, min(args.n_params, n_elems))
+        for algorithm in args.algorithms:
+            comm = comms[algorithm]
+            for _ in range(args.warmup):
+                comm.allreduce_grad(model)
+            comm.mpi_comm.Barrier()
+            start = time.time()
+            for _ in range(args.iterations):
+                comm.allreduce_grad(model)
+            comm.mpi_comm.Barrier()
+            elapsed = (time.time() - start) / args.iterations
+            if comm.rank == 0:
+                # Algorithm bandwidth, i.e., the size of the gradients divided
+                # by the time.
+                print('{:>12} {:>28} {:>12.3f} {:>12.3f}'.format(
+                    n_elems, algorithm, elapsed * 1e3,
+                    n_elems * 4 / elapsed / 1e9))
+
+
+if __name__ == '__main__':
+    main()
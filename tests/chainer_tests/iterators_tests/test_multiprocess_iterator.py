@@ -425,6 +425,23 @@ class TestMultiprocessIteratorSerialize(unittest.TestCase):
         self.assertAlmostEqual(it.epoch_detail, 6 / 6)
         self.assertAlmostEqual(it.previous_epoch_detail, 4 / 6)
 
+    def test_iterator_serialize_without_shuffle(self):
+        dataset = [1, 2, 3, 4, 5, 6]
+        options = dict(self.options, shuffle=False, order_sampler=None)
+        it = iterators.MultiprocessIterator(dataset, 2, **options)
+        batch1 = it.next()
+        self.assertEqual(batch1, [1, 2])
+
+        target = dict()
+        it.serialize(DummySerializer(target))
+        self.assertNotIn('order', target)
+
+        it = iterators.MultiprocessIterator(dataset, 2, **options)
+        it.serialize(DummyDeserializer(target))
+        self.assertAlmostEqual(it.epoch_detail, 2 / 6)
+        self.assertAlmostEqual(it.previous_epoch_detail, 0 / 6)
+        self.assertEqual(it.next(), [3, 4])
+
     def test_iterator_serialize_backward_compat(self):
         dataset = [1, 2, 3, 4, 5, 6]
         it = iterators.MultiprocessIterator(dataset, 2, **self.options)
@@ -129,4 +129,72 @@ class TestEmbedIDUnpickleOldFile(unittest.TestCase):
         self.assertEqual(y.data.shape, (2, 4))
 
 
+@testing.parameterize(*testing.product({
+    'optimizer': ['SGD', 'MomentumSGD', 'AdaGrad', 'Adam'],
+    'ignore_label': [None, -1],
+}))
+class TestEmbedIDSparseUpdate(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.array([[1, 3, -1], [3, -1, 1]], dtype=numpy.int32)
+        if self.ignore_label is None:
+            self.x[self.x == -1] = 0
+        self.used = numpy.unique(self.x[self.x >= 0])
+        self.unused = numpy.setdiff1d(numpy.arange(6), self.used)
+
+    def create(self, sparse_update):
+        link = links.EmbedID(6, 4, ignore_label=self.ignore_label,
+                             sparse_update=sparse_update)
+        link.W.array[...] = numpy.arange(24).reshape(6, 4) / 10.
+        optimizer = getattr(chainer.optimizers, self.optimizer)()
+        optimizer.setup(link)
+        return link, optimizer
+
+    def update(self, link, optimizer):
+        optimizer.update(lambda: chainer.functions.sum(link(self.x) ** 2))
+
+    def test_first_update(self):
+        # Zero gradients do not change any rows on the first update.
+        link, optimizer = self.create(True)
+        expected_link, expected_optimizer = self.create(False)
+        self.update(link, optimizer)
+        self.update(expected_link, expected_optimizer)
+        numpy.testing.assert_allclose(link.W.array, expected_link.W.array)
+
+    def test_lazy_update(self):
+        link, optimizer = self.create(True)
+        W = link.W.array.copy()
+        self.update(link, optimizer)
+        used = self.used
+        self.x[...] = self.used[0]
+        self.update(link, optimizer)
+
+        numpy.testing.assert_array_equal(
+            link.W.array[self.unused], W[self.unused])
+        for value in link.W.update_rule.state.values():
+            numpy.testing.assert_array_equal(value[self.unused], 0)
+            self.assertTrue((value[used] != 0).any())
+        self.assertIsNone(link.W.update_rule._sparse_rows)
+        self.assertEqual(link.W.update_rule.t, 2)
+
+    def test_no_backprop_mode(self):
+        link, optimizer = self.create(True)
+        with chainer.no_backprop_mode():
+            link(self.x)
+        self.assertIsNone(link.W.update_rule._sparse_rows)
+
+    def test_forward_without_update(self):
+        link, optimizer = self.create(True)
+        for _ in range(10):
+            link(self.x)
+        numpy.testing.assert_array_equal(
+            link.W.update_rule._sparse_rows, self.used)
+
+        # The rows registered so far are still used by the next update.
+        expected_link, expected_optimizer = self.create(True)
+        self.update(link, optimizer)
+        self.update(expected_link, expected_optimizer)
+        numpy.testing.assert_allclose(link.W.array, expected_link.W.array)
+
+
 testing.run_module(__name__, __file__)
@@ -5,6 +5,7 @@ import six
 import numpy as np
 
 import chainer
+from chainer import optimizer_hooks
 from chainer import optimizers
 from chainer import testing
 
@@ -170,4 +171,151 @@ class TestOptimizerLossScaling(unittest.TestCase):
             self.optimizer.loss_scaling(scale=-1)
 
 
+class FusedUpdateChain(chainer.Chain):
+
+    def __init__(self):
+        super(FusedUpdateChain, self).__init__()
+        with self.init_scope():
+            self.l1 = chainer.links.Linear(3, 4)
+            self.l2 = chainer.links.Linear(4, 2)
+
+    def __call__(self, x):
+        return chainer.functions.sum(self.l2(self.l1(x)) ** 2)
+
+
+@testing.parameterize(*testing.product_dict(
+    [
+        {'impl': optimizers.SGD, 'kwargs': {}},
+        {'impl': optimizers.MomentumSGD, 'kwargs': {}},
+        {'impl': optimizers.Adam, 'kwargs': {}},
+        {'impl': optimizers.Adam, 'kwargs': {'amsgrad': True}},
+        {'impl': optimizers.Adam, 'kwargs': {'weight_decay_rate': 0.1}},
+        {'impl': optimizers.RMSprop, 'kwargs': {}},
+        {'impl': optimizers.AdaGrad, 'kwargs': {}},
+    ],
+))
+class TestOptimizerFusedUpdate(unittest.TestCase):
+
+    def setUp(self):
+        self.target = FusedUpdateChain()
+        self.expected = self.target.copy(mode='copy')
+        self.x = np.random.uniform(-1, 1, (5, 3)).astype(np.float32)
+
+    def create(self, target, fused):
+        optimizer = self.impl(**self.kwargs)
+        optimizer.setup(target)
+        if fused:
+            optimizer.use_fused_update()
+        return optimizer
+
+    def check_params(self):
+        for actual, expected in zip(
+                self.target.params(), self.expected.params()):
+            np.testing.assert_allclose(
+                actual.array, expected.array, rtol=1e-5, atol=1e-6)
+
+    def test_update(self):
+        optimizer = self.create(self.target, True)
+        expected_optimizer = self.create(self.expected, False)
+        for _ in range(3):
+            optimizer.update(self.target, self.x)
+            expected_optimizer.update(self.expected, self.x)
+        self.check_params()
+
+        params = list(self.target.params())
+        base = params[0].array.base
+        self.assertIsNotNone(base)
+        for param in params:
+            self.assertIs(param.array.base, base)
+            self.assertEqual(param.update_rule.t, 3)
+            expected_rule = self.expected.l1.W.update_rule
+            self.assertEqual(
+                sorted(param.update_rule.state),
+                sorted(expected_rule.state))
+
+    def check_hooks(self, create_hooks):
+        optimizer = self.create(self.target, True)
+        expected_optimizer = self.create(self.expected, False)
+        for hook in create_hooks():
+            optimizer.add_hook(hook)
+        for hook in create_hooks():
+            expected_optimizer.add_hook(hook)
+        for _ in range(3):
+            optimizer.update(self.target, self.x)
+            expected_optimizer.update(self.expected, self.x)
+        self.check_params()
+
+    def test_folded_hooks(self):
+        self.check_hooks(lambda: [
+            optimizer_hooks.GradientClipping(0.5),
+            optimizer_hooks.WeightDecay(0.1),
+            optimizer_hooks.Lasso(0.01),
+        ])
+
+    def test_unfolded_hooks(self):
+        # Gradient clipping after weight decay cannot be folded.
+        self.check_hooks(lambda: [
+            optimizer_hooks.WeightDecay(0.1),
+            optimizer_hooks.GradientClipping(0.5),
+        ])
+
+    def test_loss_scaling(self):
+        optimizer = self.create(self.target, True)
+        expected_optimizer = self.create(self.expected, False)
+        optimizer.add_hook(optimizer_hooks.WeightDecay(0.1))
+        expected_optimizer.add_hook(optimizer_hooks.WeightDecay(0.1))
+        optimizer.loss_scaling(scale=8.)
+        expected_optimizer.loss_scaling(scale=8.)
+        for _ in range(2):
+            optimizer.update(self.target, self.x)
+            expected_optimizer.update(self.expected, self.x)
+        self.check_params()
+
+    def test_unfusable_param(self):
+        optimizer = self.create(self.target, True)
+        expected_optimizer = self.create(self.expected, False)
+        self.target.l2.b.update_rule.enabled = False
+        self.expected.l2.b.update_rule.enabled = False
+        for _ in range(2):
+            optimizer.update(self.target, self.x)
+            expected_optimizer.update(self.expected, self.x)
+        self.check_params()
+        self.assertEqual(self.target.l2.b.update_rule.t, 0)
+
+    def test_replace_param_array(self):
+        optimizer = self.create(self.target, True)
+        expected_optimizer = self.create(self.expected, False)
+        optimizer.update(self.target, self.x)
+        expected_optimizer.update(self.expected, self.x)
+
+        # Replacing arrays repacks the parameters and keeps the states.
+        for param in self.target.params():
+            param.array = param.array.copy()
+        for _ in range(2):
+            optimizer.update(self.target, self.x)
+            expected_optimizer.update(self.expected, self.x)
+        self.check_params()
+
+    def test_serialize(self):
+        optimizer = self.create(self.target, True)
+        expected_optimizer = self.create(self.expected, False)
+        for _ in range(2):
+            optimizer.update(self.target, self.x)
+            expected_optimizer.update(self.expected, self.x)
+
+        target = self.expected.copy(mode='copy')
+        loaded_optimizer = self.create(target, True)
+        loaded_optimizer.update(target, self.x)
+        serializer = chainer.serializers.DictionarySerializer()
+        expected_optimizer.serialize(serializer)
+        chainer.serializers.NpzDeserializer(serializer.target).load(
+            loaded_optimizer)
+        target.copyparams(self.expected)
+        self.target = target
+
+        loaded_optimizer.update(target, self.x)
+        expected_optimizer.update(self.expected, self.x)
+        self.check_params()
+
+
 testing.run_module(__name__, __file__)
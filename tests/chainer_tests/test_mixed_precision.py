@@ -0,0 +1,99 @@
+import unittest
+
+import numpy
+
+import chainer
+from chainer import functions
+from chainer import links
+from chainer import mixed_precision
+from chainer import optimizers
+from chainer import testing
+
+
+class TestAutocast(unittest.TestCase):
+
+    def setUp(self):
+        self.link = links.Linear(3, 2)
+        self.x = numpy.random.uniform(-1, 1, (4, 3)).astype(numpy.float32)
+
+    def test_allow_list(self):
+        with mixed_precision.autocast():
+            y = self.link(self.x)
+        assert y.dtype == numpy.float16
+
+    def test_deny_list(self):
+        with mixed_precision.autocast():
+            y = functions.softmax(self.link(self.x))
+        assert y.dtype == numpy.float32
+
+    def test_promote(self):
+        with mixed_precision.autocast():
+            h = self.link(self.x)
+            y = h + chainer.Variable(numpy.ones((4, 2), numpy.float32))
+        assert h.dtype == numpy.float16
+        assert y.dtype == numpy.float32
+
+    def test_other_functions(self):
+        with mixed_precision.autocast():
+            y = functions.relu(self.link(self.x))
+        assert y.dtype == numpy.float16
+
+    def test_disabled(self):
+        y = self.link(self.x)
+        assert y.dtype == numpy.float32
+
+    def test_backward(self):
+        self.link.cleargrads()
+        with mixed_precision.autocast():
+            loss = functions.sum(self.link(self.x))
+        loss.backward()
+        assert self.link.W.grad.dtype == numpy.float32
+        numpy.testing.assert_allclose(
+            self.link.W.grad, numpy.broadcast_to(self.x.sum(0), (2, 3)),
+            rtol=1e-3, atol=1e-3)
+
+    def test_bfloat16(self):
+        with mixed_precision.autocast('bfloat16'):
+            y = self.link(self.x)
+        assert y.dtype == numpy.float32
+        x = numpy.array([1 + 2 ** -8, 1 + 3 * 2 ** -8, 1 + 2 ** -7],
+                        numpy.float32)
+        y = mixed_precision._RoundToBFloat16().apply((x,))[0]
+        numpy.testing.assert_array_equal(
+            y.array, [1, 1 + 2 ** -6, 1 + 2 ** -7])
+
+    def test_invalid_dtype(self):
+        with self.assertRaises(ValueError):
+            mixed_precision.autocast(numpy.float32)
+
+
+class TestGradientMethodMixedPrecision(unittest.TestCase):
+
+    def test_update(self):
+        link = links.Linear(3, 2)
+        optimizer = optimizers.SGD()
+        optimizer.setup(link)
+        optimizer.use_mixed_precision()
+        x = numpy.random.uniform(-1, 1, (4, 3)).astype(numpy.float32)
+        t = numpy.array([0, 1, 0, 1], numpy.int32)
+        dtypes = []
+
+        def lossfun():
+            y = link(x)
+            dtypes.append(y.dtype)
+            return functions.softmax_cross_entropy(y, t)
+
+        W = link.W.array.copy()
+        optimizer.update(lossfun)
+        assert dtypes == [numpy.float16]
+        assert link.W.dtype == numpy.float32
+        assert not numpy.array_equal(link.W.array, W)
+        assert optimizer._loss_scaling_is_dynamic
+
+    def test_disable(self):
+        optimizer = optimizers.SGD()
+        optimizer.use_mixed_precision(None)
+        assert optimizer._autocast is None
+
+
+testing.run_module(__name__, __file__)
@@ -276,6 +276,82 @@ class TestSummary(unittest.TestCase):
         testing.assert_allclose(std, 0.5)
 
 
+@backend.inject_backend_tests(
+    ['test_basic', 'test_mixed', 'test_serialize', 'test_flush'],
+    [{}, {'use_cuda': True}])
+class TestDeferredSummary(unittest.TestCase):
+
+    def setUp(self):
+        self.summary = chainer.reporter.Summary(deferred=True)
+
+    def test_basic(self, backend_config):
+        self.summary.add(backend_config.get_array(numpy.array(1, 'f')))
+        self.summary.add(backend_config.get_array(numpy.array(-2, 'f')))
+        self.assertEqual(self.summary._n, 0)
+
+        mean = self.summary.compute_mean()
+        testing.assert_allclose(mean, numpy.array(-0.5, 'f'))
+
+        mean, std = self.summary.make_statistics()
+        testing.assert_allclose(mean, numpy.array(-0.5, 'f'))
+        testing.assert_allclose(std, numpy.array(1.5, 'f'))
+
+    def test_mixed(self, backend_config):
+        self.summary.add(backend_config.get_array(numpy.array(1, 'f')))
+        self.summary.add(2., 0.5)
+        self.summary.add(backend_config.get_array(numpy.array(4, 'f')))
+
+        mean = self.summary.compute_mean()
+        testing.assert_allclose(mean, (1 + 2 * 0.5 + 4) / 2.5)
+
+    def test_serialize(self, backend_config):
+        self.summary.add(backend_config.get_array(numpy.array(1.5, 'f')))
+        self.summary.add(backend_config.get_array(numpy.array(2.0, 'f')))
+
+        summary = chainer.reporter.Summary(deferred=True)
+        testing.save_and_load_npz(self.summary, summary)
+        summary.add(backend_config.get_array(numpy.array(3.5, 'f')))
+
+        expected_mean = 7. / 3
+        expected_std = numpy.sqrt(
+            (1.5 ** 2 + 2. ** 2 + 3.5 ** 2) / 3 - expected_mean ** 2)
+        mean, std = summary.make_statistics()
+        testing.assert_allclose(mean, expected_mean)
+        testing.assert_allclose(std, expected_std)
+
+    def test_flush(self, backend_config):
+        n = chainer.reporter._DEFERRED_FLUSH_SIZE + 1
+        for _ in range(n):
+            self.summary.add(backend_config.get_array(numpy.array(2, 'f')))
+        self.assertEqual(self.summary._n, n - 1)
+
+        mean = self.summary.compute_mean()
+        testing.assert_allclose(mean, 2.)
+        self.assertEqual(self.summary._n, n)
+
+
+@backend.inject_backend_tests(None, [{}, {'use_cuda': True}])
+class TestToCpuScalars(unittest.TestCase):
+
+    def test_to_cpu_scalars(self, backend_config):
+        values = {
+            'int': 1,
+            'float': 2.5,
+            'numpy': numpy.array(3, 'i'),
+            'a': backend_config.get_array(numpy.array(4.5, 'f')),
+            'b': backend_config.get_array(numpy.array(5, 'i')),
+            'v': chainer.Variable(
+                backend_config.get_array(numpy.array(6, 'f'))),
+        }
+        result = chainer.reporter._to_cpu_scalars(values)
+        self.assertEqual(
+            result,
+            {'int': 1., 'float': 2.5, 'numpy': 3., 'a': 4.5, 'b': 5.,
+             'v': 6.})
+        for value in result.values():
+            self.assertIsInstance(value, float)
+
+
 class TestDictSummary(unittest.TestCase):
 
     def setUp(self):
@@ -449,4 +525,10 @@ class TestDictSummary(unittest.TestCase):
         })
 
 
+class TestDeferredDictSummary(TestDictSummary):
+
+    def setUp(self):
+        self.summary = chainer.reporter.DictSummary(deferred=True)
+
+
 testing.run_module(__name__, __file__)
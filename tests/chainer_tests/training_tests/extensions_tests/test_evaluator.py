@@ -1,5 +1,6 @@
 import unittest
 
+import mock
 import numpy
 
 import chainer
@@ -272,4 +273,117 @@ class TestEvaluatorRepeat(unittest.TestCase):
                 extensions.Evaluator(iterator, {})
 
 
+class SumModel(chainer.Chain):
+
+    def __init__(self):
+        super(SumModel, self).__init__()
+        with self.init_scope():
+            self.w = chainer.Parameter(numpy.array(2, 'f'))
+
+    def forward(self, x):
+        chainer.report({'loss': chainer.functions.sum(x * self.w)}, self)
+
+
+class MeanModel(SumModel):
+
+    def forward(self, x):
+        loss = chainer.functions.mean(
+            chainer.functions.sum(x * self.w, axis=1))
+        chainer.report({'loss': loss}, self)
+
+
+class TestEvaluatorSharded(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = numpy.random.uniform(-1, 1, (12, 3)).astype('f')
+        self.target = SumModel()
+        batches = [self.dataset[i:i + 4] for i in range(0, 12, 4)]
+        self.expect_mean = numpy.mean(
+            [(b * 2).sum() for b in batches])
+
+    def make_iterator(self):
+        return iterators.SerialIterator(
+            self.dataset, 4, repeat=False, shuffle=False)
+
+    def test_devices(self):
+        evaluator = extensions.Evaluator(
+            self.make_iterator(), self.target,
+            devices=['@numpy', '@numpy'])
+        # parameters of the copies are synchronized at each evaluation
+        self.target.w.array[...] = 1
+        expect_mean = self.expect_mean / 4
+        mean = evaluator()
+        self.assertAlmostEqual(mean['main/loss'], expect_mean, places=4)
+
+    def test_devices_uneven_shards(self):
+        # The batches of 5 examples are split into the shards of 3 and 2
+        # examples, whose means are weighted by their sizes.
+        target = MeanModel()
+        evaluator = extensions.Evaluator(
+            iterators.SerialIterator(
+                self.dataset[:10], 5, repeat=False, shuffle=False),
+            target, devices=['@numpy', '@numpy'])
+        expect_mean = numpy.mean(
+            [(self.dataset[i:i + 5] * 2).sum(axis=1).mean()
+             for i in (0, 5)])
+        mean = evaluator()
+        self.assertAlmostEqual(mean['main/loss'], expect_mean, places=4)
+
+    def test_devices_launch_before_collect(self):
+        # All the shards of a batch are evaluated before any of their
+        # values is accumulated.
+        events = []
+
+        class RecordingModel(SumModel):
+
+            def forward(self, x):
+                events.append('forward')
+                super(RecordingModel, self).forward(x)
+
+        evaluator = extensions.Evaluator(
+            self.make_iterator(), RecordingModel(),
+            devices=['@numpy', '@numpy'])
+        add = chainer.DictSummary.add
+
+        def recording_add(summary, d):
+            events.append('add')
+            add(summary, d)
+        with mock.patch.object(chainer.DictSummary, 'add', recording_add):
+            evaluator()
+        self.assertEqual(events, ['forward', 'forward', 'add', 'add'] * 3)
+
+    @testing.attr.multi_gpu(2)
+    def test_devices_gpu(self):
+        evaluator = extensions.Evaluator(
+            self.make_iterator(), self.target,
+            devices=['@cupy:0', '@cupy:1'])
+        mean = evaluator()
+        self.assertAlmostEqual(
+            mean['main/loss'], self.expect_mean, places=4)
+
+    def test_n_processes(self):
+        evaluator = extensions.Evaluator(
+            self.make_iterator(), self.target, n_processes=2)
+        mean = evaluator()
+        self.assertAlmostEqual(
+            mean['main/loss'], self.expect_mean, places=4)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            extensions.Evaluator(
+                self.make_iterator(), self.target, device='@numpy',
+                devices=['@numpy'])
+        with self.assertRaises(ValueError):
+            extensions.Evaluator(
+                self.make_iterator(), self.target, devices=['@numpy'],
+                n_processes=2)
+        with self.assertRaises(ValueError):
+            extensions.Evaluator(
+                self.make_iterator(), self.target, n_processes=0)
+        with self.assertRaises(ValueError):
+            extensions.Evaluator(
+                self.make_iterator(), self.target, device='@numpy',
+                n_processes=2)
+
+
 testing.run_module(__name__, __file__)
@@ -245,4 +245,97 @@ class TestTrainer(unittest.TestCase):
         self.assertTrue(dummy_extension.is_finalized)
 
 
+class CountingTrigger(training.triggers.IntervalTrigger):
+
+    def __init__(self, period, unit):
+        super(CountingTrigger, self).__init__(period, unit)
+        self.n_calls = 0
+
+    def __call__(self, trainer):
+        self.n_calls += 1
+        return super(CountingTrigger, self).__call__(trainer)
+
+
+class TestTrainerTriggerSchedule(unittest.TestCase):
+
+    def test_skip_interval_trigger(self):
+        trainer = testing.get_trainer_with_mock_updater((20, 'iteration'))
+        trigger = CountingTrigger(5, 'iteration')
+        called = []
+        trainer.extend(
+            lambda t: called.append(t.updater.iteration), trigger=trigger)
+        trainer.run()
+        self.assertEqual(called, [5, 10, 15, 20])
+        # evaluated at the first iteration and at each firing iteration
+        self.assertEqual(trigger.n_calls, 5)
+
+    def test_epoch_trigger_not_skipped(self):
+        trainer = testing.get_trainer_with_mock_updater(
+            (20, 'iteration'), iter_per_epoch=5)
+        trigger = CountingTrigger(1, 'epoch')
+        called = []
+        trainer.extend(
+            lambda t: called.append(t.updater.iteration), trigger=trigger)
+        trainer.run()
+        self.assertEqual(called, [5, 10, 15, 20])
+        self.assertEqual(trigger.n_calls, 20)
+
+    def test_skip_manual_schedule_trigger(self):
+        trainer = testing.get_trainer_with_mock_updater((20, 'iteration'))
+        trigger = training.triggers.ManualScheduleTrigger(
+            [3, 7, 16], 'iteration')
+        called = []
+        trainer.extend(
+            lambda t: called.append(t.updater.iteration), trigger=trigger)
+        trainer.run()
+        self.assertEqual(called, [3, 7, 16])
+        self.assertTrue(trigger.finished)
+
+    def test_reuse_observation(self):
+        updater = testing.get_trainer_with_mock_updater().updater
+        trainer = training.Trainer(
+            updater, (5, 'iteration'), reuse_observation=True)
+        observations = []
+
+        def extension(t):
+            self.assertNotIn('x', t.observation)
+            t.observation['x'] = t.updater.iteration
+            observations.append(t.observation)
+
+        trainer.extend(extension)
+        trainer.run()
+        self.assertEqual(len(observations), 5)
+        for observation in observations:
+            self.assertIs(observation, trainer.observation)
+        self.assertEqual(trainer.observation, {'x': 5})
+
+
+class TestTrainerOverheadProfile(unittest.TestCase):
+
+    def test_profile(self):
+        updater = testing.get_trainer_with_mock_updater().updater
+        updater.update_core = lambda: time.sleep(0.001)
+        trainer = training.Trainer(
+            updater, (10, 'iteration'), profile_overhead=True)
+        trainer.extend(lambda t: time.sleep(0.001), name='ext',
+                       trigger=(5, 'iteration'))
+        trainer.run()
+
+        profile = trainer.get_overhead_profile()
+        self.assertEqual(profile['iterations'], 10)
+        self.assertGreater(profile['update'], 0)
+        self.assertGreater(profile['extension/ext'], 0)
+        self.assertEqual(profile['extensions'], profile['extension/ext'])
+        self.assertGreaterEqual(profile['loop'], 0)
+        self.assertAlmostEqual(
+            profile['total'],
+            profile['update'] + profile['triggers'] + profile['extensions']
+            + profile['loop'])
+
+    def test_profile_disabled(self):
+        trainer = testing.get_trainer_with_mock_updater()
+        with self.assertRaises(RuntimeError):
+            trainer.get_overhead_profile()
+
+
 testing.run_module(__name__, __file__)
@@ -117,4 +117,22 @@ class TestIntervalTrigger(unittest.TestCase):
                 self.assertEqual(trigger(trainer), expected)
 
 
+class TestIntervalTriggerNextFiringIteration(unittest.TestCase):
+
+    def test_iteration(self):
+        trainer = testing.get_trainer_with_mock_updater(stop_trigger=None)
+        trigger = training.triggers.IntervalTrigger(3, 'iteration')
+        expected = [3, 3, 3, 6, 6, 6, 9]
+        for e in expected:
+            trigger(trainer)
+            self.assertEqual(trigger.get_next_firing_iteration(trainer), e)
+            trainer.updater.update()
+
+    def test_epoch(self):
+        trainer = testing.get_trainer_with_mock_updater(stop_trigger=None)
+        trigger = training.triggers.IntervalTrigger(1, 'epoch')
+        trigger(trainer)
+        self.assertIsNone(trigger.get_next_firing_iteration(trainer))
+
+
 testing.run_module(__name__, __file__)
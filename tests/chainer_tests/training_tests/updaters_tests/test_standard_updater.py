@@ -2,6 +2,7 @@ import unittest
 
 import mock
 import numpy
+import six
 
 import chainer
 from chainer.backends import _cpu
@@ -118,6 +119,300 @@ class TestUpdater(unittest.TestCase):
         self.assertEqual(serializer.called, [('iteration', 0)])
 
 
+@testing.parameterize(*testing.product({
+    'n_prefetch': [1, 3],
+}))
+class TestUpdaterPrefetch(unittest.TestCase):
+
+    def setUp(self):
+        self.target = chainer.Link()
+        self.optimizer = DummyOptimizer()
+        self.optimizer.setup(self.target)
+
+    def create_updater(self, dataset, repeat=True, shuffle=False):
+        iterator = chainer.iterators.SerialIterator(
+            dataset, 2, repeat=repeat, shuffle=shuffle)
+        updater = training.updaters.StandardUpdater(
+            iterator, self.optimizer, converter=lambda batch, device: batch,
+            n_prefetch=self.n_prefetch)
+        return iterator, updater
+
+    def test_update(self):
+        iterator, updater = self.create_updater(list(range(6)))
+        self.assertEqual(updater.epoch, 0)
+        self.assertFalse(updater.is_new_epoch)
+
+        expected = [
+            ([0, 1], 0, False), ([2, 3], 0, False), ([4, 5], 1, True),
+            ([0, 1], 1, False), ([2, 3], 1, False), ([4, 5], 2, True)]
+        for i, (batch, epoch, is_new_epoch) in enumerate(expected):
+            updater.update()
+            args, _ = self.optimizer.update.call_args
+            self.assertEqual(args[1], batch)
+            self.assertEqual(updater.iteration, i + 1)
+            self.assertEqual(updater.epoch, epoch)
+            self.assertEqual(updater.is_new_epoch, is_new_epoch)
+            self.assertAlmostEqual(updater.epoch_detail, (i + 1) / 3.)
+            # the iterator runs ahead of the consumed batches; it is read
+            # under the lock since the prefetch thread may be advancing it
+            with updater._prefetcher.lock:
+                iterator_epoch_detail = iterator.epoch_detail
+            self.assertGreaterEqual(iterator_epoch_detail, (i + 1) / 3.)
+        self.assertEqual(self.optimizer.epoch, 2)
+        updater.finalize()
+
+    def test_stop_iteration(self):
+        _, updater = self.create_updater(list(range(4)), repeat=False)
+        updater.update()
+        updater.update()
+        with self.assertRaises(StopIteration):
+            updater.update()
+        updater.finalize()
+
+    def test_error(self):
+        class Error(Exception):
+            pass
+
+        def converter(batch, device):
+            raise Error()
+
+        iterator = chainer.iterators.SerialIterator(list(range(4)), 2)
+        updater = training.updaters.StandardUpdater(
+            iterator, self.optimizer, converter=converter,
+            n_prefetch=self.n_prefetch)
+        with self.assertRaises(Error):
+            updater.update()
+        updater.finalize()
+
+    def test_serialize(self):
+        _, updater = self.create_updater(list(range(6)))
+        updater.update()
+        target = {}
+        updater.serialize(chainer.serializers.DictionarySerializer(target))
+
+        _, new_updater = self.create_updater(list(range(6)))
+        new_updater.update()
+        new_updater.serialize(chainer.serializers.NpzDeserializer(target))
+        self.assertEqual(new_updater.iteration, 1)
+        new_updater.update()
+        args, _ = self.optimizer.update.call_args
+        # training resumes from the saved state of the iterator, discarding
+        # the batches prefetched before loading
+        position = int(target['iterator:main/current_position'])
+        self.assertEqual(args[1], [position, position + 1])
+        updater.finalize()
+        new_updater.finalize()
+
+    def check_resume(self, shuffle):
+        _, updater = self.create_updater(list(range(7)), shuffle=shuffle)
+        updater.update()
+        updater.update()
+        target = {}
+        updater.serialize(chainer.serializers.DictionarySerializer(target))
+        epoch_detail = updater.epoch_detail
+        batches = []
+        for _ in range(4):
+            updater.update()
+            batches.append(self.optimizer.update.call_args[0][1])
+        updater.finalize()
+
+        _, new_updater = self.create_updater(list(range(7)), shuffle=shuffle)
+        new_updater.serialize(chainer.serializers.NpzDeserializer(target))
+        self.assertEqual(new_updater.epoch_detail, epoch_detail)
+        new_batches = []
+        for _ in range(4):
+            new_updater.update()
+            new_batches.append(self.optimizer.update.call_args[0][1])
+        new_updater.finalize()
+        return batches, new_batches
+
+    def test_resume(self):
+        # No batch is skipped on resume although the iterator was ahead of
+        # the consumed batches when saved.
+        batches, new_batches = self.check_resume(False)
+        self.assertEqual(new_batches, batches)
+
+    def test_resume_with_shuffle(self):
+        # The rest of the epoch follows the saved order, while the order of
+        # the next epoch is sampled again.
+        batches, new_batches = self.check_resume(True)
+        self.assertEqual(new_batches[0], batches[0])
+        self.assertEqual(new_batches[1][0], batches[1][0])
+
+    def test_unsupported_iterator(self):
+        with self.assertRaises(ValueError):
+            training.updaters.StandardUpdater(
+                DummyIterator([]), self.optimizer,
+                n_prefetch=self.n_prefetch)
+
+
+class LinearRegression(chainer.Chain):
+
+    def __init__(self):
+        super(LinearRegression, self).__init__()
+        with self.init_scope():
+            self.l = chainer.links.Linear(3, 1, initialW=numpy.ones((1, 3)))
+
+    def forward(self, x, t):
+        loss = chainer.functions.mean_squared_error(self.l(x), t)
+        chainer.report({'loss': loss}, self)
+        return loss
+
+
+@testing.parameterize(*testing.product({
+    'accumulation_steps': [2, 3, 8],
+    'n_prefetch': [0, 2],
+}))
+class TestUpdaterAccumulation(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = [
+            (numpy.random.uniform(-1, 1, (3,)).astype('f'),
+             numpy.random.uniform(-1, 1, (1,)).astype('f'))
+            for _ in range(10)]
+
+    def run_updater(self, accumulation_steps, n_prefetch=0):
+        model = LinearRegression()
+        optimizer = chainer.optimizers.SGD(lr=0.1)
+        optimizer.setup(model)
+        iterator = chainer.iterators.SerialIterator(
+            self.dataset, 5, shuffle=False)
+        updater = training.updaters.StandardUpdater(
+            iterator, optimizer, accumulation_steps=accumulation_steps,
+            n_prefetch=n_prefetch)
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', model)
+        observations = []
+        for _ in range(4):
+            observation = {}
+            with reporter.scope(observation):
+                updater.update()
+            observations.append(observation)
+        updater.finalize()
+        return model, optimizer, updater, observations
+
+    def test_update(self):
+        expected_model, _, _, expected_observations = self.run_updater(1)
+        model, optimizer, updater, observations = self.run_updater(
+            self.accumulation_steps, self.n_prefetch)
+
+        testing.assert_allclose(
+            model.l.W.array, expected_model.l.W.array, rtol=1e-5)
+        testing.assert_allclose(
+            model.l.b.array, expected_model.l.b.array, rtol=1e-5)
+        for observation, expected in zip(observations, expected_observations):
+            testing.assert_allclose(
+                observation['main/loss'], expected['main/loss'].array,
+                rtol=1e-5)
+
+        # each update consumes exactly one batch
+        self.assertEqual(optimizer.t, 4)
+        self.assertEqual(updater.epoch, 2)
+        self.assertEqual(optimizer.epoch, 2)
+
+    def test_invalid_accumulation_steps(self):
+        with self.assertRaises(ValueError):
+            training.updaters.StandardUpdater(
+                chainer.iterators.SerialIterator(self.dataset, 5),
+                chainer.optimizers.SGD(), accumulation_steps=0)
+
+
+class TestParallelUpdaterAccumulation(unittest.TestCase):
+
+    def test_update(self):
+        dataset = [
+            (numpy.random.uniform(-1, 1, (3,)).astype('f'),
+             numpy.random.uniform(-1, 1, (1,)).astype('f'))
+            for _ in range(8)]
+        models = []
+        for accumulation_steps in (1, 2):
+            model = LinearRegression()
+            optimizer = chainer.optimizers.SGD(lr=0.1)
+            optimizer.setup(model)
+            iterator = chainer.iterators.SerialIterator(
+                dataset, 8, shuffle=False)
+            updater = training.updaters.ParallelUpdater(
+                iterator, optimizer, devices={'main': -1, 'second': -1},
+                accumulation_steps=accumulation_steps)
+            reporter = chainer.Reporter()
+            for name, m in six.iteritems(updater._models):
+                reporter.add_observer(name, m)
+            with reporter:
+                updater.update()
+            models.append(model)
+
+        testing.assert_allclose(
+            models[0].l.W.array, models[1].l.W.array, rtol=1e-5)
+        testing.assert_allclose(
+            models[0].l.b.array, models[1].l.b.array, rtol=1e-5)
+
+
+class DtypeRecordingRegression(LinearRegression):
+
+    def __init__(self):
+        super(DtypeRecordingRegression, self).__init__()
+        self.dtypes = []
+
+    def forward(self, x, t):
+        y = self.l(x)
+        self.dtypes.append(y.dtype)
+        return chainer.functions.mean_squared_error(y, t)
+
+
+@testing.parameterize(*testing.product({
+    'updater': ['standard', 'parallel'],
+    'accumulation_steps': [1, 2],
+}))
+class TestUpdaterMixedPrecision(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = [
+            (numpy.random.uniform(-1, 1, (3,)).astype('f'),
+             numpy.random.uniform(-1, 1, (1,)).astype('f'))
+            for _ in range(8)]
+
+    def run_updater(self, mixed_precision):
+        model = DtypeRecordingRegression()
+        optimizer = chainer.optimizers.SGD(lr=0.1)
+        optimizer.setup(model)
+        if mixed_precision:
+            optimizer.use_mixed_precision(scale=128.)
+        iterator = chainer.iterators.SerialIterator(
+            self.dataset, 8, shuffle=False)
+        if self.updater == 'standard':
+            updater = training.updaters.StandardUpdater(
+                iterator, optimizer,
+                accumulation_steps=self.accumulation_steps)
+        else:
+            updater = training.updaters.ParallelUpdater(
+                iterator, optimizer, devices={'main': -1, 'second': -1},
+                accumulation_steps=self.accumulation_steps)
+        reporter = chainer.Reporter()
+        for name, m in six.iteritems(getattr(updater, '_models', {})):
+            reporter.add_observer(name, m)
+        with reporter:
+            updater.update()
+        updater.finalize()
+        return model, updater
+
+    def test_update(self):
+        # The loss functions called by the updaters outside
+        # optimizer.update are also run in the autocast mode.
+        expected_model, _ = self.run_updater(False)
+        model, updater = self.run_updater(True)
+
+        models = getattr(updater, '_models', {'main': model}).values()
+        dtypes = sum([m.dtypes for m in models], [])
+        self.assertTrue(dtypes)
+        self.assertEqual(set(dtypes), {numpy.dtype(numpy.float16)})
+        self.assertEqual(model.l.W.dtype, numpy.float32)
+        # The gradients are unscaled by the loss scale.
+        testing.assert_allclose(
+            model.l.W.array, expected_model.l.W.array, atol=1e-2)
+        testing.assert_allclose(
+            model.l.b.array, expected_model.l.b.array, atol=1e-2)
+
+
 class TestUpdaterUpdateArguments(unittest.TestCase):
 
     def setUp(self):
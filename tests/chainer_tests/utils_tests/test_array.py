@@ -53,4 +53,38 @@ class TestSumTo(unittest.TestCase):
         numpy.testing.assert_array_equal(y_expect, y_actual)
 
 
+@testing.parameterize(*testing.product_dict([
+    {'shape': (5, 3), 'slices': ([0, 1, 0, 4, -1, 4],), 'b_shape': (6, 3)},
+    {'shape': (5, 3), 'slices': ([[0, 1], [1, 1]],), 'b_shape': (2, 2, 3)},
+    {'shape': (5, 3), 'slices': ([0, 0, 1],), 'b_shape': (3,)},
+    {'shape': (5, 3), 'slices': ([0, 1, 0], [2, 2, 2]), 'b_shape': (3,)},
+    {'shape': (5, 3), 'slices': (slice(None), [0, 0, 2]), 'b_shape': (5, 3)},
+    {'shape': (5, 3, 2), 'slices': (Ellipsis, [1, 1]), 'b_shape': (5, 3, 2)},
+    {'shape': (5, 3), 'slices': (slice(1, 3),), 'b_shape': (2, 3)},
+    {'shape': (5, 3), 'slices': ([True, False, True, False, True],),
+     'b_shape': (3, 3)},
+    {'shape': (5, 3), 'slices': (numpy.array([], numpy.int32),),
+     'b_shape': (0, 3)},
+], [
+    {'c_contiguous': True},
+    {'c_contiguous': False},
+]))
+class TestAddAt(unittest.TestCase):
+
+    def test_add_at(self):
+        if self.c_contiguous:
+            a = numpy.random.uniform(-1, 1, self.shape).astype(numpy.float32)
+        else:
+            a = numpy.random.uniform(
+                -1, 1, self.shape[::-1]).astype(numpy.float32).T
+        b = numpy.random.uniform(-1, 1, self.b_shape).astype(numpy.float32)
+        slices = tuple(
+            numpy.array(s) if isinstance(s, list) else s
+            for s in self.slices)
+        expect = a.copy()
+        numpy.add.at(expect, slices, b)
+        array.add_at(a, slices, b)
+        numpy.testing.assert_allclose(a, expect, rtol=1e-6, atol=1e-6)
+
+
 testing.run_module(__name__, __file__)
@@ -0,0 +1,83 @@
+import mpi4py.MPI
+import numpy as np
+import pytest
+import unittest
+
+import chainer
+import chainer.testing
+import chainermn
+from chainermn.communicators import _allreduce_algorithms
+from chainermn.communicators import _communication_utility
+
+
+@chainer.testing.parameterize(*chainer.testing.product({
+    'n': [0, 1, 7, 1000],
+    'dtype': [np.float32, np.float64],
+}))
+class TestAllreduceAlgorithms(unittest.TestCase):
+
+    def setUp(self):
+        self.mpi_comm = mpi4py.MPI.COMM_WORLD
+        self.x = np.arange(self.n, dtype=self.dtype) * (self.mpi_comm.rank + 1)
+        size = self.mpi_comm.size
+        self.expected = (np.arange(self.n, dtype=self.dtype) *
+                         size * (size + 1) / 2)
+
+    def test_ring_allreduce(self):
+        _allreduce_algorithms.ring_allreduce(self.mpi_comm, self.x)
+        chainer.testing.assert_allclose(self.x, self.expected)
+
+    def test_recursive_halving_doubling_allreduce(self):
+        _allreduce_algorithms.recursive_halving_doubling_allreduce(
+            self.mpi_comm, self.x)
+        chainer.testing.assert_allclose(self.x, self.expected)
+
+    def test_hierarchical_allreduce(self):
+        ranks = _communication_utility.init_ranks(self.mpi_comm)
+        intra_mpi_comm = _communication_utility.init_intra_mpi_comm(
+            self.mpi_comm, ranks[1], ranks[3])
+        inter_mpi_comm = _communication_utility.init_inter_mpi_comm(
+            self.mpi_comm, ranks[1], ranks[3])
+        _allreduce_algorithms.hierarchical_allreduce(
+            intra_mpi_comm, inter_mpi_comm, self.x)
+        chainer.testing.assert_allclose(self.x, self.expected)
+
+
+class ExampleModel(chainer.Chain):
+
+    def __init__(self):
+        super(ExampleModel, self).__init__()
+        with self.init_scope():
+            self.a = chainer.links.Linear(2, 3)
+            self.b = chainer.links.Linear(3, 4)
+
+
+@chainer.testing.parameterize(*chainer.testing.product({
+    'allreduce_algorithm': list(_allreduce_algorithms.algorithms),
+}))
+class TestNaiveCommunicatorWithAllreduceAlgorithm(unittest.TestCase):
+
+    def test_allreduce_grad(self):
+        comm = chainermn.create_communicator(
+            'naive', allreduce_algorithm=self.allreduce_algorithm)
+        model = ExampleModel()
+        for i, param in enumerate(model.params()):
+            param.grad[...] = comm.rank + i
+        comm.allreduce_grad(model)
+        base = (comm.size - 1.0) / 2
+        for i, param in enumerate(model.params()):
+            chainer.testing.assert_allclose(
+                param.grad, (base + i) * np.ones(param.shape))
+
+
+class TestInvalidAllreduceAlgorithm(unittest.TestCase):
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(ValueError):
+            chainermn.create_communicator(
+                'naive', allreduce_algorithm='unknown')
+
+    def test_unsupported_communicator(self):
+        with pytest.raises(ValueError):
+            chainermn.create_communicator(
+                'flat', allreduce_algorithm='ring')
@@ -0,0 +1,76 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import chainer
+import chainer.functions as F
+import chainer.links as L
+import numpy as np
+
+import chainermn
+from chainermn.communicators import CommunicationProfiler
+from chainermn.communicators.naive_communicator import NaiveCommunicator
+
+
+class TestCommunicationProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.communicator = CommunicationProfiler(
+            chainermn.create_communicator('naive'), trace=True)
+
+    def test_isinstance(self):
+        self.assertIsInstance(self.communicator, NaiveCommunicator)
+        self.assertEqual(self.communicator.size,
+                         self.communicator.communicator.size)
+
+    def test_stats(self):
+        model = L.Linear(3, 2)
+        model.cleargrads()
+        F.sum(model(np.ones((1, 3), dtype=np.float32))).backward()
+        self.communicator.allreduce_grad(model)
+        self.communicator.allreduce_grad(model)
+        x = np.arange(4, dtype=np.float32)
+        self.communicator.multi_node_mean(None, x)
+        self.communicator.bcast_obj(
+            {'a': 1} if self.communicator.rank == 0 else None)
+
+        stats = self.communicator.get_stats()
+        self.assertEqual(stats['allreduce_grad'][:2], (2, 2 * 4 * (6 + 2)))
+        self.assertEqual(stats['multi_node_mean'][:2], (1, 16))
+        self.assertEqual(stats['bcast_obj'][:2], (1, 0))
+
+        observation = {}
+        with chainer.Reporter().scope(observation):
+            self.communicator.report()
+        self.assertEqual(observation['comm/allreduce_grad/calls'], 2)
+        self.assertEqual(observation['comm/multi_node_mean/bytes'], 16)
+        self.assertGreaterEqual(observation['comm/time'], 0)
+        self.assertGreaterEqual(observation['comm/ratio'], 0)
+        self.assertEqual(self.communicator.get_stats(), {})
+
+    def test_dump_trace(self):
+        x = np.arange(4, dtype=np.float32)
+        self.communicator.multi_node_mean(None, x)
+
+        if self.communicator.rank == 0:
+            path = tempfile.mkdtemp()
+        else:
+            path = None
+        path = self.communicator.bcast_obj(path)
+        # The call of bcast_obj is also recorded.
+        self.communicator.dump_trace(os.path.join(path, 'trace.{rank}.json'))
+        filename = os.path.join(
+            path, 'trace.{}.json'.format(self.communicator.rank))
+        with open(filename) as f:
+            events = json.load(f)['traceEvents']
+        self.communicator.mpi_comm.barrier()
+        if self.communicator.rank == 0:
+            shutil.rmtree(path)
+
+        self.assertEqual([e['name'] for e in events[1:]],
+                         ['multi_node_mean', 'bcast_obj'])
+        self.assertEqual(events[1]['pid'], self.communicator.rank)
+        self.assertEqual(events[1]['args']['bytes'], 16)
+        self.assertEqual(events[1]['args']['algorithm'], 'NaiveCommunicator')
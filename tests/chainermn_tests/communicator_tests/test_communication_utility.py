@@ -34,3 +34,51 @@ class TestCommunicationUtility(unittest.TestCase):
         assert len(dst) == len(obj)
         for i in range(len(obj)):
             assert dst[i] == obj[i]
+
+    def test_chunked_bcast_obj_out_of_band(self):
+        # The large array is broadcast apart from the pickled bytes.
+        obj = {'small': np.arange(10), 'large': np.arange(100000),
+               'non_contiguous': np.arange(100000)[::2]}
+        src = obj if self.communicator.rank == 0 else None
+        dst = chunked_bcast_obj(src, self.communicator.mpi_comm, 1000)
+        for key, value in obj.items():
+            np.testing.assert_array_equal(dst[key], value)
+
+
+class TestObjectCommunication(unittest.TestCase):
+
+    def setUp(self):
+        self.communicator = NaiveCommunicator(mpi4py.MPI.COMM_WORLD)
+
+    def make_obj(self, rank):
+        return {'rank': rank, 'small': np.arange(10) + rank,
+                'large': np.arange(100000, dtype=np.float32) + rank}
+
+    def check_obj(self, obj, rank):
+        self.assertEqual(obj['rank'], rank)
+        expected = self.make_obj(rank)
+        for key in ('small', 'large'):
+            np.testing.assert_array_equal(obj[key], expected[key])
+
+    def test_send_recv_obj(self):
+        if self.communicator.size < 2:
+            pytest.skip('This test is for multiple processes')
+        rank = self.communicator.rank
+        if rank == 0:
+            self.communicator.send_obj(self.make_obj(rank), dest=1)
+        elif rank == 1:
+            self.check_obj(self.communicator.recv_obj(source=0), 0)
+
+    def test_gather_obj(self):
+        obj = self.make_obj(self.communicator.rank)
+        objs = self.communicator.gather_obj(obj)
+        if self.communicator.rank == 0:
+            self.assertEqual(len(objs), self.communicator.size)
+            for rank, gathered in enumerate(objs):
+                self.check_obj(gathered, rank)
+            # The gathered object does not share the memory with the
+            # original one.
+            objs[0]['large'][...] = -1
+            self.check_obj(obj, 0)
+        else:
+            self.assertIsNone(objs)
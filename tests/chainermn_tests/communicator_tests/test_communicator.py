@@ -22,6 +22,8 @@ from chainermn.communicators.non_cuda_aware_communicator \
     import NonCudaAwareCommunicator
 from chainermn.communicators.pure_nccl_communicator \
     import PureNcclCommunicator
+from chainermn.communicators.shared_memory_communicator \
+    import SharedMemoryCommunicator
 from chainermn.communicators.single_node_communicator \
     import SingleNodeCommunicator
 from chainermn.communicators.two_dimensional_communicator \
@@ -81,6 +83,13 @@ cpu_params = [Param(p) for p in [
     {
         'communicator_class': NaiveCommunicator,
         'multi_node': True,
+    }, {
+        'communicator_class': SharedMemoryCommunicator,
+        'multi_node': True,
+    }, {
+        'communicator_class': SharedMemoryCommunicator,
+        'model_dtype': np.float64,
+        'multi_node': True,
     }]]
 
 gpu_params = [Param(p) for p in [
@@ -484,6 +493,18 @@ def test_mixed_dtype_communicator_gpu(param):
         check_allreduce_grad_mixed_dtype(param, model, True)
 
 
+def test_shared_memory_communicator_different_sizes():
+    # The arrays of different sizes are reduced one after another, so that
+    # the rows of an array overlap the result of the previous one.
+    communicator = SharedMemoryCommunicator(mpi_comm)
+    base = (communicator.size - 1.0) / 2
+    for _ in range(10):
+        for n in [1000, 3, 257]:
+            array = np.full((n, ), communicator.rank, dtype=np.float32)
+            communicator.multi_node_mean(None, array)
+            chainer.testing.assert_allclose(array, base * np.ones((n, )))
+
+
 class TestPureNcclCommunicator(unittest.TestCase):
 
     def setUp(self):
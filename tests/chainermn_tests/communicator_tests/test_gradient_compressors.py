@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+import unittest
+
+import chainer
+import chainer.testing
+import chainermn
+from chainermn.communicators import gradient_compressors
+
+
+class ExampleModel(chainer.Chain):
+
+    def __init__(self):
+        super(ExampleModel, self).__init__()
+        with self.init_scope():
+            self.a = chainer.links.Linear(20, 30)
+            self.b = chainer.links.Linear(30, 4)
+
+
+@chainer.testing.parameterize(
+    {'compression': 'fp16', 'n_iterations': 1},
+    {'compression': 'topk', 'n_iterations': 100},
+    {'compression': 'powersgd', 'n_iterations': 100},
+)
+class TestGradientCompressors(unittest.TestCase):
+
+    def setUp(self):
+        compression = self.compression
+        if compression == 'topk':
+            # With the default ratio of 1%, the residuals are not sent
+            # within the iterations of the test.
+            compression = gradient_compressors.TopKCompressor(ratio=0.3)
+        self.comm = chainermn.create_communicator(
+            'naive', gradient_compression=compression)
+        self.model = ExampleModel()
+
+    def test_allreduce_grad(self):
+        # With error feedback, the sum of the communicated gradients
+        # approaches the sum of the actual mean gradients.
+        expected = {}
+        actual = {}
+        for _ in range(self.n_iterations):
+            for name, param in self.model.namedparams():
+                grad = (np.arange(param.size) % 5 + self.comm.rank)
+                param.grad = grad.reshape(param.shape).astype(np.float32)
+                mean = (np.arange(param.size) % 5 +
+                        (self.comm.size - 1) / 2.)
+                expected[name] = expected.get(name, 0) + mean.reshape(
+                    param.shape)
+            self.comm.allreduce_grad(self.model)
+            for name, param in self.model.namedparams():
+                actual[name] = actual.get(name, 0) + param.grad
+
+        for name in expected:
+            chainer.testing.assert_allclose(
+                actual[name] / self.n_iterations,
+                expected[name] / self.n_iterations, atol=0.1, rtol=0.1)
+
+
+class TestCreateCommunicatorWithGradientCompression(unittest.TestCase):
+
+    def test_compressor_object(self):
+        compressor = gradient_compressors.TopKCompressor(ratio=0.1)
+        comm = chainermn.create_communicator(
+            'naive', gradient_compression=compressor)
+        assert comm.gradient_compressor is compressor
+
+    def test_unknown_compression(self):
+        with pytest.raises(ValueError):
+            chainermn.create_communicator(
+                'naive', gradient_compression='unknown')
+
+    def test_unsupported_communicator(self):
+        with pytest.raises(ValueError):
+            chainermn.create_communicator(
+                'pure_nccl', gradient_compression='fp16')
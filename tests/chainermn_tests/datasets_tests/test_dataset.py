@@ -54,6 +54,51 @@ class TestDataset(unittest.TestCase):
                 self.check_scatter_dataset(np.arange(n), shuffle, root)
                 self.check_scatter_dataset(np.arange(n * 5 - 1), shuffle, root)
 
+    def check_scatter_index(self, original_dataset, shuffle=False, root=0):
+        my_dataset = chainermn.scatter_dataset(
+            original_dataset, self.communicator,
+            shuffle=shuffle, root=root, scatter_index=True)
+        sub_datasets = self.mpi_comm.allgather(my_dataset[:])
+
+        sub_sizes = [len(sub_dataset) for sub_dataset in sub_datasets]
+        self.assertEqual(len(set(sub_sizes)), 1)
+        joined_dataset = sum((list(sub_dataset)
+                              for sub_dataset in sub_datasets), [])
+        self.assertEqual(set(joined_dataset), set(original_dataset))
+        return my_dataset
+
+    def test_scatter_index(self):
+        n = self.communicator.size
+
+        for shuffle in [True, False]:
+            for root in range(self.communicator.size):
+                self.check_scatter_index([], shuffle, root)
+                self.check_scatter_index([0], shuffle, root)
+                self.check_scatter_index(list(range(n * 5 - 1)),
+                                         shuffle, root)
+                self.check_scatter_index(np.arange(n * 5 - 1), shuffle, root)
+
+    def test_scatter_index_set_epoch(self):
+        original_dataset = list(range(self.communicator.size * 10))
+        my_dataset = self.check_scatter_index(original_dataset, shuffle=True)
+        examples = my_dataset[:]
+        my_dataset.set_epoch(1)
+        self.assertNotEqual(my_dataset[:], examples)
+        all_examples = self.mpi_comm.allgather(my_dataset[:])
+        self.assertEqual(sorted(sum(all_examples, [])), original_dataset)
+
+    def test_scatter_index_different_length(self):
+        if self.communicator.size == 1:
+            pytest.skip('This test is for multinode')
+        dataset = list(range(self.communicator.rank))
+        if self.communicator.rank == 0:
+            chainermn.scatter_dataset(
+                dataset, self.communicator, scatter_index=True)
+        else:
+            with pytest.raises(ValueError):
+                chainermn.scatter_dataset(
+                    dataset, self.communicator, scatter_index=True)
+
 
 def scatter_large_data(communicator):
     data = []
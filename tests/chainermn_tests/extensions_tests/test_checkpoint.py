@@ -1,4 +1,5 @@
 import os
+import shutil
 import tempfile
 import unittest
 
@@ -13,6 +14,9 @@ from chainer import training
 
 import chainermn
 from chainermn.extensions.checkpoint import _CheckpointStats
+from chainermn.extensions.checkpoint import _is_iterator_position
+from chainermn.extensions.checkpoint import _save
+from chainermn.extensions.checkpoint import _Snapshot
 from chainermn.extensions.checkpoint import create_multi_node_checkpointer
 
 
@@ -191,3 +195,98 @@ class TestCheckpoint(unittest.TestCase):
 
         self.assertGreaterEqual(sum_accuracy / test_count, 0.95)
         os.removedirs(path)
+
+
+class TestElasticCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.communicator = chainermn.create_communicator('naive')
+        if self.communicator.rank == 0:
+            path = tempfile.mkdtemp(dir='/tmp', prefix=__name__ + '-tmp-')
+        else:
+            path = None
+        self.path = self.communicator.bcast_obj(path)
+
+    def tearDown(self):
+        self.communicator.mpi_comm.barrier()
+        if self.communicator.rank == 0:
+            shutil.rmtree(self.path)
+
+    def setup_updater(self, seed):
+        comm = self.communicator
+        np.random.seed(seed)
+        model = L.Linear(3, 2)
+        optimizer = chainermn.create_multi_node_optimizer(
+            chainer.optimizers.MomentumSGD(lr=0.1), comm)
+        optimizer.setup(model)
+        model.cleargrads()
+        F.sum(model(np.ones((1, 3), dtype=np.float32))).backward()
+        optimizer.actual_optimizer.update()
+
+        dataset = list(range(comm.rank, 24, comm.size))
+        train_iter = chainer.iterators.SerialIterator(dataset, 2)
+        updater = training.StandardUpdater(train_iter, optimizer)
+        return updater, optimizer, train_iter, model
+
+    def test_is_iterator_position(self):
+        self.assertTrue(_is_iterator_position('iterator:main/order'))
+        self.assertTrue(
+            _is_iterator_position('updater/iterator:main/current_position'))
+        self.assertFalse(_is_iterator_position('iterator:main/epoch'))
+        self.assertFalse(_is_iterator_position('optimizer:main/t'))
+
+    def test_resume_with_more_processes(self):
+        # Snapshots of iterations 3 and 4 are taken by one more processes
+        # than the current ones, and that of iteration 4 of the last process
+        # is lost.
+        comm = self.communicator
+        updater, optimizer, train_iter, model = self.setup_updater(0)
+        train_iter.next()
+        train_iter.next()
+        saved_size = comm.size + 1
+        if comm.rank == 0:
+            for iteration in (3, 4):
+                updater.iteration = iteration
+                for rank in range(saved_size - (iteration == 4)):
+                    _save(self.path, 'elastic.{}.{}'.format(rank, iteration),
+                          _Snapshot(updater, saved_size, 0.1))
+        comm.mpi_comm.barrier()
+
+        updater2, optimizer2, train_iter2, model2 = self.setup_updater(1)
+        checkpointer = create_multi_node_checkpointer(
+            name='elastic', comm=comm, path=self.path, elastic=True)
+        checkpointer.maybe_load(updater2, optimizer2, lr_attr='lr')
+
+        self.assertEqual(updater2.iteration, 4)
+        self.assertEqual(train_iter2.epoch, train_iter.epoch)
+        self.assertEqual(train_iter2.current_position, 0)
+        self.assertEqual(len(train_iter2._state.order),
+                         len(train_iter2.dataset))
+        self.assertAlmostEqual(optimizer2.lr, 0.1 * comm.size / saved_size)
+        self.assertFalse(optimizer2.needs_broadcast)
+        if comm.rank == 0:
+            chainer.testing.assert_allclose(model2.W.array, model.W.array)
+
+    def test_resume_with_same_processes(self):
+        comm = self.communicator
+        updater, optimizer, train_iter, model = self.setup_updater(0)
+        checkpointer = create_multi_node_checkpointer(
+            name='elastic', comm=comm, path=self.path, elastic=True)
+        checkpointer.maybe_load(updater, optimizer, lr_attr='lr')
+        self.assertEqual(updater.iteration, 0)
+        train_iter.next()
+        updater.iteration = 1
+        optimizer.lr = 0.05
+        checkpointer.save(updater, updater.iteration)
+
+        updater2, optimizer2, train_iter2, model2 = self.setup_updater(1)
+        checkpointer2 = create_multi_node_checkpointer(
+            name='elastic', comm=comm, path=self.path, elastic=True)
+        checkpointer2.maybe_load(updater2, optimizer2, lr_attr='lr')
+
+        self.assertEqual(updater2.iteration, 1)
+        self.assertEqual(train_iter2.current_position,
+                         train_iter.current_position)
+        self.assertAlmostEqual(optimizer2.lr, 0.05)
+        chainer.testing.assert_allclose(model2.W.array, model.W.array)
+        checkpointer2.finalize()
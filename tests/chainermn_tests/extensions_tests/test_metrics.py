@@ -0,0 +1,62 @@
+import numpy as np
+import unittest
+
+import chainer
+import chainer.testing
+from chainermn.extensions import BinaryAUCMetric
+from chainermn.extensions import ConfusionMatrixMetric
+from chainermn.extensions import MeanMetric
+
+
+class TestMeanMetric(unittest.TestCase):
+
+    def test_compute(self):
+        metric = MeanMetric()
+        metric.update(np.array([1., 2.]), weight=2)
+        metric.update(chainer.Variable(np.array(3.)))
+        self.assertAlmostEqual(metric.compute(), 9. / 3)
+        metric.reset()
+        np.testing.assert_array_equal(metric.state, [0, 0])
+
+
+class TestConfusionMatrixMetric(unittest.TestCase):
+
+    def test_compute(self):
+        metric = ConfusionMatrixMetric(3)
+        y = np.array([[1., 0., 0.], [0., 1., 0.], [0., 0., 1.]])
+        metric.update(y, np.array([0, 2, 2]))
+        metric.update(np.array([1, 1]), np.array([1, -1]))
+        np.testing.assert_array_equal(
+            metric.matrix, [[1, 0, 0], [0, 1, 0], [0, 1, 1]])
+        result = metric.compute()
+        self.assertAlmostEqual(result['accuracy'], 3. / 4)
+        self.assertAlmostEqual(result['mean_recall'], (1 + 1 + 0.5) / 3)
+
+
+class TestBinaryAUCMetric(unittest.TestCase):
+
+    def test_compute(self):
+        rng = np.random.RandomState(0)
+        y = rng.rand(100).astype(np.float32)
+        t = rng.randint(0, 2, size=100)
+        metric = BinaryAUCMetric(n_bins=100000)
+        metric.update(y[:30], t[:30])
+        metric.update(y[30:], t[30:])
+
+        positives = y[t == 1]
+        negatives = y[t == 0]
+        expected = np.mean([[p > n for n in negatives] for p in positives])
+        chainer.testing.assert_allclose(metric.compute(), expected)
+
+    def test_merge(self):
+        rng = np.random.RandomState(0)
+        y = rng.rand(100)
+        t = rng.randint(0, 2, size=100)
+        metric = BinaryAUCMetric()
+        metric.update(y, t)
+        metric0 = BinaryAUCMetric()
+        metric0.update(y[:50], t[:50])
+        metric1 = BinaryAUCMetric()
+        metric1.update(y[50:], t[50:])
+        metric0.state += metric1.state
+        self.assertAlmostEqual(metric0.compute(), metric.compute())
@@ -0,0 +1,73 @@
+import numpy as np
+import unittest
+
+import chainer
+from chainer.training import extensions
+import chainer.testing
+import chainermn
+
+
+class ExampleModel(chainer.Link):
+
+    def __call__(self, x):
+        chainer.report({'value': chainer.functions.mean(x)}, self)
+
+
+class TestMultiNodeEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.comm = chainermn.create_communicator('naive')
+        size = self.comm.size
+        # The shard of rank r has r + 1 examples, so that the shards are
+        # uneven.
+        self.n_examples = [r + 1 for r in range(size)]
+        self.x = np.arange(sum(self.n_examples), dtype=np.float32)
+        begin = sum(self.n_examples[:self.comm.rank])
+        self.x_local = self.x[begin:begin + self.n_examples[self.comm.rank]]
+
+    def test_evaluate(self):
+        model = ExampleModel()
+        metric = chainermn.extensions.MeanMetric()
+
+        def eval_func(x):
+            model(x)
+            metric.update(x * 2, weight=len(x))
+
+        iterator = chainer.iterators.SerialIterator(
+            self.x_local, 1, repeat=False, shuffle=False)
+        evaluator = chainermn.create_multi_node_evaluator(
+            extensions.Evaluator(iterator, model, eval_func=eval_func),
+            self.comm, metrics={'double': metric})
+
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', model)
+        with reporter:
+            result = evaluator.evaluate()
+
+        chainer.testing.assert_allclose(result['main/value'], self.x.mean())
+        chainer.testing.assert_allclose(result['double'], self.x.mean() * 2)
+
+    def check_evaluate_sharded(self, **kwargs):
+        # The batches are counted by Evaluator, since the evaluation
+        # function is not called in this process.
+        model = ExampleModel()
+        iterator = chainer.iterators.SerialIterator(
+            self.x_local, 1, repeat=False, shuffle=False)
+        evaluator = chainermn.create_multi_node_evaluator(
+            extensions.Evaluator(iterator, model, **kwargs), self.comm)
+        result = evaluator()
+        chainer.testing.assert_allclose(result['main/value'], self.x.mean())
+
+    def test_evaluate_devices(self):
+        self.check_evaluate_sharded(devices=['@numpy', '@numpy'])
+
+    def test_evaluate_n_processes(self):
+        self.check_evaluate_sharded(n_processes=2)
+
+    def test_metrics_with_n_processes(self):
+        iterator = chainer.iterators.SerialIterator(
+            self.x_local, 1, repeat=False, shuffle=False)
+        with self.assertRaises(ValueError):
+            chainermn.create_multi_node_evaluator(
+                extensions.Evaluator(iterator, ExampleModel(), n_processes=2),
+                self.comm, metrics={'mean': chainermn.extensions.MeanMetric()})
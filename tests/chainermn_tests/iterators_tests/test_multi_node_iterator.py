@@ -2,8 +2,9 @@ import chainer
 import chainer.testing
 import chainer.testing.attr
 import chainermn
-from chainermn.iterators.multi_node_iterator import _build_ctrl_msg
-from chainermn.iterators.multi_node_iterator import _parse_ctrl_msg
+from chainermn.iterators.multi_node_iterator import _build_header
+from chainermn.iterators.multi_node_iterator import _MessageBuffer
+from chainermn.iterators.multi_node_iterator import _parse_header
 import numpy as np
 import platform
 import pytest
@@ -181,6 +182,49 @@ class TestMultiNodeIterator(unittest.TestCase):
         else:
             self.assertEqual(iterator._order.tolist(), order.tolist())
 
+    def test_resume(self):
+        bs = 4
+        iterator = chainermn.iterators.create_multi_node_iterator(
+            self.iterator_class(
+                self.dataset, batch_size=bs, shuffle=False),
+            self.communicator)
+
+        for i in range(10):
+            iterator.next()
+        target = dict()
+        iterator.serialize(DummySerializer(target))
+        epoch_detail = iterator.epoch_detail
+        batches = [iterator.next() for i in range(3)]
+        iterator.serialize(DummyDeserializer(target))
+
+        # The batch prefetched before the serialization is not skipped.
+        self.assertEqual(iterator.epoch_detail, epoch_detail)
+        for batch in batches:
+            self.assertEqual(iterator.next(), batch)
+
+    def test_resume_before_new_order(self):
+        bs = 6
+        iterator = chainermn.iterators.create_multi_node_iterator(
+            self.iterator_class(
+                self.dataset, batch_size=bs, shuffle=True),
+            self.communicator)
+
+        # The next batch crosses the end of the epoch, so the order is
+        # reshuffled when the batch is prefetched.
+        for i in range(self.N // bs):
+            iterator.next()
+        target = dict()
+        iterator.serialize(DummySerializer(target))
+        self.assertEqual(target['epoch'], 0)
+        self.assertEqual(target['current_position'], self.N // bs * bs)
+        batch = iterator.next()
+        iterator.serialize(DummyDeserializer(target))
+
+        # The rest of the epoch is taken from the order saved, while the
+        # new order is sampled again.
+        n_rest = self.N % bs
+        self.assertEqual(iterator.next()[:n_rest], batch[:n_rest])
+
 
 class TestMultiNodeIteratorDataType(unittest.TestCase):
 
@@ -203,16 +247,58 @@ class TestMultiNodeIteratorDataType(unittest.TestCase):
         with self.assertRaises(TypeError):
             iterator.next()
 
+    def test_dtype_and_shape(self):
+        self.N = 10
+        self.dataset = [
+            (np.full((2, 3), i, dtype=np.float16), np.int64(i))
+            for i in range(self.N)]
 
-class TestCntrlMessageConversion(unittest.TestCase):
+        bs = 3
+        iterator = chainermn.iterators.create_multi_node_iterator(
+            chainer.iterators.SerialIterator(
+                self.dataset, batch_size=bs, shuffle=False),
+            self.communicator)
 
-    def test_conversion(self):
-        stop = True
-        is_valid_data_type = True
-        is_paired_dataset = True
-        is_new_epoch = True
-        current_position = 0
-        msg = _build_ctrl_msg(stop, is_valid_data_type, is_paired_dataset,
-                              is_new_epoch, current_position)
-        np.testing.assert_array_equal(msg,
-                                      _build_ctrl_msg(*_parse_ctrl_msg(msg)))
+        for i in range(4):
+            batch = iterator.next()
+            for j, (x, y) in enumerate(batch):
+                k = (i * bs + j) % self.N
+                self.assertEqual(x.dtype, np.float16)
+                self.assertEqual(x.shape, (2, 3))
+                self.assertEqual(y.dtype, np.int64)
+                self.assertEqual(y, k)
+
+
+class TestMessageConversion(unittest.TestCase):
+
+    def test_header(self):
+        arrays = [np.zeros((4, 2, 3), dtype=np.float16),
+                  np.zeros((4,), dtype=np.int32)]
+        header = _build_header(False, True, True, True, 3, 2, 1.5, arrays)
+        stop, is_valid_data_type, is_paired_dataset, is_new_epoch, \
+            current_position, epoch, previous_epoch_detail, specs = \
+            _parse_header(header)
+        self.assertFalse(stop)
+        self.assertTrue(is_valid_data_type)
+        self.assertTrue(is_paired_dataset)
+        self.assertTrue(is_new_epoch)
+        self.assertEqual(current_position, 3)
+        self.assertEqual(epoch, 2)
+        self.assertEqual(previous_epoch_detail, 1.5)
+        self.assertEqual(specs, [(np.dtype(np.float16), (4, 2, 3)),
+                                 (np.dtype(np.int32), (4,))])
+
+    def test_header_without_previous_epoch_detail(self):
+        header = _build_header(True, False, False, False, 0, 0, None, [])
+        self.assertIsNone(_parse_header(header)[6])
+
+    def test_pack_and_unpack(self):
+        arrays = [np.arange(15, dtype=np.int8).reshape(5, 3),
+                  np.arange(5, dtype=np.float64)]
+        header = _build_header(False, True, True, False, 0, 0, None, arrays)
+        buf = _MessageBuffer()
+        buf.pack(header, arrays)
+        specs = _parse_header(buf.header)[7]
+        for expected, actual in zip(arrays, buf.unpack(specs)):
+            self.assertEqual(expected.dtype, actual.dtype)
+            np.testing.assert_array_equal(expected, actual)
@@ -298,3 +298,55 @@ def test_unsupport_communication_backend_gpu(communicator_class, backend):
     with pytest.raises(ValueError):
         MultiNodeBatchNormalization(n_units, comm,
                                     communication_backend=backend)
+
+
+def test_multi_node_bn_unequal_batch_sizes():
+    comm = create_communicator(NaiveCommunicator, mpi_comm, use_gpu=False)
+    sizes = [i + 1 for i in range(comm.size)]
+    begin = sum(sizes[:comm.rank])
+    end = begin + sizes[comm.rank]
+    numpy.random.seed(71)
+    x = numpy.random.random((sum(sizes), 3)).astype(numpy.float32)
+
+    bn = chainer.links.BatchNormalization(3)
+    mnbn = MultiNodeBatchNormalization(3, comm)
+    y = bn(x)
+    y_local = mnbn(x[begin:end])
+
+    chainer.testing.assert_allclose(y_local.array, y.array[begin:end],
+                                    atol=1e-5)
+    chainer.testing.assert_allclose(mnbn.avg_mean, bn.avg_mean)
+
+
+def test_multi_node_bn_sync_interval():
+    comm = create_communicator(NaiveCommunicator, mpi_comm, use_gpu=False)
+    local_batchsize = 8
+    begin = local_batchsize * comm.rank
+    end = begin + local_batchsize
+    numpy.random.seed(71)
+    x = numpy.random.random(
+        (local_batchsize * comm.size, 3)).astype(numpy.float32)
+    x_local = x[begin:end]
+
+    bn = chainer.links.BatchNormalization(3)
+    mnbn = MultiNodeBatchNormalization(3, comm, sync_interval=2)
+
+    # The stats are shared in the first iteration.
+    y = bn(x)
+    y_local = mnbn(x_local)
+    chainer.testing.assert_allclose(y_local.array, y.array[begin:end],
+                                    atol=1e-5)
+    avg_mean = mnbn.avg_mean.copy()
+
+    # The stats of the local batch are used in the second iteration.
+    y_local = mnbn(x_local)
+    expected = chainer.functions.batch_normalization(
+        x_local, mnbn.gamma, mnbn.beta, eps=mnbn.eps)
+    chainer.testing.assert_allclose(y_local.array, expected.array)
+    chainer.testing.assert_allclose(mnbn.avg_mean, avg_mean)
+
+
+def test_invalid_sync_interval():
+    comm = create_communicator(NaiveCommunicator, mpi_comm, use_gpu=False)
+    with pytest.raises(ValueError):
+        MultiNodeBatchNormalization(3, comm, sync_interval=0)
@@ -0,0 +1,101 @@
+import chainer
+import chainer.functions as F
+import chainer.links as L
+import chainer.testing
+import chainermn
+from chainermn.links import create_schedule
+import numpy as np
+import pytest
+import unittest
+
+
+class Stage(chainer.Chain):
+
+    def __init__(self, initialW, is_last):
+        super(Stage, self).__init__()
+        with self.init_scope():
+            self.l = L.Linear(4, 4, initialW=initialW)
+        self.is_last = is_last
+
+    def __call__(self, x):
+        y = self.l(x)
+        if self.is_last:
+            return y
+        return F.tanh(y)
+
+
+@chainer.testing.parameterize(*chainer.testing.product({
+    'schedule': ['gpipe', '1f1b'],
+    'n_micro_batches': [1, 3, 4],
+}))
+class TestMultiNodePipelineChain(unittest.TestCase):
+
+    def setUp(self):
+        self.comm = chainermn.create_communicator('naive')
+        size = self.comm.size
+        rng = np.random.RandomState(0)
+        self.Ws = [rng.randn(4, 4).astype(np.float32) for _ in range(size)]
+        self.x = rng.randn(10, 4).astype(np.float32)
+        self.t = rng.randint(0, 4, size=10).astype(np.int32)
+
+    def test_forward_backward(self):
+        size = self.comm.size
+        rank = self.comm.rank
+        if size == 1:
+            # The inputs of the first stage and the arguments of the loss
+            # function of the last stage are given to the same process.
+            pytest.skip('This test is for multinode')
+        is_last = rank == size - 1
+
+        stages = [Stage(W, i == size - 1) for i, W in enumerate(self.Ws)]
+        h = self.x
+        for stage in stages:
+            stage.cleargrads()
+            h = stage(h)
+        expected_loss = F.softmax_cross_entropy(h, self.t)
+        expected_loss.backward()
+
+        model = chainermn.links.MultiNodePipelineChain(
+            self.comm, Stage(self.Ws[rank], is_last), list(range(size)),
+            self.n_micro_batches, schedule=self.schedule,
+            lossfun=F.softmax_cross_entropy if is_last else None)
+        model.cleargrads()
+        args = []
+        if rank == 0:
+            args.append(self.x)
+        if is_last:
+            args.append(self.t)
+        loss = model.forward_backward(*args)
+
+        self.assertFalse(np.isnan(model.stage.l.W.grad).any())
+        chainer.testing.assert_allclose(
+            model.stage.l.W.grad, stages[rank].l.W.grad, atol=1e-5)
+        if is_last:
+            chainer.testing.assert_allclose(loss.array, expected_loss.array)
+        else:
+            self.assertIsNone(loss)
+        self.assertGreaterEqual(model.bubble_ratio, 0)
+
+
+class TestCreateSchedule(unittest.TestCase):
+
+    def test_gpipe(self):
+        self.assertEqual(
+            create_schedule('gpipe', 2, 1, 2),
+            [('forward', 0), ('forward', 1),
+             ('backward', 0), ('backward', 1)])
+
+    def test_1f1b(self):
+        self.assertEqual(
+            create_schedule('1f1b', 3, 0, 4),
+            [('forward', 0), ('forward', 1), ('forward', 2),
+             ('backward', 0), ('forward', 3), ('backward', 1),
+             ('backward', 2), ('backward', 3)])
+        self.assertEqual(
+            create_schedule('1f1b', 3, 2, 2),
+            [('forward', 0), ('backward', 0),
+             ('forward', 1), ('backward', 1)])
+
+    def test_invalid_schedule(self):
+        with pytest.raises(ValueError):
+            create_schedule('unknown', 2, 0, 2)
@@ -0,0 +1,94 @@
+import chainer
+import chainer.functions as F
+import chainer.links as L
+import chainer.testing
+import chainermn
+import numpy as np
+import unittest
+
+
+def assert_grad_allclose(actual, expected, **kwargs):
+    # Gradients of parameters are initialized with NaN, which
+    # assert_allclose regards as equal.
+    assert not np.isnan(expected).any()
+    assert not np.isnan(actual).any()
+    chainer.testing.assert_allclose(actual, expected, **kwargs)
+
+
+class TestShardedLinks(unittest.TestCase):
+
+    def setUp(self):
+        self.comm = chainermn.create_communicator('naive')
+        rng = np.random.RandomState(0)
+        self.x = rng.randn(3, 5).astype(np.float32)
+        self.W1 = rng.randn(7, 5).astype(np.float32)
+        self.b1 = rng.randn(7).astype(np.float32)
+        self.W2 = rng.randn(4, 7).astype(np.float32)
+        self.b2 = rng.randn(4).astype(np.float32)
+        self.E = rng.randn(10, 5).astype(np.float32)
+        self.ids = np.array([[0, 3, 9], [5, -1, 8]], dtype=np.int32)
+
+    def check_linear(self, gather_output):
+        l1 = L.Linear(5, 7, initialW=self.W1, initial_bias=self.b1)
+        l2 = L.Linear(7, 4, initialW=self.W2, initial_bias=self.b2)
+        l1.cleargrads()
+        l2.cleargrads()
+        x = chainer.Variable(self.x)
+        expected = l2(F.tanh(l1(x)))
+        F.sum(expected * expected).backward()
+
+        sharded_l1 = chainermn.links.MultiNodeColumnShardedLinear(
+            self.comm, 5, 7, initialW=self.W1, initial_bias=self.b1,
+            gather_output=gather_output)
+        sharded_l2 = chainermn.links.MultiNodeRowShardedLinear(
+            self.comm, 7, 4, initialW=self.W2, initial_bias=self.b2,
+            input_is_sharded=not gather_output)
+        sharded_l1.cleargrads()
+        sharded_l2.cleargrads()
+        sharded_x = chainer.Variable(self.x)
+        y = sharded_l2(F.tanh(sharded_l1(sharded_x)))
+        F.sum(y * y).backward()
+
+        chainer.testing.assert_allclose(y.array, expected.array, atol=1e-5)
+        assert_grad_allclose(sharded_x.grad, x.grad, atol=1e-4)
+        begin, end = sharded_l1.out_begin, sharded_l1.out_end
+        assert_grad_allclose(
+            sharded_l1.W.grad, l1.W.grad[begin:end], atol=1e-4)
+        assert_grad_allclose(
+            sharded_l1.b.grad, l1.b.grad[begin:end], atol=1e-4)
+        begin, end = sharded_l2.in_begin, sharded_l2.in_end
+        assert_grad_allclose(
+            sharded_l2.W.grad, l2.W.grad[:, begin:end], atol=1e-4)
+        assert_grad_allclose(sharded_l2.b.grad, l2.b.grad, atol=1e-4)
+
+    def test_linear(self):
+        self.check_linear(True)
+
+    def test_linear_sharded_hidden(self):
+        self.check_linear(False)
+
+    def test_embed_id(self):
+        embed = L.EmbedID(10, 5, initialW=self.E, ignore_label=-1)
+        embed.cleargrads()
+        expected = embed(self.ids)
+        F.sum(expected * expected).backward()
+
+        sharded = chainermn.links.MultiNodeShardedEmbedID(
+            self.comm, 10, 5, initialW=self.E, ignore_label=-1)
+        sharded.cleargrads()
+        y = sharded(self.ids)
+        F.sum(y * y).backward()
+
+        chainer.testing.assert_allclose(y.array, expected.array)
+        assert_grad_allclose(
+            sharded.W.grad, embed.W.grad[sharded.in_begin:sharded.in_end])
+
+    def test_shards(self):
+        sharded = chainermn.links.MultiNodeShardedEmbedID(
+            self.comm, 10, 5)
+        sizes = self.comm.allgather(
+            np.array([sharded.in_begin, sharded.in_end]))
+        self.assertEqual(sizes[0][0], 0)
+        self.assertEqual(sizes[-1][1], 10)
+        for prev, cur in zip(sizes[:-1], sizes[1:]):
+            self.assertEqual(prev[1], cur[0])
@@ -0,0 +1,86 @@
+import chainer
+import chainer.testing
+import chainermn
+import mock
+import numpy as np
+import pytest
+import unittest
+
+
+class ExampleModel(chainer.Chain):
+    def __init__(self):
+        super(ExampleModel, self).__init__()
+        with self.init_scope():
+            self.a = chainer.links.Linear(2, 3)
+            self.b = chainer.links.Linear(3, 4)
+
+
+class TestLocalSGDOptimizer(unittest.TestCase):
+
+    def setUp(self):
+        self.comm = chainermn.create_communicator('naive')
+        self.target = ExampleModel()
+        self.target.a.W.data[:] = 0
+        self.target.b.W.data[:] = 0
+        self.actual_optimizer = chainer.GradientMethod()
+        self.actual_optimizer.create_update_rule = mock.MagicMock
+
+    def create_optimizer(self, **kwargs):
+        optimizer = chainermn.create_multi_node_optimizer(
+            self.actual_optimizer, self.comm, **kwargs)
+        opt = optimizer.setup(self.target)
+        assert opt is optimizer
+        optimizer.update()
+        self.assertEqual(self.actual_optimizer.t, 0)
+        return optimizer
+
+    def set_data(self, value):
+        self.target.a.W.data[:] = value
+        self.target.b.W.data[:] = value
+
+    def check_data(self, value):
+        chainer.testing.assert_allclose(
+            self.target.a.W.data, value * np.ones((3, 2)))
+        chainer.testing.assert_allclose(
+            self.target.b.W.data, value * np.ones((4, 3)))
+
+    def test_update(self):
+        optimizer = self.create_optimizer(local_steps=2)
+        self.set_data(self.comm.rank)
+        optimizer.update()
+        self.assertEqual(self.actual_optimizer.t, 1)
+        self.check_data(self.comm.rank)
+        optimizer.update()
+        self.assertEqual(self.actual_optimizer.t, 2)
+        self.check_data((self.comm.size - 1.0) / 2)
+
+    def test_update_double_buffering(self):
+        optimizer = self.create_optimizer(
+            local_steps=2, double_buffering=True)
+        self.set_data(self.comm.rank)
+        optimizer.update()
+        optimizer.update()
+        # The average is applied at the next synchronization.
+        self.check_data(self.comm.rank)
+        self.target.a.W.data += 1
+        self.target.b.W.data += 1
+        optimizer.update()
+        optimizer.update()
+        self.assertEqual(self.actual_optimizer.t, 4)
+        self.check_data((self.comm.size - 1.0) / 2 + 1)
+
+    def test_update_outer_momentum(self):
+        optimizer = self.create_optimizer(local_steps=1, outer_momentum=0.5)
+        base = (self.comm.size - 1.0) / 2
+        self.set_data(self.comm.rank)
+        optimizer.update()
+        self.check_data(base)
+        self.set_data(base + 1)
+        optimizer.update()
+        # The first difference of the averages is accumulated with momentum.
+        self.check_data(1.5 * base + 1)
+
+    def test_invalid_local_steps(self):
+        with pytest.raises(ValueError):
+            chainermn.create_multi_node_optimizer(
+                self.actual_optimizer, self.comm, local_steps=0)
@@ -104,6 +104,56 @@ class TestMultiNodeOptimizer(unittest.TestCase):
         chainer.testing.assert_allclose(self.optimizer.target.c.W.grad,
                                         (base + 2) * np.ones((5, 4)))
 
+    def test_update_with_cpu_bucketed(self):
+        self.setup_cpu()
+        # The gradients are split into two buckets.
+        self.optimizer = chainermn.create_multi_node_optimizer(
+            self.actual_optimizer, self.comm, bucket_size=128)
+        opt = self.optimizer.setup(self.target)
+        assert opt is self.optimizer
+        self.optimizer.update()
+        self.assertEqual(self.actual_optimizer.t, 0)
+        self.optimizer.target.a.W.grad[:] = self.comm.rank
+        self.optimizer.target.b.W.grad[:] = self.comm.rank + 1
+        self.optimizer.target.c.W.grad[:] = self.comm.rank + 2
+
+        self.optimizer.update()
+        self.assertEqual(self.actual_optimizer.t, 1)
+        self.optimizer.target.a.W.update_rule.update.assert_called_once_with(
+            self.optimizer.target.a.W)
+        self.optimizer.target.b.W.update_rule.update.assert_called_once_with(
+            self.optimizer.target.b.W)
+        self.optimizer.target.c.W.update_rule.update.assert_called_once_with(
+            self.optimizer.target.c.W)
+
+        base = (self.comm.size - 1.0) / 2
+        chainer.testing.assert_allclose(self.optimizer.target.a.W.grad,
+                                        (base + 0) * np.ones((3, 2)))
+        chainer.testing.assert_allclose(self.optimizer.target.b.W.grad,
+                                        (base + 1) * np.ones((4, 3)))
+        chainer.testing.assert_allclose(self.optimizer.target.c.W.grad,
+                                        (base + 2) * np.ones((5, 4)))
+
+    def test_invalid_bucket_size(self):
+        self.setup_cpu()
+        with self.assertRaises(ValueError):
+            chainermn.create_multi_node_optimizer(
+                self.actual_optimizer, self.comm, bucket_size=0)
+
+    def test_bucket_size_with_incompatible_communicator(self):
+        self.setup_cpu()
+        comms = [
+            chainermn.create_communicator(
+                'naive', gradient_compression='fp16'),
+            chainermn.create_communicator(
+                'naive', allreduce_algorithm='ring'),
+            chainermn.create_communicator('shared_memory'),
+        ]
+        for comm in comms:
+            with self.assertRaises(ValueError):
+                chainermn.create_multi_node_optimizer(
+                    self.actual_optimizer, comm, bucket_size=128)
+
 
 class DynamicExampleModel(chainer.Chain):
 
@@ -0,0 +1,140 @@
+import chainer
+import chainer.testing
+import chainer.testing.attr
+import chainermn
+import numpy as np
+import pytest
+import unittest
+
+
+class ExampleModel(chainer.Chain):
+    def __init__(self):
+        super(ExampleModel, self).__init__()
+        with self.init_scope():
+            self.a = chainer.links.Linear(2, 3)
+            self.b = chainer.links.Linear(3, 4)
+            self.c = chainer.links.Linear(4, 5)
+
+
+class TestZeroRedundancyOptimizer(unittest.TestCase):
+
+    def setup_cpu(self):
+        self.comm = chainermn.create_communicator('naive')
+        self.target = ExampleModel()
+        self.setup_target()
+
+    def setup_gpu(self):
+        self.comm = chainermn.create_communicator('flat')
+        device = self.comm.intra_rank
+        chainer.cuda.get_device_from_id(device).use()
+        self.target = ExampleModel()
+        self.target.to_gpu()
+        self.setup_target()
+
+    def setup_target(self):
+        for i, param in enumerate(self.target.params()):
+            param.array[...] = self.comm.rank + i
+            param.grad = param.array * 0
+        self.actual_optimizer = chainer.optimizers.MomentumSGD(
+            lr=1, momentum=0)
+
+    def check_update(self):
+        self.optimizer = chainermn.create_multi_node_optimizer(
+            self.actual_optimizer, self.comm, zero_redundancy=True)
+        opt = self.optimizer.setup(self.target)
+        assert opt is self.optimizer
+        self.optimizer.update()
+        self.assertEqual(self.actual_optimizer.t, 0)
+
+        # The parameters are broadcast from rank 0 at the first update.
+        for i, param in enumerate(self.target.params()):
+            chainer.testing.assert_allclose(
+                param.array, i * np.ones(param.shape))
+            param.grad[...] = self.comm.rank + i
+
+        self.optimizer.update()
+        self.assertEqual(self.actual_optimizer.t, 1)
+
+        base = (self.comm.size - 1.0) / 2
+        for i, param in enumerate(self.target.params()):
+            chainer.testing.assert_allclose(
+                param.array, -base * np.ones(param.shape))
+
+        owned = set(id(param)
+                    for param in self.optimizer.shards[self.comm.rank])
+        n_params = 0
+        for shard in self.optimizer.shards:
+            n_params += len(shard)
+        self.assertEqual(n_params, len(list(self.target.params())))
+        for param in self.target.params():
+            has_state = param.update_rule.state is not None
+            self.assertEqual(has_state, id(param) in owned)
+
+    def test_update_with_cpu(self):
+        self.setup_cpu()
+        self.check_update()
+
+    @chainer.testing.attr.gpu
+    def test_update_with_gpu(self):
+        self.setup_gpu()
+        self.check_update()
+
+    def test_double_buffering(self):
+        self.setup_cpu()
+        with pytest.raises(ValueError):
+            chainermn.create_multi_node_optimizer(
+                self.actual_optimizer, self.comm, double_buffering=True,
+                zero_redundancy=True)
+
+    def test_per_param_hook(self):
+        self.setup_cpu()
+        self.optimizer = chainermn.create_multi_node_optimizer(
+            self.actual_optimizer, self.comm, zero_redundancy=True)
+        self.optimizer.setup(self.target)
+        self.optimizer.add_hook(chainer.optimizer_hooks.WeightDecay(0.1))
+        self.optimizer.update()
+        self.optimizer.update()
+        self.assertEqual(self.actual_optimizer.t, 1)
+
+    def test_global_hook(self):
+        self.setup_cpu()
+        self.optimizer = chainermn.create_multi_node_optimizer(
+            self.actual_optimizer, self.comm, zero_redundancy=True)
+        self.optimizer.setup(self.target)
+        self.optimizer.add_hook(chainer.optimizer_hooks.GradientClipping(1))
+        self.optimizer.update()
+        with pytest.raises(ValueError):
+            self.optimizer.update()
+        self.assertEqual(self.actual_optimizer.t, 0)
+
+    def test_serialize_after_repartition(self):
+        self.setup_cpu()
+        self.optimizer = chainermn.create_multi_node_optimizer(
+            self.actual_optimizer, self.comm, zero_redundancy=True)
+        self.optimizer.setup(self.target)
+        self.optimizer.update()
+        self.optimizer.update()
+
+        # Every parameter has a state as if it were owned by this process
+        # before the partition changes.
+        for param in self.target.params():
+            param.update_rule._state = {'v': np.zeros_like(param.array)}
+        with self.target.init_scope():
+            self.target.d = chainer.links.Linear(5, 6)
+        for param in self.target.d.params():
+            param.update_rule = self.actual_optimizer.create_update_rule()
+        serializer = chainer.serializers.DictionarySerializer()
+        self.optimizer.serialize(serializer)
+
+        owned = set(id(param)
+                    for param in self.optimizer.shards[self.comm.rank])
+        for param in self.target.params():
+            if param.update_rule.enabled:
+                self.assertIn(id(param), owned)
+            else:
+                self.assertIsNone(param.update_rule.state)
+
+        # The partition is kept while the parameters are not changed.
+        shards = self.optimizer.shards
+        self.optimizer.serialize(chainer.serializers.DictionarySerializer())
+        self.assertIs(self.optimizer.shards, shards)